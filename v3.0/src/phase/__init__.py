@@ -0,0 +1,4 @@
+from phase.core import Results, solve, sweep
+from phase.sequence import results_sequence, sequence_components
+
+__all__ = ['Results', 'results_sequence', 'sequence_components', 'solve', 'sweep']
@@ -0,0 +1,8 @@
+import multiprocessing
+import sys
+
+from phase.cli import main
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support() # Necessário para os processos do executável (PyInstaller)
+    sys.exit(main())
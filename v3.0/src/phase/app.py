@@ -0,0 +1,1670 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+
+from phase.balance import balance
+from phase.core import (CONN_PHASES, Source, check_load, check_phases, check_source, complex_to_polar, polar_to_complex,
+                        sweep)
+from phase.harmonics import LINEAR, SPECTRA, solve_harmonics
+from phase.history import Change, History
+from phase.importer import read_loads
+from phase.incremental import LoadAccumulator
+from phase.profiling import profiler
+from phase.project import Project, export_json, open_project, save_project
+from phase.sequence import UNBALANCE_LIMIT, results_sequence, sequence_components
+from phase.sizing import METHODS, SECTIONS, Installation, check_installation, check_length, size_project
+from phase.table import LoadTable
+from phase.worker import SolveWorker
+from phase.plot import PhasorPlot
+
+# pyinstaller --onefile --noconsole --icon=icon.ico --name "PhasorCalc App" --add-data "icon.ico;." --paths . phase/__main__.py
+
+BUSY_DELAY = 150 # ms até mostrar o indicador de ocupado
+POLL_INTERVAL = 15 # ms entre verificações do resultado do worker
+
+def resource_path(relative_path: str) -> str:
+    try:
+        #Quando empacotado com PyInstaller
+        base_path = Path(sys._MEIPASS)  # pasta temporária criada pelo PyInstaller
+    except Exception:
+        #Quando executado como um script normal (icon.ico fica em src/, fora do pacote)
+        base_path = Path(__file__).resolve().parent.parent
+    return str((base_path / relative_path).resolve())
+
+def import_plotting():
+    # Executada em segundo plano: deixa o Matplotlib (e o NumPy) em sys.modules
+    import matplotlib.figure
+    import matplotlib.backends.backend_tkagg
+
+class ToolTip:
+    def __init__(self, widget, text, delay=500):
+        self.widget = widget
+        self.text = text
+        self.delay = delay
+        self.tipwindow = None
+        self.id = None
+        self.x = self.y = 0
+
+        widget.bind("<Enter>", self.schedule)
+        widget.bind("<Leave>", self.hide)
+        widget.bind("<ButtonPress>", self.hide)
+
+    def schedule(self, event=None):
+        self.unschedule()
+        self.id = self.widget.after(self.delay, self.show)
+
+    def unschedule(self):
+        if self.id:
+            self.widget.after_cancel(self.id)
+            self.id = None
+
+    def show(self, event=None):
+        if self.tipwindow or not self.text:
+            return
+        
+        x = self.widget.winfo_rootx() + 20
+        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 10
+
+        self.tipwindow = tw = tk.Toplevel(self.widget)
+        tw.wm_overrideredirect(True)
+        tw.wm_geometry(f"+{x}+{y}")
+
+        label = tk.Label(tw, text=self.text, justify=tk.LEFT,
+                         background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                         font=("Segoe UI", "9")
+        )
+        label.pack(ipadx=6, ipady=4)
+
+    def hide(self, event=None):
+        self.unschedule()
+        if self.tipwindow:
+            self.tipwindow.destroy()
+            self.tipwindow = None
+
+class Debouncer:
+    # Agrupa chamadas em sequência (ex.: teclas digitadas) em uma única
+    # execução do callback após `delay` ms sem novas chamadas
+    def __init__(self, widget, callback, delay=250):
+        self.widget = widget
+        self.callback = callback
+        self.delay = delay
+        self.id = None
+
+    def __call__(self, event=None):
+        self.cancel()
+        self.id = self.widget.after(self.delay, self.run)
+
+    def cancel(self):
+        if self.id:
+            self.widget.after_cancel(self.id)
+            self.id = None
+
+    def run(self):
+        self.id = None
+        self.callback()
+
+class VirtualTreeview:
+    # Treeview que mantém apenas as linhas visíveis. `rows` é a sequência
+    # completa e `row_values(row)` devolve (iid, valores) de cada linha; a
+    # cada refresh só são inseridas, removidas ou alteradas as linhas da
+    # janela visível que mudaram.
+    def __init__(self, master, columns, row_values, rowheight=26):
+        self.tree = ttk.Treeview(master, columns=columns, show='headings', selectmode='browse')
+        self.scrollbar = ttk.Scrollbar(master, orient='vertical', command=self.yview)
+        self.row_values = row_values
+        self.rowheight = rowheight
+        self.rows = []
+        self.offset = 0
+        self.visible = 1
+        self.selected = None
+        self._rendered = {} # iid -> valores exibidos
+
+        self.tree.bind('<Configure>', self.on_configure)
+        self.tree.bind('<<TreeviewSelect>>', self.on_select)
+        self.tree.bind('<MouseWheel>', lambda e: self.scroll(-3 if e.delta > 0 else 3))
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll(3))
+
+    def set_rows(self, rows):
+        self.rows = rows
+        self.refresh()
+
+    def refresh(self):
+        total = len(self.rows)
+        self.offset = max(0, min(self.offset, total - self.visible))
+        wanted = [self.row_values(row) for row in self.rows[self.offset:self.offset + self.visible]]
+
+        wanted_ids = {iid for iid, _ in wanted}
+        stale = [iid for iid in self._rendered if iid not in wanted_ids]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self._rendered[iid]
+
+        for index, (iid, values) in enumerate(wanted):
+            shown = self._rendered.get(iid)
+            if shown is None:
+                self.tree.insert('', index, iid=iid, values=values)
+                if iid == self.selected:
+                    self.tree.selection_set(iid)
+            else:
+                if shown != values:
+                    self.tree.item(iid, values=values)
+                if self.tree.index(iid) != index:
+                    self.tree.move(iid, '', index)
+            self._rendered[iid] = values
+
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def yview(self, *args):
+        if args[0] == 'moveto':
+            self.offset = int(float(args[1]) * len(self.rows))
+            self.refresh()
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            self.scroll(amount * self.visible if args[2] == 'pages' else amount)
+
+    def scroll(self, amount):
+        self.offset += amount
+        self.refresh()
+
+    def on_configure(self, event):
+        # A primeira "linha" é o cabeçalho
+        visible = max(1, event.height // self.rowheight - 1)
+        if visible != self.visible:
+            self.visible = visible
+            self.refresh()
+
+    def on_select(self, event):
+        selection = self.tree.selection()
+        if selection:
+            self.selected = selection[0]
+
+class SweepWindow:
+    # Janela com |I| x V para uma faixa de tensões de linha
+    def __init__(self, app, line_voltage):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.app = app
+        self.window = tk.Toplevel(app.root)
+        self.window.title('Varredura de Tensão')
+        self.window.columnconfigure(0, weight=1)
+        self.window.rowconfigure(1, weight=1)
+
+        form = ttk.Frame(self.window, padding=10)
+        form.grid(row=0, column=0, sticky='ew')
+        self.entries = {}
+        for column, (key, label, value) in enumerate([
+            ('v_min', 'V mín (V):', f'{line_voltage * 0.9:g}'),
+            ('v_max', 'V máx (V):', f'{line_voltage * 1.1:g}'),
+            ('points', 'Pontos:', '1000'),
+        ]):
+            ttk.Label(form, text=label).grid(row=0, column=2*column, sticky='w', padx=5)
+            entry = ttk.Entry(form, width=8)
+            entry.insert(0, value)
+            entry.grid(row=0, column=2*column + 1, padx=5)
+            self.entries[key] = entry
+        self.quantity_var = tk.StringVar(value='Fases')
+        quantity_combo = ttk.Combobox(form, textvariable=self.quantity_var, values=('Fases', 'Sequências'), state='readonly', width=11)
+        quantity_combo.grid(row=0, column=6, padx=5)
+        quantity_combo.bind('<<ComboboxSelected>>', lambda event: self.plot())
+        ToolTip(quantity_combo, 'Fases: |Ia|, |Ib|, |Ic| e |In|.\nSequências: |I0|, |I1| e |I2| (componentes simétricas).')
+        ttk.Button(form, text='Plotar', style='Primary.TButton', command=self.plot).grid(row=0, column=7, padx=5)
+
+        self.fig = Figure(figsize=(6, 4), tight_layout=True)
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.window)
+        self.canvas.get_tk_widget().grid(row=1, column=0, sticky='nsew', padx=5, pady=5)
+        self.plot()
+
+    def plot(self):
+        import numpy as np
+        try:
+            v_min = float(self.entries['v_min'].get())
+            v_max = float(self.entries['v_max'].get())
+            points = int(self.entries['points'].get())
+            if v_min <= 0 or v_max <= v_min or points < 2:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror('Erro', 'Informe 0 < V mín < V máx e pelo menos 2 pontos.', parent=self.window)
+            return
+
+        voltages = np.linspace(v_min, v_max, points)
+        currents = sweep(self.app.loads, voltages)
+        if self.quantity_var.get() == 'Sequências':
+            labels = ('I0', 'I1', 'I2')
+            currents = np.abs(sequence_components(*currents[:, :3].T).values)
+        else:
+            labels = ('IA', 'IB', 'IC', 'IN')
+            currents = np.abs(currents)
+        self.ax.clear()
+        for column, label in enumerate(labels):
+            self.ax.plot(voltages, currents[:, column], label=label)
+        self.ax.set_xlabel('Tensão de linha (V)')
+        self.ax.set_ylabel('Corrente (A)')
+        self.ax.set_title('Correntes Totais x Tensão de Linha')
+        self.ax.grid(True, linestyle='--', linewidth=0.5)
+        self.ax.legend()
+        self.canvas.draw()
+
+class MonteCarloWindow:
+    # Simulação de Monte Carlo com resultados parciais exibidos a cada shard
+    def __init__(self, app, line_voltage):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.app = app
+        self.line_voltage = line_voltage
+        self.chunks = queue.Queue()
+        self.magnitudes = []
+        self.running = False
+
+        self.window = tk.Toplevel(app.root)
+        self.window.title('Monte Carlo - Incerteza das Cargas')
+        self.window.columnconfigure(0, weight=1)
+        self.window.rowconfigure(2, weight=1)
+
+        form = ttk.Frame(self.window, padding=10)
+        form.grid(row=0, column=0, sticky='ew')
+        self.entries = {}
+        for column, (key, label, value) in enumerate([
+            ('samples', 'Amostras:', '100000'),
+            ('power_tol', 'Potência ± (%):', '15'),
+            ('pf_min', 'FP mín:', ''),
+            ('pf_max', 'FP máx:', ''),
+            ('seed', 'Semente:', ''),
+        ]):
+            ttk.Label(form, text=label).grid(row=0, column=2*column, sticky='w', padx=5)
+            entry = ttk.Entry(form, width=9)
+            entry.insert(0, value)
+            entry.grid(row=0, column=2*column + 1, padx=5)
+            self.entries[key] = entry
+        ToolTip(self.entries['pf_min'], 'Deixe FP mín e FP máx em branco para manter o FP de cada carga.')
+        ToolTip(self.entries['seed'], 'Em branco, uma semente aleatória é gerada e exibida para repetir a simulação.')
+        self.run_btn = ttk.Button(form, text='Executar', style='Primary.TButton', command=self.run)
+        self.run_btn.grid(row=0, column=10, padx=5)
+
+        self.result_text = tk.Text(self.window, height=8, width=70)
+        self.result_text.grid(row=1, column=0, sticky='ew', padx=5, pady=5)
+
+        self.fig = Figure(figsize=(6, 3.5), tight_layout=True)
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.window)
+        self.canvas.get_tk_widget().grid(row=2, column=0, sticky='nsew', padx=5, pady=5)
+
+    def run(self):
+        import numpy as np
+        if self.running:
+            return
+        try:
+            samples = int(self.entries['samples'].get())
+            power_tol = float(self.entries['power_tol'].get()) / 100
+            pf_min, pf_max = self.entries['pf_min'].get().strip(), self.entries['pf_max'].get().strip()
+            pf_range = (float(pf_min), float(pf_max)) if pf_min or pf_max else None
+            seed_str = self.entries['seed'].get().strip()
+            seed = int(seed_str) if seed_str else None
+            if samples < 1 or not 0 <= power_tol <= 1 or (pf_range and not 0 <= pf_range[0] <= pf_range[1] <= 1):
+                raise ValueError
+        except ValueError:
+            messagebox.showerror('Erro', 'Verifique os parâmetros: amostras > 0, 0 ≤ tolerância ≤ 100% e 0 ≤ FP mín ≤ FP máx ≤ 1.', parent=self.window)
+            return
+
+        seed_sequence = np.random.SeedSequence(seed)
+        self.entries['seed'].delete(0, tk.END)
+        self.entries['seed'].insert(0, str(seed_sequence.entropy))
+
+        self.samples = samples
+        self.magnitudes = []
+        self.running = True
+        self.run_btn.state(['disabled'])
+        worker = threading.Thread(
+            target=self.simulate,
+            args=(self.app.loads.copy(), samples, power_tol, pf_range, seed_sequence),
+            daemon=True
+        )
+        worker.start()
+        self.poll()
+
+    def simulate(self, loads, samples, power_tol, pf_range, seed_sequence):
+        # Executada fora da thread do Tk (sobre uma cópia da tabela); os
+        # blocos chegam pela fila
+        from phase.montecarlo import iter_simulate
+        try:
+            for chunk in iter_simulate(loads, self.line_voltage, samples, power_tol, pf_range, seed_sequence):
+                self.chunks.put(chunk)
+            self.chunks.put(None)
+        except Exception as e:
+            self.chunks.put(e)
+
+    def poll(self):
+        import numpy as np
+        done = False
+        while True:
+            try:
+                item = self.chunks.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                done = True
+            elif isinstance(item, Exception):
+                messagebox.showerror('Erro', f'Falha na simulação:\n{item}', parent=self.window)
+                done = True
+            else:
+                self.magnitudes.append(item)
+
+        if self.magnitudes:
+            self.show(np.concatenate(self.magnitudes), done)
+        if done:
+            self.running = False
+            self.run_btn.state(['!disabled'])
+        elif self.window.winfo_exists():
+            self.window.after(100, self.poll)
+
+    def show(self, magnitudes, done):
+        from phase.montecarlo import LABELS, MonteCarloResult
+        result = MonteCarloResult(magnitudes, None)
+        q = (5, 50, 95, 99)
+        lines = [f'Amostras: {len(result)} de {self.samples}' + ('' if done else ' (parcial)')]
+        lines.append('        ' + ''.join(f'P{p:<10}' for p in q))
+        for label, values in result.percentiles(q).items():
+            lines.append(f'|{label}|:  ' + ''.join(f'{v:<11.2f}' for v in values))
+        self.result_text.delete('1.0', tk.END)
+        self.result_text.insert(tk.END, '\n'.join(lines))
+
+        self.ax.clear()
+        self.ax.hist(result.column('In'), bins=50)
+        self.ax.set_xlabel('|In| (A)')
+        self.ax.set_ylabel('Amostras')
+        self.ax.set_title('Distribuição da Corrente de Neutro')
+        self.canvas.draw()
+
+class ProfileWindow:
+    # Perfis de carga no tempo: picos, pico coincidente e curva de duração
+    def __init__(self, app, line_voltage):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.app = app
+        self.line_voltage = line_voltage
+        self.results = queue.Queue()
+        self.running = False
+
+        self.window = tk.Toplevel(app.root)
+        self.window.title('Perfis de Carga')
+        self.window.columnconfigure(0, weight=1)
+        self.window.rowconfigure(2, weight=1)
+
+        form = ttk.Frame(self.window, padding=10)
+        form.grid(row=0, column=0, sticky='ew')
+        self.open_btn = ttk.Button(form, text='Abrir Perfis...', style='Primary.TButton', command=self.open)
+        self.open_btn.grid(row=0, column=0, padx=5)
+        ToolTip(self.open_btn, 'Arquivo CSV ou Parquet com uma coluna de potência (W) por carga (nome no cabeçalho)\ne uma primeira coluna de data/hora opcional.')
+        ttk.Label(form, text='Curva:').grid(row=0, column=1, sticky='w', padx=5)
+        self.label_var = tk.StringVar(value='S')
+        label_combo = ttk.Combobox(form, textvariable=self.label_var, values=('S', 'P', 'Ia', 'Ib', 'Ic', 'In', 'I0', 'I1', 'I2', 'I2/I1'), state='readonly', width=6)
+        label_combo.grid(row=0, column=2, padx=5)
+        label_combo.bind('<<ComboboxSelected>>', lambda event: self.plot())
+
+        self.result_text = tk.Text(self.window, height=8, width=70)
+        self.result_text.grid(row=1, column=0, sticky='ew', padx=5, pady=5)
+
+        self.fig = Figure(figsize=(6, 3.5), tight_layout=True)
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.window)
+        self.canvas.get_tk_widget().grid(row=2, column=0, sticky='nsew', padx=5, pady=5)
+        self.result = None
+
+    def open(self):
+        if self.running:
+            return
+        path = filedialog.askopenfilename(
+            parent=self.window,
+            title='Abrir Perfis de Carga',
+            filetypes=[('Perfis', '*.csv *.parquet'), ('CSV', '*.csv'), ('Parquet', '*.parquet'), ('Todos os arquivos', '*.*')]
+        )
+        if not path:
+            return
+        self.running = True
+        self.open_btn.state(['disabled'])
+        self.result_text.delete('1.0', tk.END)
+        self.result_text.insert(tk.END, 'Calculando...')
+        threading.Thread(target=self.solve, args=(path, self.app.loads.copy()), daemon=True).start()
+        self.poll()
+
+    def solve(self, path, loads):
+        # Executada fora da thread do Tk, sobre uma cópia da tabela
+        from phase.profiles import read_profiles, solve_profiles
+        try:
+            profiles = read_profiles(path)
+            self.results.put((profiles, solve_profiles(loads, profiles, self.line_voltage)))
+        except Exception as e:
+            self.results.put(e)
+
+    def poll(self):
+        try:
+            item = self.results.get_nowait()
+        except queue.Empty:
+            if self.window.winfo_exists():
+                self.window.after(100, self.poll)
+            return
+        self.running = False
+        self.open_btn.state(['!disabled'])
+        if isinstance(item, Exception):
+            self.result_text.delete('1.0', tk.END)
+            messagebox.showerror('Erro', f'Não foi possível ler os perfis:\n{item}', parent=self.window)
+            return
+        profiles, self.result = item
+        self.show(profiles)
+        self.plot()
+
+    def show(self, profiles):
+        from phase.profiles import load_names
+        result = self.result
+        matched = set(profiles.names) & set(load_names(self.app.loads))
+        peak = result.coincident_peak()
+        lines = [f'Intervalos: {len(result)} de {result.step_hours * 60:g} min; perfis usados: {len(matched)} de {len(profiles.names)}']
+        for label in ('Ia', 'Ib', 'Ic', 'In'):
+            value, index = result.peak(label)
+            lines.append(f'Pico |{label}|: {value:.2f} A (intervalo {index})')
+        lines.append(f"Pico coincidente: {peak['S']:.2f} VA (intervalo {peak['interval']}), fator de coincidência {peak['coincidence_factor']:.3f}")
+        value, index = result.peak('I2')
+        unbalance = result.sequence().negative_unbalance
+        lines.append(f'Pico |I2|: {value:.2f} A (intervalo {index}); I2/I1 máx {unbalance.max(initial=0.0):.2f} %, '
+                     f'acima de {UNBALANCE_LIMIT:g} % por {result.sequence().hours_above(UNBALANCE_LIMIT, result.step_hours):g} h')
+        lines.append(f'Energia: {result.energy() / 1000:.2f} kWh')
+        self.result_text.delete('1.0', tk.END)
+        self.result_text.insert(tk.END, '\n'.join(lines))
+
+    def plot(self):
+        import numpy as np
+        if self.result is None:
+            return
+        label = self.label_var.get()
+        curve = self.result.duration_curve(label)
+        hours = np.arange(1, len(curve) + 1) * self.result.step_hours
+        self.ax.clear()
+        self.ax.plot(hours, curve)
+        self.ax.set_xlabel('Horas')
+        self.ax.set_ylabel({'S': 'S (VA)', 'P': 'P (W)', 'I2/I1': 'I2/I1 (%)'}.get(label, f'|{label}| (A)'))
+        self.ax.set_title('Curva de Duração')
+        self.ax.grid(True, linestyle='--', linewidth=0.5)
+        self.canvas.draw()
+
+class SourceWindow:
+    # Tensões fase-neutro e ângulos de cada fase para uma fonte desequilibrada
+    def __init__(self, app, line_voltage):
+        self.app = app
+        self.window = tk.Toplevel(app.root)
+        self.window.title('Fonte de Tensão')
+        self.window.resizable(False, False)
+
+        form = ttk.Frame(self.window, padding=10)
+        form.grid(row=0, column=0, sticky='ew')
+        ttk.Label(form, text='|V| fase-neutro (V)').grid(row=0, column=1, padx=5)
+        ttk.Label(form, text='Ângulo (°)').grid(row=0, column=2, padx=5)
+        source = app.source or Source.balanced(line_voltage)
+        self.entries = []
+        for row, (phase, magnitude, angle) in enumerate(zip('ABC', source[:3], source[3:]), start=1):
+            ttk.Label(form, text=f'Fase {phase}:').grid(row=row, column=0, sticky='w', padx=5, pady=2)
+            entries = []
+            for column, value in enumerate((magnitude, angle), start=1):
+                entry = ttk.Entry(form, width=10)
+                entry.insert(0, f'{value:.6g}')
+                entry.grid(row=row, column=column, padx=5, pady=2)
+                entry.bind('<KeyRelease>', lambda event: self.preview())
+                entries.append(entry)
+            self.entries.append(entries)
+
+        self.preview_label = ttk.Label(form, text='')
+        self.preview_label.grid(row=4, column=0, columnspan=3, sticky='w', padx=5, pady=(8, 2))
+
+        buttons = ttk.Frame(self.window, padding=(10, 0, 10, 10))
+        buttons.grid(row=1, column=0, sticky='e')
+        balanced_btn = ttk.Button(buttons, text='Equilibrada', style='Secondary.TButton', command=self.reset)
+        balanced_btn.pack(side='left', padx=5)
+        ToolTip(balanced_btn, 'Volta à fonte equilibrada definida pela tensão de linha.')
+        ttk.Button(buttons, text='Aplicar', style='Primary.TButton', command=self.apply).pack(side='left', padx=5)
+        self.preview()
+
+    def read(self):
+        # Source com os valores do formulário, ou a mensagem de erro
+        try:
+            magnitudes, angles = zip(*((float(magnitude.get()), float(angle.get())) for magnitude, angle in self.entries))
+        except ValueError:
+            return 'Informe números para as tensões e os ângulos.'
+        source = Source(*magnitudes, *angles)
+        return check_source(source) or source
+
+    def preview(self):
+        source = self.read()
+        if isinstance(source, str):
+            self.preview_label.config(text=source)
+            return
+        vab, vbc, vca = source.line_voltages()
+        self.preview_label.config(text=f'Vab {vab:.1f} V · Vbc {vbc:.1f} V · Vca {vca:.1f} V · desequilíbrio {source.unbalance():.2f} %')
+
+    def apply(self):
+        source = self.read()
+        if isinstance(source, str):
+            messagebox.showerror('Erro', source, parent=self.window)
+            return
+        self.app.set_source(source)
+        self.window.destroy()
+
+    def reset(self):
+        self.app.set_source(None)
+        self.window.destroy()
+
+class SizingWindow:
+    # Seção, disjuntor e queda de tensão de cada circuito e do alimentador,
+    # refeitos a cada recálculo enquanto a janela estiver aberta
+    FIELDS = (
+        ('method', 'Método', 5),
+        ('ambient', 'Temp. (°C)', 6),
+        ('grouping', 'Agrupamento', 6),
+        ('length', 'Compr. (m)', 6),
+        ('max_drop', 'ΔV máx (%)', 6),
+        ('min_section', 'Seção mín. (mm²)', 6),
+    )
+
+    def __init__(self, app):
+        self.app = app
+        self.window = tk.Toplevel(app.root)
+        self.window.title('Dimensionamento de Circuitos')
+        self.window.geometry('760x520')
+        self.window.columnconfigure(0, weight=1)
+        self.window.rowconfigure(2, weight=1)
+
+        form = ttk.Frame(self.window, padding=10)
+        form.grid(row=0, column=0, sticky='ew')
+        for column, (_, label, _) in enumerate(self.FIELDS, start=1):
+            ttk.Label(form, text=label).grid(row=0, column=column, padx=5)
+        self.entries = {}
+        for row, (group, label) in enumerate((('circuits', 'Circuitos:'), ('feeder', 'Alimentador:')), start=1):
+            ttk.Label(form, text=label).grid(row=row, column=0, sticky='w', padx=5, pady=2)
+            for column, (field, _, width) in enumerate(self.FIELDS, start=1):
+                if field == 'method':
+                    entry = ttk.Combobox(form, values=list(METHODS), state='readonly', width=width)
+                    ToolTip(entry, '\n'.join(METHODS.values()))
+                elif field == 'min_section':
+                    entry = ttk.Combobox(form, values=[f'{section:g}' for section in SECTIONS], state='readonly', width=width)
+                else:
+                    entry = ttk.Entry(form, width=width)
+                entry.grid(row=row, column=column, padx=5, pady=2)
+                self.entries[group, field] = entry
+        self.fill()
+        apply_btn = ttk.Button(form, text='Aplicar', style='Primary.TButton', command=self.apply)
+        apply_btn.grid(row=1, column=len(self.FIELDS) + 1, rowspan=2, padx=5)
+        ToolTip(apply_btn, 'O comprimento vale para os circuitos sem comprimento próprio (campo Comprimento da carga).')
+
+        self.summary_label = ttk.Label(self.window, padding=(10, 0))
+        self.summary_label.grid(row=1, column=0, sticky='w')
+
+        table_frame = ttk.Frame(self.window, padding=5)
+        table_frame.grid(row=2, column=0, sticky='nsew')
+        table_frame.columnconfigure(0, weight=1)
+        table_frame.rowconfigure(0, weight=1)
+        columns = ('Circuito', 'Ib', 'Disjuntor', 'Seção', 'Iz', 'Queda')
+        self.view = VirtualTreeview(table_frame, columns, self.row_values)
+        for column, text, width in zip(columns, ('Circuito', 'Ib (A)', 'Disjuntor (A)', 'Seção (mm²)', 'Iz (A)', 'ΔV (%)'), (180, 70, 80, 80, 70, 60)):
+            self.view.tree.heading(column, text=text)
+            self.view.tree.column(column, width=width)
+        self.view.tree.grid(row=0, column=0, sticky='nsew')
+        self.view.scrollbar.grid(row=0, column=1, sticky='ns')
+        self.result = None
+        self.failed = None
+
+    def fill(self):
+        # Formulário com as condições do projeto aberto
+        for group, installation in (('circuits', self.app.project.installation), ('feeder', self.app.project.feeder)):
+            for field, _, _ in self.FIELDS:
+                entry = self.entries[group, field]
+                value = getattr(installation, field)
+                text = value if field == 'method' else f'{value:g}'
+                if isinstance(entry, ttk.Combobox):
+                    entry.set(text)
+                else:
+                    entry.delete(0, tk.END)
+                    entry.insert(0, text)
+
+    def read(self, group):
+        # Installation do formulário, ou a mensagem de erro
+        values = {field: self.entries[group, field].get().strip() for field, _, _ in self.FIELDS}
+        try:
+            installation = Installation(
+                values['method'], float(values['ambient']), int(values['grouping']),
+                float(values['length']), float(values['max_drop']), float(values['min_section']),
+            )
+        except ValueError:
+            return 'Informe números para temperatura, agrupamento (inteiro), comprimento e queda de tensão.'
+        return check_installation(installation) or installation
+
+    def apply(self):
+        installation, feeder = self.read('circuits'), self.read('feeder')
+        for group in (installation, feeder):
+            if isinstance(group, str):
+                messagebox.showerror('Erro', group, parent=self.window)
+                return
+        self.app.project.installation, self.app.project.feeder = installation, feeder
+        self.app.calculate_and_plot()
+
+    def show(self, result, loads):
+        # Chamada com cada recálculo: `result` vem de size_project sobre `loads`,
+        # a cópia da tabela enviada ao worker (linhas na mesma ordem)
+        self.result = result
+        self.failed = result.failed()
+        self.names, self.name_index, self.ids = loads.names, loads.column('name'), loads.ids
+        parts = [f'{len(loads)} circuito(s) + alimentador']
+        if self.failed.any():
+            parts.append(f'{int(self.failed.sum())} sem solução nas tabelas (acima de {SECTIONS[-1]:g} mm² ou da queda máxima)')
+        if self.result.neutral_loaded:
+            parts.append('neutro do alimentador carregado (harmônicas triplas > 15 %)')
+        self.summary_label.config(text=' · '.join(parts))
+        self.view.set_rows(range(len(self.result)))
+
+    def row_values(self, index):
+        result = self.result
+        if index == len(result) - 1:
+            iid, name = 'feeder', 'Alimentador'
+        else:
+            iid, name = str(self.ids[index]), self.names[self.name_index[index]]
+        if self.failed[index]:
+            return iid, (name, f'{result.current[index]:.2f}', '—', '—', '—', '—')
+        return iid, (name, f'{result.current[index]:.2f}', f'{result.breaker[index]:g}', f'{result.section[index]:g}',
+                     f'{result.ampacity[index]:.1f}', f'{result.drop[index]:.2f}')
+
+class PhasorCalcApp:
+    def __init__(self, root):
+        self.setup_styles()
+
+        self.root = root
+        root.title('Calculadora de Fasores de Corrente - v2.0')
+        self.loads = LoadTable() # Cargas em colunas; cada linha tem um id estável
+        self.pinned_ids = set() # Cargas que o balanceamento não pode mover
+        self.accumulator = LoadAccumulator(line_voltage=220.0) # Somas de Ia/Ib/Ic, P e Q por carga
+        self._plotted_voltage = None # Texto da tensão usado no último cálculo
+        self.phasor_plot = None # Criado quando o Matplotlib terminar de carregar
+        self.project = Project(self.loads, 220.0) # Metadados do projeto aberto
+        self.source = None # Source desequilibrada; None usa a tensão de linha (fonte equilibrada)
+        self.history = History() # Desfazer/refazer: guarda só as cargas alteradas em cada passo
+        self._history_voltage = '220' # Tensão registrada no histórico por último
+        self.editing_id = None # Carga em edição no formulário (Modificar Carga)
+        self.project_path = None
+        self.sizing_window = None # Atualizada a cada recálculo enquanto estiver aberta
+        self.solver = SolveWorker(self.solve_job) # Recálculos fora da thread do Tk
+        self._busy_after = None # Indicador de ocupado agendado
+        self._polling = False
+        self.balance_results = queue.Queue() # Resultado do balanceamento (thread separada)
+        self._balancing = False
+        self.create_ui()
+        self.root.after_idle(self.load_plotting)
+
+    def setup_styles(self):
+        self.style = ttk.Style()
+        self.style.theme_use('clam')  # You can choose other themes like 'clam', 'alt', 'default', 'classic', etc.
+
+        self.style.configure(
+            'TEntry',
+            padding=6,
+            relief='flat'
+        )
+
+        self.style.configure(
+            'Primary.TButton',
+            font=('Segoe UI', 10, 'bold'),
+            padding=(10, 6)
+        )
+
+        self.style.configure(
+            'Secondary.TButton',
+            padding=(8, 5)
+        )
+
+        self.style.configure(
+            'Treeview.Heading',
+            font=('Segoe UI', 9, 'bold')
+        )
+
+        self.style.configure(
+            'Treeview',
+            rowheight=26,
+            font=('Segoe UI', 9)
+        )
+
+        self.style.configure(
+            'Text',
+            font=('Consolas', 10),
+            background='#f9f9f9',
+            relief='flat',
+            padx=8,
+            pady=8
+        )
+
+        self.style.configure(
+            'TLabelframe.Label',
+            font=('Segoe UI', 10, 'bold')
+        )
+
+    def create_ui(self):
+        icon_path = resource_path('icon.ico')  # Path to your icon file
+
+        try:
+            self.root.iconbitmap(icon_path)
+        except tk.TclError:
+            pass # .ico só é aceito pelo Tk no Windows
+ 
+        self.root.geometry('1000x700+0+0')
+
+        menubar = tk.Menu(self.root)
+        file_menu = tk.Menu(menubar, tearoff=False)
+        file_menu.add_command(label='Novo Projeto', command=self.new_project)
+        file_menu.add_command(label='Abrir Projeto...', accelerator='Ctrl+O', command=self.open_project_file)
+        file_menu.add_command(label='Salvar', accelerator='Ctrl+S', command=self.save_project_file)
+        file_menu.add_command(label='Salvar Como...', command=lambda: self.save_project_file(save_as=True))
+        file_menu.add_separator()
+        file_menu.add_command(label='Exportar JSON...', command=self.export_project_json)
+        menubar.add_cascade(label='Arquivo', menu=file_menu)
+        self.edit_menu = tk.Menu(menubar, tearoff=False)
+        self.edit_menu.add_command(label='Desfazer', accelerator='Ctrl+Z', command=self.undo)
+        self.edit_menu.add_command(label='Refazer', accelerator='Ctrl+Y', command=self.redo)
+        menubar.add_cascade(label='Editar', menu=self.edit_menu)
+        view_menu = tk.Menu(menubar, tearoff=False)
+        self.profile_var = tk.BooleanVar(value=profiler.enabled)
+        view_menu.add_checkbutton(label='Tempos de Atualização', variable=self.profile_var, command=self.toggle_profiling)
+        view_menu.add_command(label='Zerar Tempos', command=self.reset_profiling)
+        view_menu.add_command(label='Exportar Trace (Chrome)...', command=self.export_trace)
+        menubar.add_cascade(label='Exibir', menu=view_menu)
+        self.update_history_menu()
+        self.root.config(menu=menubar)
+        self.root.bind('<Control-z>', lambda event: self.undo())
+        self.root.bind('<Control-y>', lambda event: self.redo())
+        self.root.bind('<Control-Z>', lambda event: self.redo()) # Ctrl+Shift+Z
+        self.root.bind('<Escape>', lambda event: self.cancel_edit())
+        self.root.bind('<Control-o>', lambda event: self.open_project_file())
+        self.root.bind('<Control-s>', lambda event: self.save_project_file())
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=2)
+        self.root.rowconfigure(1, weight=0)
+
+        main_frame = ttk.Frame(self.root, padding=10)
+        main_frame.grid(row=0, column=0, sticky='nsew')
+
+        # Barra de status com os tempos por etapa (Exibir > Tempos de Atualização)
+        self.status_label = ttk.Label(self.root, anchor='w', padding=(10, 2), font=('Consolas', 9))
+        self.status_label.grid(row=1, column=0, sticky='ew')
+        if not profiler.enabled:
+            self.status_label.grid_remove()
+
+        main_frame.columnconfigure(0, weight=1)  # painel esquerdo
+        main_frame.columnconfigure(1, weight=3)  # resultados / gráfico
+        main_frame.rowconfigure(2, weight=1)
+
+        # Grid Frame Configuration
+        grid_frame = ttk.Labelframe(main_frame, text='Configuração da Rede')
+        grid_frame.grid(row=0, column=0, sticky='ew', pady=8, padx=5)
+
+        grid_frame.columnconfigure(1, weight=1)
+
+        ttk.Label(grid_frame, text='Tensão de Linha (V):').grid(row=0, column=0, sticky='w', padx=5, pady=2)
+        self.line_voltage_entry = ttk.Entry(grid_frame, width=10)
+        self.line_voltage_entry.grid(row=0, column=1, sticky='ew', padx=5, pady=2)
+        self.line_voltage_entry.insert(0, '220') # Default value
+        self.voltage_debouncer = Debouncer(self.root, self.calculate_and_plot)
+        self.line_voltage_entry.bind('<KeyRelease>', self.on_voltage_change)
+        ToolTip(self.line_voltage_entry, '🔌 Tensão de linha: Tensão entre duas fases (Vab, Vbc, Vca) da rede. Exemplo: 220V, 380V.')
+
+        sweep_btn = ttk.Button(grid_frame, text='📈 Varredura', style='Secondary.TButton', command=self.open_sweep)
+        sweep_btn.grid(row=0, column=2, sticky='e', padx=5, pady=2)
+        ToolTip(sweep_btn, 'Mostra |Ia|, |Ib|, |Ic| e |In| em função da tensão de linha (ex.: ±10% da nominal).')
+
+        monte_carlo_btn = ttk.Button(grid_frame, text='🎲 Monte Carlo', style='Secondary.TButton', command=self.open_monte_carlo)
+        monte_carlo_btn.grid(row=0, column=3, sticky='e', padx=5, pady=2)
+        ToolTip(monte_carlo_btn, 'Simula a incerteza de potência e FP das cargas e mostra os percentis das correntes e do neutro.')
+
+        profiles_btn = ttk.Button(grid_frame, text='🕒 Perfis', style='Secondary.TButton', command=self.open_profiles)
+        profiles_btn.grid(row=0, column=4, sticky='e', padx=5, pady=2)
+        ToolTip(profiles_btn, 'Resolve as cargas para cada intervalo de um perfil horário ou de 15 min (CSV ou Parquet)\ne mostra picos, pico coincidente e curva de duração.')
+
+        ttk.Label(grid_frame, text='Fonte:').grid(row=1, column=0, sticky='w', padx=5, pady=2)
+        self.source_label = ttk.Label(grid_frame, text='Equilibrada')
+        self.source_label.grid(row=1, column=1, sticky='w', padx=5, pady=2)
+        source_btn = ttk.Button(grid_frame, text='⚙ Fonte', style='Secondary.TButton', command=self.open_source)
+        source_btn.grid(row=1, column=2, sticky='e', padx=5, pady=2)
+        ToolTip(source_btn, 'Define tensão e ângulo de cada fase (fonte desequilibrada, ex.: 2 a 4% de desequilíbrio medido).\nVarredura e balanceamento continuam usando a tensão de linha.')
+
+        sizing_btn = ttk.Button(grid_frame, text='📐 Dimensionamento', style='Secondary.TButton', command=self.open_sizing)
+        sizing_btn.grid(row=1, column=3, columnspan=2, sticky='e', padx=5, pady=2)
+        ToolTip(sizing_btn, 'Seção dos condutores, disjuntor e queda de tensão de cada carga e do alimentador (NBR 5410),\na partir das correntes calculadas e das condições de instalação.')
+
+        # Input Frame for new loads
+        input_frame = ttk.Labelframe(main_frame, text='Adicionar Nova Carga')
+        input_frame.grid(row=1, column=0, sticky='ew', pady=8, padx=5)
+
+        input_frame.columnconfigure(1, weight=1)
+
+        ttk.Label(input_frame, text='Nome da Carga:').grid(row=0, column=0, sticky='w', padx=5, pady=2)
+        self.load_name_entry = ttk.Entry(input_frame, width=20)
+        self.load_name_entry.grid(row=0, column=1, sticky='ew', padx=5, pady=2)
+
+        ttk.Label(input_frame, text='Comprimento (m):').grid(row=0, column=2, sticky='w', padx=5, pady=2)
+        self.length_entry = ttk.Entry(input_frame, width=5)
+        self.length_entry.grid(row=0, column=3, sticky='ew', padx=5, pady=2)
+        ToolTip(self.length_entry, '📏 Comprimento do circuito, usado na queda de tensão do dimensionamento.\nEm branco: o comprimento padrão da instalação.')
+
+        ttk.Label(input_frame, text='Potência (W):').grid(row=1, column=0, sticky='w', padx=5, pady=2)
+        self.power_entry = ttk.Entry(input_frame, width=10)
+        self.power_entry.grid(row=1, column=1, sticky='ew', padx=5, pady=2)
+        ToolTip(self.power_entry, '⚡ Potência Ativa (W): Potência real consumida ou gerada pela carga. \nUse valores positivos para cargas consumidoras e negativos para geradores.')
+
+        ttk.Label(input_frame, text='Fator de Potência (FP):').grid(row=1, column=2, sticky='w', padx=5, pady=2)
+        self.pf_entry = ttk.Entry(input_frame, width=5)
+        self.pf_entry.grid(row=1, column=3, sticky='ew', padx=5, pady=2)
+        self.pf_entry.insert(0, '1.0') # Default value
+        ToolTip(self.pf_entry, '🔋 Fator de Potência (FP)\nFP = cos(φ).\n Relação entre potência ativa e aparente. \nValor entre 0 e 1. Exemplo: 0.8, 0.95, 1.0.')
+
+        # Radiobuttons for Power Factor Type (Inductive/Capacitive)
+        self.pf_type_var = tk.StringVar(value='Indutivo') # Default to Indutivo
+        
+        pf_type_frame = ttk.Frame(input_frame)
+        pf_type_frame.grid(row=2, column=2, columnspan=2, sticky='w', padx=5, pady=2)
+        ToolTip(pf_type_frame, 'Tipo de Fator de Potência:\nIndutivo: Carga que consome potência reativa (motor, transformador).\nCapacitivo: Carga que fornece potência reativa (banco de capacitores).')
+        
+        ttk.Label(pf_type_frame, text='Tipo FP:').pack(side='left')
+        ttk.Radiobutton(pf_type_frame, text='Indutivo', variable=self.pf_type_var, value='Indutivo').pack(side='left')
+        ttk.Radiobutton(pf_type_frame, text='Capacitivo', variable=self.pf_type_var, value='Capacitivo').pack(side='left')
+
+        ttk.Label(input_frame, text='Espectro:').grid(row=2, column=0, sticky='w', padx=5, pady=2)
+        self.spectrum_var = tk.StringVar(value=LINEAR)
+        self.spectrum_combo = ttk.Combobox(input_frame, textvariable=self.spectrum_var, values=list(SPECTRA), state='readonly', width=18)
+        self.spectrum_combo.grid(row=2, column=1, sticky='ew', padx=5, pady=2)
+        ToolTip(self.spectrum_combo, '〰 Espectro harmônico da corrente da carga.\nCargas não lineares (fontes chaveadas, LED, inversores) geram harmônicas;\nas de ordem 3, 9, 15... somam no neutro.')
+
+        ttk.Label(input_frame, text='Fase(s):').grid(row=3, column=0, sticky='w', padx=5, pady=2)
+        
+        self.phase_a_var = tk.BooleanVar()
+        self.phase_b_var = tk.BooleanVar()
+        self.phase_c_var = tk.BooleanVar()
+        self.neutral_var = tk.BooleanVar()
+
+        cb_a = ttk.Checkbutton(input_frame, text='A', variable=self.phase_a_var)
+        cb_a.grid(row=4, column=1, sticky='w', padx=5, pady=2)
+        cb_b = ttk.Checkbutton(input_frame, text='B', variable=self.phase_b_var)
+        cb_b.grid(row=4, column=2, sticky='w', padx=5, pady=2)
+        cb_c = ttk.Checkbutton(input_frame, text='C', variable=self.phase_c_var)
+        cb_c.grid(row=4, column=3, sticky='w', padx=5, pady=2)
+        cb_n = ttk.Checkbutton(input_frame, text='Neutro', variable=self.neutral_var)
+        cb_n.grid(row=4, column=4, sticky='w', padx=5, pady=2)
+
+        ToolTip(cb_a, 'Selecione os condutores às quais a carga está conectada.\nPode ser uma ou mais fases (A, B, C) e/ou Neutro (N).')
+        ToolTip(cb_b, 'Selecione os condutores às quais a carga está conectada.\nPode ser uma ou mais fases (A, B, C) e/ou Neutro (N).')
+        ToolTip(cb_c, 'Selecione os condutores às quais a carga está conectada.\nPode ser uma ou mais fases (A, B, C) e/ou Neutro (N).')
+        ToolTip(cb_n, 'Selecione os condutores às quais a carga está conectada.\nPode ser uma ou mais fases (A, B, C) e/ou Neutro (N).')
+
+        self.add_load_btn = ttk.Button(input_frame, text='➕ Adicionar Carga', style='Primary.TButton', command=self.add_load)
+        self.add_load_btn.grid(row=5, column=0, columnspan=5, pady=10)
+        ToolTip(self.add_load_btn, 'Durante uma modificação, salva a carga editada (Esc cancela a edição).')
+
+        # Loads List Frame
+        loads_list_frame = ttk.Labelframe(main_frame, text='Cargas Adicionadas')
+        loads_list_frame.grid(row=2, column=0, sticky='nsew', pady=8, padx=5)
+
+        self.loads_view = VirtualTreeview(loads_list_frame, ('Nome', 'Potência', 'FP', 'Tipo FP', 'Fases', 'Corrente'), self.load_row)
+        self.loads_tree = self.loads_view.tree
+        self.loads_tree.heading('Nome', text='Nome')
+        self.loads_tree.heading('Potência', text='Potência (W)')
+        self.loads_tree.heading('FP', text='FP')
+        self.loads_tree.heading('Tipo FP', text='Tipo FP')
+        self.loads_tree.heading('Fases', text='Fases')
+        self.loads_tree.heading('Corrente', text='Corrente (A)')
+        self.loads_tree.column('Nome', width=100)
+        self.loads_tree.column('Potência', width=80)
+        self.loads_tree.column('FP', width=40)
+        self.loads_tree.column('Tipo FP', width=60)
+        self.loads_tree.column('Fases', width=80)
+        self.loads_tree.column('Corrente', width=80)
+        self.loads_tree.grid(row=0, column=0, sticky='nsew', padx=(5, 0), pady=5)
+        self.loads_view.scrollbar.grid(row=0, column=1, sticky='ns', padx=(0, 5), pady=5)
+
+        # Buttons for Modify and Delete
+        btn_frame = ttk.Frame(loads_list_frame)
+        btn_frame.grid(row=1, column=0, columnspan=2, sticky='ew', pady=5)
+
+        modify_load_btn = ttk.Button(btn_frame, text='✏️ Modificar Carga', style="Secondary.TButton", command=self.modify_load)
+        modify_load_btn.pack(side='left', padx=5)
+
+        delete_load_btn = ttk.Button(btn_frame, text='🗑️ Deletar Carga', style="Secondary.TButton", command=self.delete_load)
+        delete_load_btn.pack(side='left', padx=5)
+
+        import_loads_btn = ttk.Button(btn_frame, text='📂 Importar Planilha', style="Secondary.TButton", command=self.import_loads)
+        import_loads_btn.pack(side='left', padx=5)
+        ToolTip(import_loads_btn, 'Importa cargas de um arquivo CSV ou XLSX com as colunas:\nname, power, pf, pf_type, phases\n(ou Nome, Potência, FP, Tipo FP, Fases).')
+
+        balance_frame = ttk.Frame(loads_list_frame)
+        balance_frame.grid(row=2, column=0, columnspan=2, sticky='ew', pady=(0, 5))
+
+        pin_load_btn = ttk.Button(balance_frame, text='📌 Fixar/Liberar', style="Secondary.TButton", command=self.toggle_pin)
+        pin_load_btn.pack(side='left', padx=5)
+        ToolTip(pin_load_btn, 'Cargas fixadas (📌) não são movidas pelo balanceamento de fases.')
+
+        self.balance_objective_var = tk.StringVar(value='Corrente de Neutro')
+        ttk.Combobox(balance_frame, textvariable=self.balance_objective_var, state='readonly', width=22,
+                     values=('Corrente de Neutro', 'Maior Corrente de Fase')).pack(side='left', padx=5)
+
+        self.balance_btn = ttk.Button(balance_frame, text='⚖️ Balancear Fases', style="Secondary.TButton", command=self.balance_phases)
+        self.balance_btn.pack(side='left', padx=5)
+        ToolTip(self.balance_btn, 'Redistribui as cargas monofásicas (fase-neutro) e bifásicas entre as fases\npara minimizar o objetivo escolhido. Cargas trifásicas não são alteradas.')
+
+        loads_list_frame.columnconfigure(0, weight=1)
+        loads_list_frame.rowconfigure(0, weight=1)
+
+        # Results and Plot Frame
+        results_plot_frame = ttk.Labelframe(main_frame, text='Resultados e Diagrama Fasorial')
+        results_plot_frame.grid(row=0, column=1, rowspan=3, sticky='nsew', pady=8, padx=5)
+        results_plot_frame.rowconfigure(1, weight=1)
+        results_plot_frame.columnconfigure(0, weight=1)
+
+        self.result_text = tk.Text(results_plot_frame, height=10, width=40)
+        self.result_text.grid(row=0, column=0, sticky='nsew', padx=5, pady=5)
+
+        # Indicador de ocupado: só aparece se o recálculo passar de BUSY_DELAY ms
+        self.busy_bar = ttk.Progressbar(results_plot_frame, mode='indeterminate')
+        self.busy_bar.grid(row=2, column=0, sticky='ew', padx=5, pady=(0, 5))
+        self.busy_bar.grid_remove()
+
+        self.results_plot_frame = results_plot_frame
+        self.plot_placeholder = ttk.Label(results_plot_frame, text='Carregando diagrama fasorial...', anchor='center')
+        self.plot_placeholder.grid(row=1, column=0, sticky='nsew', padx=5, pady=5)
+
+        footer_frame = ttk.Frame(self.root, padding=(10, 8, 10, 12))
+        footer_frame.grid(row=2, column=0, sticky='ew')
+
+        rodape = ttk.Label(footer_frame, text="Desenvolvido por Pedro Akio Sakuma - Engenharia de Desenvolvimento © 2025", anchor='e', font=("Segoe UI", 9)) # Label fixo no rodapé
+        rodape.pack(fill='x')
+
+    def load_plotting(self):
+        # O Matplotlib é importado fora da thread do Tk para que a janela e os
+        # formulários apareçam antes; o canvas é anexado quando estiver pronto
+        loader = threading.Thread(target=import_plotting, daemon=True)
+        loader.start()
+        self.poll_plotting(loader)
+
+    def poll_plotting(self, loader):
+        if loader.is_alive():
+            self.root.after(50, self.poll_plotting, loader)
+        else:
+            self.attach_plot()
+
+    def attach_plot(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.plot_placeholder.destroy()
+        self.fig = Figure(figsize=(5,4), tight_layout=True)
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.results_plot_frame)
+        self.canvas.get_tk_widget().grid(row=1, column=0, sticky='nsew', padx=5, pady=5)
+        self.phasor_plot = PhasorPlot(self.canvas, self.ax)
+
+        if self._plotted_voltage is not None:
+            self.calculate_and_plot() # Cargas adicionadas enquanto o gráfico carregava
+
+    def open_source(self):
+        try:
+            line_voltage = float(self.line_voltage_entry.get().strip())
+            if line_voltage <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror('Erro', 'A tensão de linha deve ser um valor positivo.')
+            return
+        SourceWindow(self, line_voltage)
+
+    def set_source(self, source, recalculate=True):
+        # Com fonte desequilibrada a tensão de linha do formulário deixa de valer
+        self.source = source
+        if source is None:
+            self.source_label.config(text='Equilibrada')
+            self.line_voltage_entry.state(['!disabled'])
+        else:
+            self.source_label.config(text=f'Desequilibrada ({source.unbalance():.2f} %)')
+            self.line_voltage_entry.state(['disabled'])
+        if recalculate:
+            self.calculate_and_plot()
+
+    def set_voltage_text(self, text):
+        restore = self.line_voltage_entry.state(['!disabled'])
+        self.line_voltage_entry.delete(0, tk.END)
+        self.line_voltage_entry.insert(0, text)
+        self.line_voltage_entry.state(restore)
+
+    def open_sweep(self):
+        try:
+            line_voltage = float(self.line_voltage_entry.get().strip())
+            if line_voltage <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror('Erro', 'A tensão de linha deve ser um valor positivo.')
+            return
+        SweepWindow(self, line_voltage)
+
+    def open_monte_carlo(self):
+        try:
+            line_voltage = float(self.line_voltage_entry.get().strip())
+            if line_voltage <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror('Erro', 'A tensão de linha deve ser um valor positivo.')
+            return
+        MonteCarloWindow(self, self.source or line_voltage)
+
+    def open_profiles(self):
+        try:
+            line_voltage = float(self.line_voltage_entry.get().strip())
+            if line_voltage <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror('Erro', 'A tensão de linha deve ser um valor positivo.')
+            return
+        ProfileWindow(self, self.source or line_voltage)
+
+    def open_sizing(self):
+        if self.sizing_window is not None and self.sizing_window.window.winfo_exists():
+            self.sizing_window.window.lift()
+            return
+        self.sizing_window = SizingWindow(self)
+        self.calculate_and_plot()
+
+    def set_project_path(self, path):
+        self.project_path = path
+        title = 'Calculadora de Fasores de Corrente - v2.0'
+        self.root.title(f'{Path(path).name} - {title}' if path else title)
+
+    def current_project(self):
+        # Projeto com o estado atual da interface, ou None se a tensão for inválida
+        try:
+            line_voltage = float(self.line_voltage_entry.get().strip())
+            if line_voltage <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror('Erro', 'A tensão de linha deve ser um valor positivo.')
+            return None
+        self.project.loads = self.loads
+        self.project.line_voltage = line_voltage
+        self.project.source = self.source
+        self.project.pinned = self.pinned_ids & set(self.loads.ids.tolist())
+        return self.project
+
+    def set_project(self, project, path):
+        self.project = project
+        self.loads = project.loads
+        self.pinned_ids = project.pinned & set(self.loads.ids.tolist())
+        # Somas refeitas direto das colunas, sem add_load por carga
+        self.accumulator.clear()
+        self.accumulator.extend_arrays(self.loads.ids.tolist(), *self.loads.arrays())
+        self.set_voltage_text(f'{project.line_voltage:g}')
+        self.set_source(project.source, recalculate=False)
+        self._history_voltage = f'{project.line_voltage:g}'
+        self.history.clear()
+        self.update_history_menu()
+        self.cancel_edit()
+        self.set_project_path(path)
+        if self.sizing_window is not None and self.sizing_window.window.winfo_exists():
+            self.sizing_window.fill()
+        self.calculate_and_plot()
+
+    def new_project(self):
+        if len(self.loads) and not messagebox.askyesno('Novo Projeto', 'Descartar as cargas atuais e começar um projeto novo?'):
+            return
+        self.set_project(Project(LoadTable(), 220.0), None)
+
+    def open_project_file(self):
+        path = filedialog.askopenfilename(
+            title='Abrir Projeto',
+            filetypes=[('Projetos', '*.phase *.json'), ('Projeto binário', '*.phase'), ('JSON', '*.json'), ('Todos os arquivos', '*.*')]
+        )
+        if not path:
+            return
+        try:
+            project = open_project(path)
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror('Erro', f'Não foi possível abrir o projeto:\n{e}')
+            return
+        # Um projeto JSON é salvo depois como .phase
+        self.set_project(project, path if Path(path).suffix.lower() == '.phase' else None)
+
+    def save_project_file(self, save_as=False):
+        project = self.current_project()
+        if project is None:
+            return
+        path = self.project_path
+        if save_as or path is None:
+            path = filedialog.asksaveasfilename(
+                title='Salvar Projeto', defaultextension='.phase',
+                filetypes=[('Projeto', '*.phase'), ('Todos os arquivos', '*.*')]
+            )
+            if not path:
+                return
+        try:
+            save_project(path, project)
+        except OSError as e:
+            messagebox.showerror('Erro', f'Não foi possível salvar o projeto:\n{e}')
+            return
+        self.set_project_path(path)
+
+    def export_project_json(self):
+        project = self.current_project()
+        if project is None:
+            return
+        path = filedialog.asksaveasfilename(
+            title='Exportar JSON', defaultextension='.json',
+            filetypes=[('JSON', '*.json'), ('Todos os arquivos', '*.*')]
+        )
+        if not path:
+            return
+        try:
+            export_json(path, project)
+        except OSError as e:
+            messagebox.showerror('Erro', f'Não foi possível exportar o projeto:\n{e}')
+
+    def on_voltage_change(self, event):
+        if event.widget.get().strip() == self._plotted_voltage:
+            return # Teclas que não alteram o valor (setas, Shift, ...)
+        self.voltage_debouncer()
+
+    def add_load(self):
+        name = self.load_name_entry.get().strip()
+        power_str = self.power_entry.get().strip()
+        pf_str = self.pf_entry.get().strip()
+        length_str = self.length_entry.get().strip()
+        pf_type = self.pf_type_var.get()
+        phases = []
+        if self.phase_a_var.get():
+            phases.append('A')
+        if self.phase_b_var.get():
+            phases.append('B')
+        if self.phase_c_var.get():
+            phases.append('C')
+        if self.neutral_var.get():
+            phases.append('N')
+
+        if not name or not power_str or not phases or not pf_str:
+            messagebox.showerror('Erro', 'Por favor, preencha todos os campos e selecione pelo menos uma fase.')
+            return
+
+        try:
+            power = float(power_str)
+            pf = float(pf_str)
+            length = float(length_str) if length_str else 0.0
+            line_voltage = float(self.line_voltage_entry.get().strip())
+            if line_voltage <= 0:
+                messagebox.showerror('Erro', 'A tensão de linha deve ser um valor positivo.')
+                return
+        except ValueError:
+            messagebox.showerror('Erro', 'Potência, Fator de Potência, Comprimento ou Tensão de Linha inválida. Por favor, insira um número.')
+            return
+        error = check_length(length)
+        if error:
+            messagebox.showerror('Erro', error)
+            return
+
+        error = check_load(power, pf)
+        if error:
+            messagebox.showerror('Erro', error)
+            return
+
+        error = check_phases(phases)
+        if error:
+            messagebox.showwarning("Aviso", error)
+            return
+
+        load_data = {
+            "name": name, 
+            "power": power, 
+            "pf": pf, 
+            "pf_type": pf_type, 
+            "phases": phases,
+            "spectrum": self.spectrum_var.get(),
+            "length": length,
+        }
+        if self.editing_id is not None:
+            before = self.loads.get(self.editing_id)
+            self.do(Change('Modificar carga', [(self.editing_id, before, load_data)]))
+        else:
+            load_id = self.loads.append(load_data)
+            self.accumulator.add(load_id, load_data)
+            self.record(Change.added('Adicionar carga', [(load_id, load_data)]))
+            self.calculate_and_plot()
+        self.clear_form()
+
+    def clear_form(self):
+        self.end_edit()
+        self.load_name_entry.delete(0, tk.END)
+        self.power_entry.delete(0, tk.END)
+        self.pf_entry.delete(0, tk.END)
+        self.pf_entry.insert(0, '1.0')
+        self.length_entry.delete(0, tk.END)
+        self.spectrum_var.set(LINEAR)
+        self.phase_a_var.set(False)
+        self.phase_b_var.set(False)
+        self.phase_c_var.set(False)
+        self.neutral_var.set(False)
+
+    def import_loads(self):
+        path = filedialog.askopenfilename(
+            title='Importar Cargas',
+            filetypes=[('Planilhas', '*.csv *.xlsx'), ('CSV', '*.csv'), ('Excel', '*.xlsx'), ('Todos os arquivos', '*.*')]
+        )
+        if not path:
+            return
+
+        try:
+            loads, errors = read_loads(path)
+        except (OSError, ImportError, ValueError, UnicodeDecodeError) as e:
+            messagebox.showerror('Erro', f'Não foi possível ler o arquivo:\n{e}')
+            return
+
+        load_ids = self.loads.extend(loads)
+        self.accumulator.extend(zip(load_ids, loads))
+        self.record(Change.added('Importar planilha', zip(load_ids, loads)))
+        self.calculate_and_plot()
+
+        if errors:
+            messagebox.showwarning('Aviso', f'{len(loads)} carga(s) importada(s), {len(errors)} linha(s) ignorada(s):\n\n{errors.summary()}')
+
+    def selected_load(self):
+        if self.loads_view.selected is None:
+            return None
+        return self.loads.get(int(self.loads_view.selected))
+
+    def delete_load(self):
+        load = self.selected_load()
+        if load is None:
+            messagebox.showwarning('Aviso', 'Por favor, selecione uma carga para deletar.')
+            return
+        # A fixação (📌) fica em pinned_ids para voltar junto se a remoção for desfeita
+        self.do(Change.removed('Deletar carga', [(load["id"], load)]))
+
+    def modify_load(self):
+        load_to_modify = self.selected_load()
+        if load_to_modify is None:
+            messagebox.showwarning('Aviso', 'Por favor, selecione uma carga para modificar.')
+            return
+
+        self.load_name_entry.delete(0, tk.END)
+        self.load_name_entry.insert(0, load_to_modify["name"])
+
+        self.power_entry.delete(0, tk.END)
+        self.power_entry.insert(0, str(load_to_modify["power"]))
+
+        self.pf_entry.delete(0, tk.END)
+        self.pf_entry.insert(0, str(load_to_modify["pf"]))
+        
+        self.length_entry.delete(0, tk.END)
+        if load_to_modify.get("length"):
+            self.length_entry.insert(0, f'{load_to_modify["length"]:g}')
+
+        self.pf_type_var.set(load_to_modify["pf_type"])
+        self.spectrum_var.set(load_to_modify.get("spectrum", LINEAR))
+        self.spectrum_combo.config(values=list(SPECTRA)) # Espectros de projetos abertos depois
+
+        self.phase_a_var.set("A" in load_to_modify["phases"])
+        self.phase_b_var.set("B" in load_to_modify["phases"])
+        self.phase_c_var.set("C" in load_to_modify["phases"])
+        self.neutral_var.set("N" in load_to_modify["phases"])
+
+        # A carga continua no quadro até a alteração ser salva
+        self.editing_id = load_to_modify["id"]
+        self.add_load_btn.config(text='💾 Salvar Alteração')
+
+    def end_edit(self):
+        self.editing_id = None
+        self.add_load_btn.config(text='➕ Adicionar Carga')
+
+    def cancel_edit(self):
+        if self.editing_id is not None:
+            self.clear_form()
+
+    # Desfazer/refazer
+
+    def record(self, change):
+        self.history.record(change)
+        self.update_history_menu()
+
+    def do(self, change):
+        self.record(change)
+        self.apply_change(change)
+
+    def commit_voltage_edit(self):
+        # Tensão digitada ainda no debounce: vira um passo antes de desfazer ou
+        # refazer. Se ficasse para depois, calculate_and_plot a registraria
+        # após o passo aplicado e a pilha de refazer seria apagada. Um valor
+        # inválido é descartado
+        self.voltage_debouncer.cancel()
+        voltage_str = self.line_voltage_entry.get().strip()
+        if voltage_str == self._history_voltage:
+            return
+        try:
+            valid = float(voltage_str) > 0
+        except ValueError:
+            valid = False
+        if valid:
+            self.record(Change('Alterar tensão', voltage=(self._history_voltage, voltage_str)))
+            self._history_voltage = voltage_str
+        else:
+            self.set_voltage_text(self._history_voltage)
+
+    def undo(self):
+        self.commit_voltage_edit()
+        change = self.history.undo()
+        if change is not None:
+            self.apply_change(change)
+        self.update_history_menu()
+
+    def redo(self):
+        self.commit_voltage_edit()
+        change = self.history.redo()
+        if change is not None:
+            self.apply_change(change)
+        self.update_history_menu()
+
+    def apply_change(self, change):
+        # Atualiza tabela e acumulador só nas cargas do passo
+        removed, added, modified = change.split()
+        if removed:
+            for load_id, _ in removed:
+                self.accumulator.remove(load_id)
+            self.loads.delete_many(load_id for load_id, _ in removed)
+        if added:
+            self.loads.insert([load_id for load_id, _ in added], [load for _, load in added])
+            if len(added) > 64:
+                self.accumulator.extend(added)
+            else:
+                for load_id, load in added:
+                    self.accumulator.add(load_id, load)
+        for load_id, load in modified:
+            self.loads.update(load_id, load)
+            self.accumulator.replace(load_id, load)
+        if change.voltage is not None:
+            self._history_voltage = change.voltage[1]
+            self.set_voltage_text(change.voltage[1])
+        if self.editing_id is not None and self.editing_id not in self.loads:
+            self.clear_form() # A carga em edição deixou de existir
+        self.calculate_and_plot()
+
+    def update_history_menu(self):
+        for index, action, label in ((0, 'Desfazer', self.history.undo_label), (1, 'Refazer', self.history.redo_label)):
+            self.edit_menu.entryconfig(index, label=f'{action}: {label}' if label else action,
+                                       state='normal' if label else 'disabled')
+
+    def toggle_pin(self):
+        load = self.selected_load()
+        if load is None:
+            messagebox.showwarning('Aviso', 'Por favor, selecione uma carga para fixar ou liberar.')
+            return
+        self.pinned_ids.symmetric_difference_update({load["id"]})
+        self.update_loads_display()
+
+    def balance_phases(self):
+        try:
+            line_voltage = float(self.line_voltage_entry.get().strip())
+            if line_voltage <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror('Erro', 'A tensão de linha deve ser um valor positivo.')
+            return
+        if not len(self.loads):
+            messagebox.showwarning('Aviso', 'Adicione cargas antes de balancear as fases.')
+            return
+
+        if self._balancing:
+            return
+        objective = 'neutral' if self.balance_objective_var.get() == 'Corrente de Neutro' else 'max_phase'
+        loads = self.loads.copy()
+        pinned_ids = set(self.pinned_ids)
+        pinned = [i for i, load_id in enumerate(loads.ids.tolist()) if load_id in pinned_ids]
+        self._balancing = True
+        self.balance_btn.state(['disabled'])
+        self.balance_btn.config(text='⏳ Balanceando...')
+        threading.Thread(target=self.run_balance, args=(loads, line_voltage, objective, pinned), daemon=True).start()
+        self.poll_balance(loads, pinned_ids)
+
+    def run_balance(self, loads, line_voltage, objective, pinned):
+        # Executada fora da thread do Tk, sobre uma cópia da tabela
+        try:
+            self.balance_results.put(balance(loads, line_voltage, objective=objective, pinned=pinned, time_budget=1.0))
+        except Exception as e:
+            self.balance_results.put(e)
+
+    def poll_balance(self, loads, pinned_ids):
+        import numpy as np
+        try:
+            result = self.balance_results.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self.poll_balance, loads, pinned_ids)
+            return
+        self._balancing = False
+        self.balance_btn.state(['!disabled'])
+        self.balance_btn.config(text='⚖️ Balancear Fases')
+        if isinstance(result, Exception):
+            messagebox.showerror('Erro', f'Não foi possível balancear as fases:\n{result}')
+            return
+        # As linhas do resultado são as da cópia: se o quadro mudou enquanto o
+        # balanceamento rodava, o resultado não vale mais
+        unchanged = len(loads) == len(self.loads) and pinned_ids == self.pinned_ids and all(
+            np.array_equal(loads.column(name), self.loads.column(name)) for name in ('id', 'power', 'pf', 'conn', 'capacitive'))
+        if not unchanged:
+            messagebox.showwarning('Balanceamento', 'O quadro foi alterado durante o balanceamento. Tente novamente.')
+            return
+
+        changed = result.changed
+        if not changed:
+            messagebox.showinfo('Balanceamento', f'A distribuição atual já é a melhor encontrada ({result.before:.2f} A).')
+            return
+        label = self.balance_objective_var.get()
+        if not messagebox.askyesno('Balanceamento', f'{label}: {result.before:.2f} A → {result.after:.2f} A\n{len(changed)} carga(s) mudariam de fase.\n\nAplicar?'):
+            return
+
+        rows = []
+        for i in changed:
+            before = self.loads[i]
+            after = dict(before, phases=list(CONN_PHASES[result.conn[i]]))
+            rows.append((before["id"], before, after))
+        self.do(Change('Balancear fases', rows))
+
+    def load_row(self, load):
+        phases_str = ', '.join(load['phases'])
+        current = self.accumulator.current(load['id'])
+        name = f"📌 {load['name']}" if load['id'] in self.pinned_ids else load['name']
+        if load.get('spectrum', LINEAR) != LINEAR:
+            name = f'{name} 〰'
+        return str(load['id']), (name, load['power'], load['pf'], load['pf_type'], phases_str, f'{current:.2f}')
+
+    def update_loads_display(self):
+        self.loads_view.set_rows(self.loads)
+
+    def calculate_and_plot(self):
+        self.voltage_debouncer.cancel() # Recalculado agora; descarta execução pendente
+        voltage_str = self.line_voltage_entry.get().strip()
+        try:
+            line_voltage = float(voltage_str)
+            if line_voltage <= 0:
+                return
+        except ValueError:
+            return
+        
+        self._plotted_voltage = voltage_str
+        if voltage_str != self._history_voltage:
+            self.record(Change('Alterar tensão', voltage=(self._history_voltage, voltage_str)))
+            self._history_voltage = voltage_str
+
+        # Os totais vêm do acumulador (O(1)) na thread do Tk; harmônicos e
+        # dimensionamento rodam no worker sobre uma cópia da tabela. A cópia é
+        # O(n), então só é feita quando um dos dois vai rodar
+        source = self.source or line_voltage
+        self.accumulator.set_voltage(source)
+        sizing = None
+        if self.sizing_window is not None and self.sizing_window.window.winfo_exists():
+            sizing = (self.project.installation, self.project.feeder)
+        nonlinear = len(self.loads) and self.loads.column('spectrum').any() # Índice 0 do pool é sempre Linear
+        loads = self.loads.copy() if nonlinear or sizing is not None else None
+        self.solver.submit((loads, source, self.accumulator.results(), sizing, time.perf_counter_ns()))
+        if self._busy_after is None:
+            self._busy_after = self.root.after(BUSY_DELAY, self.show_busy)
+        if not self._polling:
+            self._polling = True
+            self.root.after(POLL_INTERVAL, self.poll_solution)
+
+    def solve_job(self, job):
+        # Executada na thread do worker: nada de Tk aqui
+        loads, source, results, sizing, submitted = job
+        # `results` já vem do acumulador; aqui só o que depende de todas as
+        # cargas (`loads` é None quando não há nada a fazer)
+        harmonics = None
+        if loads is not None and len(loads) and loads.column('spectrum').any():
+            with profiler.stage('harmonics'):
+                harmonics = solve_harmonics(loads, source)
+        sized = None
+        if sizing is not None:
+            with profiler.stage('sizing'):
+                sized = size_project(loads, source, results, *sizing, harmonics=harmonics)
+        return results, harmonics, sized, loads, submitted
+
+    def poll_solution(self):
+        try:
+            solution = self.solver.poll()
+            if solution is not None:
+                self.show_solution(solution)
+        except Exception as e:
+            # Falha no worker ou ao exibir: o ciclo de consulta continua ou
+            # termina abaixo, senão o cursor de ocupado ficaria preso
+            messagebox.showerror('Erro', f'Não foi possível calcular:\n{e}')
+        finally:
+            if self.solver.busy():
+                self.root.after(POLL_INTERVAL, self.poll_solution) # Resultado obsoleto ou ainda calculando
+            else:
+                self._polling = False
+                self.hide_busy()
+
+    def show_solution(self, solution):
+        results, harmonics, sized, loads, submitted = solution
+        with profiler.stage('table'):
+            self.update_loads_display()
+        with profiler.stage('text'):
+            self.display_results(results, harmonics)
+        with profiler.stage('plot'):
+            self.plot_phasors(*(polar_to_complex(*results[k]) for k in ('Ia', 'Ib', 'Ic', 'In')))
+        if sized is not None and self.sizing_window is not None and self.sizing_window.window.winfo_exists():
+            self.sizing_window.show(sized, loads)
+
+        if profiler.enabled:
+            # Do pedido até a tela atualizada, incluindo a espera pelo worker
+            profiler.add('update', submitted, time.perf_counter_ns() - submitted)
+            self.show_timings()
+
+    def show_busy(self):
+        self._busy_after = None
+        if self.solver.busy():
+            self.busy_bar.grid()
+            self.busy_bar.start(15)
+            self.root.config(cursor='watch')
+
+    def hide_busy(self):
+        if self._busy_after is not None:
+            self.root.after_cancel(self._busy_after)
+            self._busy_after = None
+        self.busy_bar.stop()
+        self.busy_bar.grid_remove()
+        self.root.config(cursor='')
+
+    def show_timings(self):
+        parts = []
+        for stage, label in (('harmonics', 'harmônicos'), ('table', 'tabela'), ('text', 'texto'), ('plot', 'gráfico'), ('sizing', 'dimensionamento'), ('update', 'total')):
+            timings = profiler.percentiles(stage)
+            if timings is not None:
+                parts.append(f'{label} {profiler.last(stage):.1f} (p50 {timings[0]:.1f}, p95 {timings[1]:.1f})')
+        self.status_label.config(text='ms: ' + ' · '.join(parts))
+
+    def toggle_profiling(self):
+        profiler.enabled = self.profile_var.get()
+        if profiler.enabled:
+            self.status_label.grid()
+            self.status_label.config(text='ms: aguardando próxima atualização...')
+        else:
+            self.status_label.grid_remove()
+
+    def reset_profiling(self):
+        profiler.reset()
+        self.status_label.config(text='')
+
+    def export_trace(self):
+        if not profiler.events:
+            messagebox.showinfo('Trace', 'Nenhum tempo registrado. Ative Exibir > Tempos de Atualização e recalcule.')
+            return
+        path = filedialog.asksaveasfilename(
+            title='Exportar Trace', defaultextension='.json',
+            filetypes=[('Chrome trace', '*.json'), ('Todos os arquivos', '*.*')]
+        )
+        if not path:
+            return
+        try:
+            profiler.export_trace(path)
+        except OSError as e:
+            messagebox.showerror('Erro', f'Não foi possível exportar o trace:\n{e}')
+
+    def display_results(self, res, harmonics=None):
+        self.result_text.delete('1.0', tk.END)
+        lines = []
+        
+        lines.append("--- Balanço Total de Potências ---")
+        lines.append(f"Potência Ativa Total (P): {res['P_total']:.2f} W")
+        lines.append(f"Potência Reativa Total (Q): {res['Q_total']:.2f} VAR")
+        lines.append(f"Potência Aparente Total (S): {res['S_total']:.2f} VA")
+        lines.append(f"Fator de Potência Total (FP): {res['PF_total'] if res['PF_total'] != -1 else 1:.3f}")
+        lines.append("----------------------------------")
+        lines.append("--- Correntes Fasoriais Totais ---")
+
+        for k in ['Ia','Ib','Ic','In']:
+            mag, ang = res[k]
+            lines.append(f'{k}: {mag:.4f} A ∠ {ang:.2f}°')
+
+        sequence = results_sequence(res)
+        lines.append("----------------------------------")
+        lines.append("--- Componentes Simétricas ---")
+        for k, value in zip(('I0', 'I1', 'I2'), sequence.values[0].tolist()):
+            mag, ang = complex_to_polar(value)
+            lines.append(f'{k}: {mag:.4f} A ∠ {ang:.2f}°')
+        lines.append(f'Desequilíbrio I2/I1: {sequence.negative_unbalance[0]:.2f} % · I0/I1: {sequence.zero_unbalance[0]:.2f} %')
+
+        if harmonics is not None:
+            lines.append("----------------------------------")
+            lines.append("--- Harmônicas ---")
+            third = [abs(z) for z in harmonics.order(3).tolist()]
+            for k, rms, thd, i3 in zip(('Ia', 'Ib', 'Ic', 'In'), harmonics.rms().tolist(), harmonics.thd().tolist(), third):
+                thd_text = f'{thd:.1f} %' if thd != float('inf') else 'só harmônicas'
+                lines.append(f'{k}: {rms:.4f} A RMS · THD {thd_text} · 3ª {i3:.4f} A')
+
+        if self.source is not None:
+            vab, vbc, vca = self.source.line_voltages()
+            lines.append("----------------------------------")
+            lines.append(f"Fonte desequilibrada ({self.source.unbalance():.2f} %): Vab {vab:.1f} V, Vbc {vbc:.1f} V, Vca {vca:.1f} V")
+        
+        self.result_text.insert(tk.END, '\n'.join(lines))
+
+    def plot_phasors(self, Ia, Ib, Ic, In):
+        if self.phasor_plot is not None:
+            self.phasor_plot.update(Ia, Ib, Ic, In)
+
+def main():
+    root = tk.Tk()
+    app = PhasorCalcApp(root)
+    root.mainloop()
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""Balanceamento de fases: redistribui cargas 1φ+N e 2φ entre as fases.
+
+Cargas monofásicas podem ir para A-N, B-N ou C-N e bifásicas para A-B, B-C
+ou C-A; trifásicas e cargas fixadas (`pinned`) não mudam. O objetivo é a
+corrente de neutro (|Ia + Ib + Ic|) ou a maior corrente de fase.
+
+Parte de uma solução gulosa (maiores cargas primeiro, cada uma na opção que
+menos piora o objetivo) e melhora com busca local: mover uma carga e trocar
+as fases de duas cargas da mesma classe. Cada movimento só altera três somas
+complexas, então é avaliado em O(1). Atingido um ótimo local, parte da
+melhor solução é perturbada ao acaso e a busca recomeça, até `patience`
+perturbações seguidas sem melhora ou até `time_budget`. Quadros com poucas
+cargas móveis (até EXHAUSTIVE_LIMIT combinações) são resolvidos testando
+todas as combinações.
+"""
+import itertools
+import random
+import time
+
+from phase.core import (CONN_AB, CONN_AN, CONN_BC, CONN_BN, CONN_CA, CONN_CN,
+                        CONN_COEFFS, load_phasors, pack_loads)
+
+OPTIONS = {}
+for _group in ((CONN_AN, CONN_BN, CONN_CN), (CONN_AB, CONN_BC, CONN_CA)):
+    for _conn in _group:
+        OPTIONS[_conn] = _group
+
+EXHAUSTIVE_LIMIT = 3 ** 7 # Combinações avaliadas uma a uma (7 cargas móveis)
+
+OBJECTIVES = {
+    'neutral': lambda ia, ib, ic: abs(ia + ib + ic),
+    'max_phase': lambda ia, ib, ic: max(abs(ia), abs(ib), abs(ic)),
+}
+
+class BalanceResult:
+    def __init__(self, conn, original, before, after, moves):
+        self.conn = conn # Nova conexão (CONN_*) de cada linha
+        self.original = original
+        self.before = before # Objetivo em A, antes e depois
+        self.after = after
+        self.moves = moves # Movimentos de busca local aceitos
+
+    @property
+    def changed(self):
+        return [i for i, (new, old) in enumerate(zip(self.conn, self.original)) if new != old]
+
+def contribution(phasor, conn):
+    ka, kb, kc = CONN_COEFFS[conn]
+    return phasor * ka, phasor * kb, phasor * kc
+
+def balance(loads, line_voltage, objective='neutral', pinned=(), time_budget=1.0, seed=None, patience=200):
+    score = OBJECTIVES[objective]
+    power, pf, sign, conn = pack_loads(loads)
+    _, phasors, _ = load_phasors(power, pf, sign, conn, line_voltage)
+    phasors = phasors.tolist()
+    original = conn.tolist()
+    pinned = set(pinned)
+    movable = [i for i, c in enumerate(original) if c in OPTIONS and i not in pinned]
+    movable_set = set(movable)
+
+    # Contribuição do que não pode ser movido
+    fixed = [0j, 0j, 0j]
+    current = [0j, 0j, 0j]
+    for i, c in enumerate(original):
+        ia, ib, ic = contribution(phasors[i], c)
+        current[0] += ia
+        current[1] += ib
+        current[2] += ic
+        if i not in movable_set:
+            fixed[0] += ia
+            fixed[1] += ib
+            fixed[2] += ic
+    before = score(*current)
+
+    if 3 ** len(movable) <= EXHAUSTIVE_LIMIT:
+        return exhaustive(score, phasors, original, movable, fixed, before)
+
+    # Gulosa: maiores correntes primeiro
+    assigned = list(original)
+    ia, ib, ic = fixed
+    for i in sorted(movable, key=lambda i: -abs(phasors[i])):
+        best = None
+        for option in OPTIONS[original[i]]:
+            da, db, dc = contribution(phasors[i], option)
+            value = score(ia + da, ib + db, ic + dc)
+            if best is None or value < best[0]:
+                best = (value, option, da, db, dc)
+        _, assigned[i], da, db, dc = best
+        ia, ib, ic = ia + da, ib + db, ic + dc
+
+    # A gulosa pode ser pior que a distribuição original
+    if score(ia, ib, ic) > before:
+        assigned = list(original)
+        ia, ib, ic = current
+
+    deadline = time.perf_counter() + time_budget
+    rng = random.Random(seed)
+    moves = 0
+
+    groups = {}
+    for i in movable:
+        groups.setdefault(OPTIONS[original[i]], []).append(i)
+    groups = [group for group in groups.values() if len(group) > 1]
+
+    def improve(assigned, ia, ib, ic):
+        # Busca local até um ótimo local: mover uma carga ou trocar as fases
+        # de duas cargas da mesma classe
+        nonlocal moves
+        value = score(ia, ib, ic)
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = False
+            for i in movable:
+                if time.perf_counter() >= deadline:
+                    break
+                old = contribution(phasors[i], assigned[i])
+                for option in OPTIONS[original[i]]:
+                    if option == assigned[i]:
+                        continue
+                    new = contribution(phasors[i], option)
+                    na, nb, nc = ia + new[0] - old[0], ib + new[1] - old[1], ic + new[2] - old[2]
+                    new_value = score(na, nb, nc)
+                    if new_value < value - 1e-12:
+                        assigned[i], ia, ib, ic, value = option, na, nb, nc, new_value
+                        old = new
+                        improved = True
+                        moves += 1
+            for group in groups:
+                for x, i in enumerate(group):
+                    if time.perf_counter() >= deadline:
+                        break
+                    for j in group[x + 1:]:
+                        if assigned[i] == assigned[j]:
+                            continue
+                        oi, oj = contribution(phasors[i], assigned[i]), contribution(phasors[j], assigned[j])
+                        ni, nj = contribution(phasors[i], assigned[j]), contribution(phasors[j], assigned[i])
+                        na = ia + ni[0] - oi[0] + nj[0] - oj[0]
+                        nb = ib + ni[1] - oi[1] + nj[1] - oj[1]
+                        nc = ic + ni[2] - oi[2] + nj[2] - oj[2]
+                        new_value = score(na, nb, nc)
+                        if new_value < value - 1e-12:
+                            assigned[i], assigned[j] = assigned[j], assigned[i]
+                            ia, ib, ic, value = na, nb, nc, new_value
+                            improved = True
+                            moves += 1
+        return ia, ib, ic, value
+
+    ia, ib, ic, value = improve(assigned, ia, ib, ic)
+    best = (value, list(assigned))
+
+    # Busca local iterada: perturba parte da melhor solução e desce de novo
+    # enquanto houver tempo
+    kick = max(2, len(movable) // 10)
+    stale = 0 # Perturbações seguidas sem melhora
+    while stale < patience and time.perf_counter() < deadline:
+        assigned = list(best[1])
+        ia, ib, ic = fixed
+        for i in movable:
+            da, db, dc = contribution(phasors[i], assigned[i])
+            ia, ib, ic = ia + da, ib + db, ic + dc
+        for i in rng.sample(movable, min(kick, len(movable))):
+            option = rng.choice(OPTIONS[original[i]])
+            old, new = contribution(phasors[i], assigned[i]), contribution(phasors[i], option)
+            assigned[i] = option
+            ia, ib, ic = ia + new[0] - old[0], ib + new[1] - old[1], ic + new[2] - old[2]
+        ia, ib, ic, value = improve(assigned, ia, ib, ic)
+        if value < best[0] - 1e-12:
+            best = (value, list(assigned))
+            stale = 0
+        else:
+            stale += 1
+
+    return BalanceResult(best[1], original, before, best[0], moves)
+
+def exhaustive(score, phasors, original, movable, fixed, before):
+    # Ótimo exato para poucas cargas móveis; em empate fica a distribuição original
+    contributions = [[(option, contribution(phasors[i], option)) for option in OPTIONS[original[i]]] for i in movable]
+    best = (before, [original[i] for i in movable])
+    for choice in itertools.product(*contributions):
+        ia, ib, ic = fixed
+        for _, (da, db, dc) in choice:
+            ia, ib, ic = ia + da, ib + db, ic + dc
+        value = score(ia, ib, ic)
+        if value < best[0] - 1e-12:
+            best = (value, [option for option, _ in choice])
+    assigned = list(original)
+    for i, option in zip(movable, best[1]):
+        assigned[i] = option
+    return BalanceResult(assigned, original, before, best[0], 0)
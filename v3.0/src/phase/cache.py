@@ -0,0 +1,132 @@
+"""Cache de resultados do solver, indexado pelo conteúdo do quadro de cargas.
+
+A chave é um hash BLAKE2b das colunas que o solver usa (potência, FP, tipo
+e conexão, na ordem das linhas) e da tensão de linha ou da Source: nomes e
+ids não entram, então o mesmo quadro reaberto ou exportado com outros
+nomes cai na mesma entrada. Cada entrada guarda o dict de resultados e as
+correntes por carga (na ordem das linhas).
+
+Usado pela linha de comando e pelo processamento em lote. A interface não
+usa o cache: lá os totais vêm do acumulador incremental em O(1), e o hash
+O(n) de cada atualização só custaria tempo.
+
+A memória é um LRU limitado a `maxsize` entradas. Com `directory`, as
+entradas também são gravadas em disco (um .npz por chave), o que torna
+quase gratuitas as reexecuções em lote de quadros que não mudaram.
+"""
+import hashlib
+import json
+import os
+import struct
+from collections import OrderedDict
+from pathlib import Path
+
+from phase.core import Source, build_results, pack_loads, solve_arrays
+
+KEY_VERSION = b'phase-solve-1' # Mudar invalida as entradas gravadas em disco
+
+class SolveCache:
+    def __init__(self, maxsize=128, directory=None):
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory else None
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0 # Incluídos em `hits`
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries or (self.directory is not None and self._path(key).exists())
+
+    @staticmethod
+    def key(loads, line_voltage):
+        import numpy as np
+        power, pf, sign, conn = pack_loads(loads)
+        digest = hashlib.blake2b(KEY_VERSION, digest_size=16)
+        if isinstance(line_voltage, Source):
+            digest.update(b'S' + struct.pack('<6d', *line_voltage))
+            digest.update(struct.pack('<q', len(power)))
+        else:
+            digest.update(struct.pack('<dq', float(line_voltage), len(power)))
+        for column, dtype in ((power, '<f8'), (pf, '<f8'), (sign, '<f8'), (conn, 'u1')):
+            digest.update(np.ascontiguousarray(column, dtype=dtype).data)
+        return digest.hexdigest()
+
+    def get(self, key):
+        # (resultados, correntes) ou None
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        if self.directory is not None:
+            entry = self._read(key)
+            if entry is not None:
+                self._store(key, entry)
+                self.hits += 1
+                self.disk_hits += 1
+                return entry
+        self.misses += 1
+        return None
+
+    def put(self, key, results, currents):
+        entry = (results, currents)
+        self._store(key, entry)
+        if self.directory is not None:
+            self._write(key, entry)
+
+    def solve(self, loads, line_voltage):
+        # Resultados e correntes por carga, calculados só se não estiverem no cache
+        key = self.key(loads, line_voltage)
+        entry = self.get(key)
+        if entry is None:
+            currents, totals, total_p, total_q = solve_arrays(*pack_loads(loads), line_voltage)
+            entry = (build_results(*totals, total_p, total_q), currents)
+            self.put(key, *entry)
+        return entry
+
+    def stats(self):
+        return {'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+    def clear(self):
+        # Limpa só a memória; as entradas em disco continuam válidas
+        self._entries.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _path(self, key):
+        return self.directory / f'{key}.npz'
+
+    def _read(self, key):
+        import numpy as np
+        try:
+            with np.load(self._path(key), allow_pickle=False) as data:
+                results = json.loads(str(data['results']))
+                currents = data['currents']
+        except (OSError, KeyError, ValueError):
+            return None # Ausente ou corrompida: recalcula
+        for label in ('Ia', 'Ib', 'Ic', 'In'):
+            results[label] = tuple(results[label])
+        return results, currents
+
+    def _write(self, key, entry):
+        import numpy as np
+        results, currents = entry
+        path = self._path(key)
+        tmp = path.with_name(f'{path.stem}.{os.getpid()}.tmp.npz')
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            np.savez(tmp, results=np.array(json.dumps(results)), currents=np.asarray(currents, dtype=float))
+            os.replace(tmp, path) # Vários processos do CLI podem gravar a mesma chave
+        except OSError:
+            pass # O cache em disco é opcional: falhar ao gravar não interrompe o cálculo
+        finally:
+            if tmp.exists():
+                tmp.unlink()
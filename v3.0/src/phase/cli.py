@@ -0,0 +1,122 @@
+"""Linha de comando: resolve quadros de cargas sem abrir a interface.
+
+    python -m phase quadro1.csv quadro2.xlsx -V 380 -f csv -o resultados.csv
+    python -m phase quadro.csv --phase-voltages 223 218 215 --phase-angles 0 -121 119.5
+
+Sem arquivos, `python -m phase` abre a interface gráfica. Com vários
+arquivos, cada um é resolvido em um processo separado.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from phase.cache import SolveCache
+from phase.core import Source, check_source, solve
+from phase.importer import read_loads
+
+RESULT_KEYS = ('Ia', 'Ib', 'Ic', 'In', 'P_total', 'Q_total', 'S_total', 'PF_total')
+
+def solve_file(path, line_voltage, cache_dir=None):
+    try:
+        loads, errors = read_loads(path)
+    except (OSError, ImportError, ValueError, UnicodeDecodeError) as e:
+        return {'file': str(path), 'error': str(e)}
+    report = {
+        'file': str(path),
+        'loads': len(loads),
+        'rejected': [{'row': row, 'error': message} for row, message in errors],
+    }
+    if cache_dir is None:
+        report['results'] = solve(loads, line_voltage)
+    else:
+        # Cada processo tem o seu SolveCache; o que é compartilhado é o disco
+        cache = SolveCache(maxsize=1, directory=cache_dir)
+        report['results'], _ = cache.solve(loads, line_voltage)
+        report['cached'] = cache.hits > 0
+    return report
+
+def solve_files(paths, line_voltage, jobs=None, cache_dir=None):
+    if len(paths) == 1 or jobs == 1:
+        return [solve_file(path, line_voltage, cache_dir) for path in paths]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(solve_file, paths, [line_voltage] * len(paths), [cache_dir] * len(paths)))
+
+def write_json(reports, out):
+    json.dump(reports, out, ensure_ascii=False, indent=2)
+    out.write('\n')
+
+def write_csv(reports, out):
+    header = ['file', 'loads', 'rejected']
+    for key in RESULT_KEYS:
+        header += [f'{key}_mag', f'{key}_ang'] if key in ('Ia', 'Ib', 'Ic', 'In') else [key]
+    header.append('error')
+    writer = csv.writer(out)
+    writer.writerow(header)
+    for report in reports:
+        if 'error' in report:
+            writer.writerow([report['file'], '', ''] + [''] * (len(header) - 4) + [report['error']])
+            continue
+        row = [report['file'], report['loads'], len(report['rejected'])]
+        for key in RESULT_KEYS:
+            value = report['results'][key]
+            row += list(value) if isinstance(value, tuple) else [value]
+        row.append('')
+        writer.writerow(row)
+
+def positive_float(text):
+    value = float(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError('a tensão de linha deve ser um valor positivo')
+    return value
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='phase', description='Calculadora de fasores de corrente.')
+    parser.add_argument('files', nargs='*', help='quadros de cargas (.csv ou .xlsx); sem arquivos abre a interface')
+    parser.add_argument('-V', '--line-voltage', type=positive_float, default=220.0, help='tensão de linha em volts (padrão: 220)')
+    parser.add_argument('-f', '--format', choices=('json', 'csv'), default='json', help='formato da saída (padrão: json)')
+    parser.add_argument('-o', '--output', help='arquivo de saída (padrão: saída padrão)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='processos em paralelo (padrão: número de CPUs)')
+    parser.add_argument('--cache', metavar='DIR', help='pasta de cache dos resultados; quadros que não mudaram não são recalculados')
+    parser.add_argument('--phase-voltages', nargs=3, type=float, metavar=('VA', 'VB', 'VC'),
+                        help='tensões fase-neutro da fonte desequilibrada (substitui -V)')
+    parser.add_argument('--phase-angles', nargs=3, type=float, metavar=('A', 'B', 'C'), default=(0.0, -120.0, 120.0),
+                        help='ângulos das tensões de fase em graus (padrão: 0 -120 120)')
+    return parser
+
+def source_from_args(parser, args):
+    # Source com --phase-voltages, ou a tensão de linha (fonte equilibrada)
+    if args.phase_voltages is None:
+        return args.line_voltage
+    source = Source(*args.phase_voltages, *args.phase_angles)
+    message = check_source(source)
+    if message:
+        parser.error(message)
+    return source
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.files:
+        from phase.app import main as gui_main
+        gui_main()
+        return 0
+
+    reports = solve_files(args.files, source_from_args(parser, args), args.jobs or os.cpu_count(), args.cache)
+    write = write_json if args.format == 'json' else write_csv
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as out:
+            write(reports, out)
+    else:
+        write(reports, sys.stdout)
+
+    if args.cache:
+        hits = sum(report.get('cached', False) for report in reports)
+        print(f'cache: {hits} acerto(s), {len(reports) - hits} falha(s)', file=sys.stderr)
+
+    failed = [report for report in reports if 'error' in report]
+    for report in failed:
+        print(f"{report['file']}: {report['error']}", file=sys.stderr)
+    return 1 if failed else 0
@@ -0,0 +1,326 @@
+"""Cálculo fasorial das correntes, sem dependência de Tkinter ou Matplotlib.
+
+O NumPy só é importado na primeira chamada do caminho vetorizado, para que a
+interface (que usa o caminho escalar) abra sem carregá-lo.
+
+Uso típico::
+
+    from phase.core import solve
+    res = solve(loads, 380)
+    res['In']   # (magnitude, ângulo)
+"""
+import functools
+import math
+from typing import NamedTuple, TypedDict
+
+# Helpers
+
+def polar_to_complex(mag, ang_deg):
+    ang_rad = math.radians(ang_deg)
+    return mag * (math.cos(ang_rad) + 1j * math.sin(ang_rad))
+
+def complex_to_polar(z):
+    mag = abs(z)
+    ang = math.degrees(math.atan2(z.imag, z.real))
+    if ang > 180:
+        ang -= 360
+    if ang <= -180:
+        ang += 360
+    return mag, ang
+
+# Vectorized solver
+
+# Connection-type codes for packed load arrays
+CONN_NONE, CONN_AN, CONN_BN, CONN_CN, CONN_AB, CONN_BC, CONN_CA, CONN_ABC = range(8)
+
+# Condutores de cada conexão, na ordem usada pelo formulário (A, B, C, N)
+CONN_PHASES = (
+    (),
+    ('A', 'N'), ('B', 'N'), ('C', 'N'),
+    ('A', 'B'), ('B', 'C'), ('A', 'C'),
+    ('A', 'B', 'C'),
+)
+
+_A = polar_to_complex(1, 120)
+
+# Per-connection contribution of the load phasor to (Ia, Ib, Ic), with the
+# phase-angle offset already folded in (0/-120/+120 for 1φ, 30/-90/150 for 2φ)
+CONN_COEFFS = (
+    (0, 0, 0),
+    (polar_to_complex(1, 0), 0, 0),
+    (0, polar_to_complex(1, -120), 0),
+    (0, 0, polar_to_complex(1, 120)),
+    (polar_to_complex(1, 30), -polar_to_complex(1, 30), 0),
+    (0, polar_to_complex(1, -90), -polar_to_complex(1, -90)),
+    (-polar_to_complex(1, 150), 0, polar_to_complex(1, 150)),
+    (1, _A**2, _A),
+)
+
+# Voltage across the load as a multiple of the line voltage
+CONN_VOLTAGE = (
+    math.inf,
+    1 / math.sqrt(3), 1 / math.sqrt(3), 1 / math.sqrt(3),
+    1.0, 1.0, 1.0,
+    math.sqrt(3),
+)
+
+@functools.cache
+def conn_arrays():
+    # (CONN_COEFFS, CONN_VOLTAGE) como arrays NumPy, criados no primeiro uso
+    import numpy as np
+    return np.array(CONN_COEFFS, dtype=complex), np.array(CONN_VOLTAGE)
+
+# Voltage source
+
+class Source(NamedTuple):
+    # Fonte trifásica desequilibrada: tensões fase-neutro (V) e ângulos (graus)
+    va: float
+    vb: float
+    vc: float
+    angle_a: float = 0.0
+    angle_b: float = -120.0
+    angle_c: float = 120.0
+
+    @classmethod
+    def balanced(cls, line_voltage):
+        v = line_voltage / math.sqrt(3)
+        return cls(v, v, v)
+
+    def phasors(self):
+        # Tabela de rotação: Van, Vbn, Vcn, Vab, Vbc, Vca
+        van = polar_to_complex(self.va, self.angle_a)
+        vbn = polar_to_complex(self.vb, self.angle_b)
+        vcn = polar_to_complex(self.vc, self.angle_c)
+        return van, vbn, vcn, van - vbn, vbn - vcn, vcn - van
+
+    def line_voltages(self):
+        return tuple(abs(v) for v in self.phasors()[3:])
+
+    @property
+    def line_voltage(self):
+        # Tensão de linha média, usada onde o cálculo supõe fonte equilibrada
+        return sum(self.line_voltages()) / 3
+
+    def unbalance(self):
+        # Desequilíbrio (%): maior desvio das tensões de linha em relação à média
+        line_voltages = self.line_voltages()
+        mean = sum(line_voltages) / 3
+        return 100 * max(abs(v - mean) for v in line_voltages) / mean
+
+def check_source(source):
+    if min(source.va, source.vb, source.vc) <= 0:
+        return 'As tensões de fase devem ser valores positivos.'
+    if min(source.line_voltages()) < 1e-6 * max(source.va, source.vb, source.vc):
+        return 'Duas fases com a mesma tensão e ângulo (tensão de linha nula).'
+    return None
+
+@functools.lru_cache(maxsize=64)
+def source_coeffs(source):
+    # Como (CONN_COEFFS, CONN_VOLTAGE), mas em A por VA de conj(S) e em volts,
+    # para uma tensão de linha (fonte equilibrada) ou uma Source. Calculado
+    # uma vez por fonte; todas as cargas só indexam a tabela
+    if not isinstance(source, Source):
+        voltages = tuple(k * source for k in CONN_VOLTAGE)
+        return tuple(tuple(k / v for k in ks) for ks, v in zip(CONN_COEFFS, voltages)), voltages
+
+    # I = conj(S / V) = conj(S) / conj(V); carga trifásica em triângulo, S/3 em cada ramo
+    van, vbn, vcn, vab, vbc, vca = phasors = source.phasors()
+    ya, yb, yc, yab, ybc, yca = (1 / v.conjugate() for v in phasors)
+    coeffs = (
+        (0, 0, 0),
+        (ya, 0, 0), (0, yb, 0), (0, 0, yc),
+        (yab, -yab, 0), (0, ybc, -ybc), (-yca, 0, yca),
+        ((yab - yca) / 3, (ybc - yab) / 3, (yca - ybc) / 3),
+    )
+    # Tensão equivalente para a corrente de cada carga (trifásica: √3 × média das de linha)
+    line_voltage = (abs(vab) + abs(vbc) + abs(vca)) / 3
+    voltages = (math.inf, abs(van), abs(vbn), abs(vcn), abs(vab), abs(vbc), abs(vca), math.sqrt(3) * line_voltage)
+    return coeffs, voltages
+
+@functools.lru_cache(maxsize=64)
+def source_arrays(source):
+    # source_coeffs como arrays NumPy (não modificar: são compartilhados)
+    import numpy as np
+    coeffs, voltages = source_coeffs(source)
+    return np.array(coeffs, dtype=complex), np.array(voltages)
+
+# Validation (mesmas regras da entrada manual de cargas)
+# Cada função devolve a mensagem de erro ou None se a carga for válida
+
+def check_load(power, pf):
+    # nan/inf numa única linha tornariam todos os totais nan
+    if not math.isfinite(power):
+        return 'A Potência Ativa deve ser um número finito.'
+    if not (0 <= pf <= 1):
+        return 'O Fator de Potência deve estar entre 0 e 1.'
+    if pf == 0 and power != 0:
+        return 'Fator de Potência não pode ser zero se a Potência Ativa não for zero.'
+    return None
+
+def check_phases(phases):
+    num_phases_selected = len([p for p in phases if p in ["A", "B", "C"]])
+
+    if num_phases_selected == 1 and "N" in phases:
+        # Single-phase load (e.g., R-N)
+        return None
+    elif num_phases_selected == 1 and "N" not in phases:
+        # If only one phase selected without Neutral, assume it's a single-phase load to Neutral
+        return "Selecione pelo menos mais um condutor (Neutro ou outra fase)."
+    elif num_phases_selected == 2 and "N" not in phases:
+        # Two-phase load (e.g., A-B for an inverter)
+        # For a load connected between two phases, the voltage across it is the line-to-line voltage.
+        return None
+    elif num_phases_selected == 2 and "N" in phases:
+        # Two phases selected along with Neutral is not a standard configuration
+        # It indicates a unbalanced load but is not typically used for simplified calculations.
+        return "Tipo de Carga inválida para cálculo simplificado com duas fases e Neutro."
+    elif num_phases_selected == 3 and "N" not in phases:
+        # Three-phase load (e.g., A-B-C)
+        return None
+    elif num_phases_selected == 3 and "N" in phases:
+        # Three phases along with Neutral is not a standard configuration for load connection.
+        return "Tipo de Carga inválida para cálculo simplificado com três fases e Neutro."
+    return "Combinação de fases não suportada para cálculo de corrente simplificado. Por favor, selecione uma fase e Neutro, duas fases (sem Neutro), ou A, B e C (sem Neutro) para trifásico."
+
+def connection_code(phases):
+    lines = ''.join(sorted(p for p in phases if p in ('A', 'B', 'C')))
+    if len(lines) == 1:
+        # Uma fase sem neutro é calculada como fase-neutro
+        return {'A': CONN_AN, 'B': CONN_BN, 'C': CONN_CN}[lines]
+    if 'N' in phases:
+        return CONN_NONE
+    return {'AB': CONN_AB, 'BC': CONN_BC, 'AC': CONN_CA, 'ABC': CONN_ABC}.get(lines, CONN_NONE)
+
+def pack_loads(loads):
+    if hasattr(loads, 'arrays'):
+        return loads.arrays() # LoadTable: as colunas já estão prontas
+    import numpy as np
+    n = len(loads)
+    power = np.fromiter((load['power'] for load in loads), dtype=float, count=n)
+    pf = np.fromiter((load['pf'] for load in loads), dtype=float, count=n)
+    sign = np.fromiter((1.0 if load['pf_type'] == 'Indutivo' else -1.0 for load in loads), dtype=float, count=n)
+    conn = np.fromiter((connection_code(load['phases']) for load in loads), dtype=np.uint8, count=n)
+    return power, pf, sign, conn
+
+def load_fields(load):
+    sign = 1.0 if load['pf_type'] == 'Indutivo' else -1.0
+    return float(load['power']), float(load['pf']), sign, connection_code(load['phases'])
+
+def load_power(power, pf, sign):
+    # Potência aparente com sinal, conj(S) = P - jQ e Q de uma carga; FP = 0
+    # não gera corrente
+    if pf == 0:
+        return 0.0, 0j, 0.0
+    apparent = abs(power / pf)
+    q = sign * abs(power) * math.sqrt(max(1 - pf * pf, 0.0)) / pf
+    return (apparent if power >= 0 else -apparent), complex(power, -q), q
+
+def load_terms(power, pf, sign, conn, line_voltage):
+    # Versão escalar de solve_arrays para uma única carga
+    coeffs, voltages = source_coeffs(line_voltage)
+    apparent, s, q = load_power(power, pf, sign)
+    ka, kb, kc = coeffs[conn]
+    return apparent / voltages[conn], (s * ka, s * kb, s * kc), power, q
+
+def load_powers(power, pf, sign):
+    # Versão vetorizada de load_power
+    import numpy as np
+    nonzero_pf = pf != 0
+    apparent = np.abs(np.divide(power, pf, out=np.zeros_like(power), where=nonzero_pf))
+    apparent *= np.where(power >= 0, 1.0, -1.0)
+    sin_phi = np.sqrt(np.clip(1 - pf**2, 0.0, None))
+    tan_phi = np.divide(sin_phi, pf, out=np.zeros_like(pf), where=nonzero_pf)
+    q = sign * np.abs(power) * tan_phi
+    return apparent, np.where(nonzero_pf, power, 0.0) - 1j * q, q
+
+def load_phasors(power, pf, sign, conn, line_voltage):
+    # Corrente com sinal, fasor de referência (antes do deslocamento da
+    # conexão) e potência reativa de cada carga
+    # sign: +1 indutivo, -1 capacitivo
+    import numpy as np
+    _, conn_voltage = conn_arrays()
+    nonzero_pf = pf != 0
+    apparent = np.divide(power, pf, out=np.zeros_like(power), where=nonzero_pf)
+    current_mag = np.abs(apparent) / (conn_voltage[conn] * line_voltage)
+    polarity = np.where(power >= 0, 1.0, -1.0)
+    currents = polarity * current_mag
+
+    sin_phi = np.sqrt(np.clip(1 - pf**2, 0.0, None))
+    tan_phi = np.divide(sin_phi, pf, out=np.zeros_like(pf), where=nonzero_pf)
+    q = sign * np.abs(power) * tan_phi
+
+    # I∠(±φ) para potência positiva, I∠(180 ∓ φ) para negativa
+    phasors = currents * (pf - 1j * sign * polarity * sin_phi)
+    return currents, phasors, q
+
+def solve_arrays(power, pf, sign, conn, line_voltage):
+    # line_voltage: tensão de linha (fonte equilibrada) ou Source
+    import numpy as np
+    coeffs, voltages = source_arrays(line_voltage)
+    apparent, s, q = load_powers(power, pf, sign)
+    currents = apparent / voltages[conn]
+    total_p = float(power.sum())
+    total_q = float(q.sum())
+
+    # Soma conj(S) por tipo de conexão e depois distribui nos condutores
+    by_conn = (np.bincount(conn, weights=s.real, minlength=len(coeffs))
+               + 1j * np.bincount(conn, weights=s.imag, minlength=len(coeffs)))
+    total_ia, total_ib, total_ic = (by_conn @ coeffs).tolist()
+    return currents, (total_ia, total_ib, total_ic), total_p, total_q
+
+def batch_coeffs(conn, line_voltage):
+    # Partes real e imaginária (cargas × 3) da contribuição de cada carga a
+    # Ia/Ib/Ic por W, com 1/V da conexão embutido
+    import numpy as np
+    coeffs, _ = source_arrays(line_voltage)
+    coeffs = coeffs[conn]
+    return np.ascontiguousarray(coeffs.real), np.ascontiguousarray(coeffs.imag)
+
+def batch_sums(p, q, coeffs_re, coeffs_im):
+    # Ia/Ib/Ic (lotes × 3) para P e Q em lotes × cargas. O fasor de cada carga
+    # é conj(S) / V = (P - jQ) / V, então as somas viram produtos de matrizes
+    # reais
+    return (p @ coeffs_re + q @ coeffs_im) + 1j * (p @ coeffs_im - q @ coeffs_re)
+
+class Results(TypedDict):
+    Ia: tuple[float, float]
+    Ib: tuple[float, float]
+    Ic: tuple[float, float]
+    In: tuple[float, float]
+    P_total: float
+    Q_total: float
+    S_total: float
+    PF_total: float
+
+def build_results(total_ia, total_ib, total_ic, total_p, total_q) -> Results:
+    total_in_resultant = -(total_ia + total_ib + total_ic)
+
+    total_s = math.sqrt(total_p**2 + total_q**2)
+    total_pf = total_p / total_s if total_s != 0 else 0.0
+
+    return {
+        'Ia': complex_to_polar(total_ia),
+        'Ib': complex_to_polar(total_ib),
+        'Ic': complex_to_polar(total_ic),
+        'In': complex_to_polar(total_in_resultant),
+        'P_total': total_p,
+        'Q_total': total_q,
+        'S_total': total_s,
+        'PF_total': total_pf
+    }
+
+def solve(loads, line_voltage) -> Results:
+    _, (total_ia, total_ib, total_ic), total_p, total_q = solve_arrays(*pack_loads(loads), line_voltage)
+    return build_results(total_ia, total_ib, total_ic, total_p, total_q)
+
+def sweep(loads, voltages):
+    # Ia/Ib/Ic/In complexos (colunas) para cada tensão de linha em
+    # `voltages` (linhas). Todas as correntes são proporcionais a 1/V, então
+    # basta resolver uma vez para V = 1 e dividir
+    import numpy as np
+    voltages = np.asarray(voltages, dtype=float)
+    if np.any(voltages <= 0):
+        raise ValueError('A tensão de linha deve ser um valor positivo.')
+    _, (total_ia, total_ib, total_ic), _, _ = solve_arrays(*pack_loads(loads), 1.0)
+    unit = np.array([total_ia, total_ib, total_ic, -(total_ia + total_ib + total_ic)])
+    return unit / voltages[..., None]
@@ -0,0 +1,199 @@
+"""Correntes harmônicas: espectro por carga e somas fasoriais por ordem.
+
+Cada carga referencia um espectro pelo nome (SPECTRA): para cada ordem h,
+a razão entre |Ih| e |I1| e o ângulo (graus) em relação à fundamental. A
+corrente de ordem h de um ramo da carga é
+
+    Ih = razão · |I1| ∠ (ângulo + h · arg I1)
+
+então a rotação de cada fase também é multiplicada por h: as ordens 3, 9,
+15... ficam em fase nas três fases (sequência zero, somam no neutro), as
+5, 11... giram ao contrário (sequência negativa) e as 7, 13... como a
+fundamental. Cargas trifásicas são triângulos (como em core.source_coeffs),
+então as triplas circulam no triângulo e não aparecem na linha.
+
+O cálculo é uma matriz cargas não lineares × ordens: o fator |S| ∠
+h·arg conj(S) de cada carga é somado por conexão e espectro, multiplicado
+pelo espectro e por uma tabela conexão × ordem × condutor montada uma vez
+por fonte. Cargas lineares entram só na ordem 1.
+
+    from phase.harmonics import solve_harmonics
+    res = solve_harmonics(loads, 380)
+    res.rms(), res.thd()    # Ia, Ib, Ic, In
+
+O NumPy só é importado no primeiro uso.
+"""
+import functools
+import math
+
+from phase.core import CONN_PHASES, Source, load_powers, pack_loads
+
+LABELS = ('Ia', 'Ib', 'Ic', 'In')
+LINEAR = 'Linear'
+MAX_ORDER = 50
+
+# Espectros típicos de corrente: ordem -> (|Ih| / |I1|, ângulo em graus).
+# A ordem 1 é sempre (1, 0)
+SPECTRA = {
+    LINEAR: {1: (1.0, 0.0)},
+    'Fonte chaveada (monofásica)': {
+        1: (1.0, 0.0), 3: (0.81, 0.0), 5: (0.61, 0.0), 7: (0.37, 0.0), 9: (0.16, 0.0),
+        11: (0.05, 0.0), 13: (0.05, 0.0), 15: (0.04, 0.0),
+    },
+    'Iluminação LED': {
+        1: (1.0, 0.0), 3: (0.70, 0.0), 5: (0.40, 0.0), 7: (0.20, 0.0), 9: (0.10, 0.0), 11: (0.05, 0.0),
+    },
+    'Inversor de frequência (6 pulsos)': {
+        1: (1.0, 0.0), 5: (0.35, 0.0), 7: (0.12, 0.0), 11: (0.07, 0.0), 13: (0.05, 0.0),
+        17: (0.03, 0.0), 19: (0.02, 0.0), 23: (0.015, 0.0), 25: (0.01, 0.0),
+    },
+    'Retificador (12 pulsos)': {
+        1: (1.0, 0.0), 11: (0.09, 0.0), 13: (0.07, 0.0), 23: (0.02, 0.0), 25: (0.02, 0.0),
+    },
+}
+
+BUILTIN_SPECTRA = frozenset(SPECTRA)
+
+# Ramos de cada conexão: (fasor de Source.phasors(), condutor de entrada,
+# de saída (-1 = neutro), fração da potência)
+CONN_BRANCHES = (
+    (),
+    ((0, 0, -1, 1.0),), ((1, 1, -1, 1.0),), ((2, 2, -1, 1.0),),
+    ((3, 0, 1, 1.0),), ((4, 1, 2, 1.0),), ((5, 2, 0, 1.0),),
+    ((3, 0, 1, 1 / 3), (4, 1, 2, 1 / 3), (5, 2, 0, 1 / 3)),
+)
+
+def check_spectrum(spectrum):
+    for order, (ratio, angle) in spectrum.items():
+        if not isinstance(order, int) or not 1 <= order <= MAX_ORDER:
+            return f'Ordem harmônica inválida: {order!r} (1 a {MAX_ORDER}).'
+        if not ratio >= 0 or not math.isfinite(angle):
+            return f'Valor inválido na ordem {order}.'
+    if spectrum.get(1, (1.0, 0.0)) != (1.0, 0.0):
+        return 'A ordem 1 (fundamental) deve ser (1, 0).'
+    return None
+
+def register_spectrum(name, spectrum):
+    # Espectro adicional (ex.: medido em campo); substitui um de mesmo nome
+    spectrum = {int(order): (float(ratio), float(angle)) for order, (ratio, angle) in spectrum.items()}
+    spectrum.setdefault(1, (1.0, 0.0))
+    message = check_spectrum(spectrum)
+    if message:
+        raise ValueError(message)
+    SPECTRA[name] = dict(sorted(spectrum.items()))
+    spectrum_table.cache_clear()
+
+@functools.lru_cache(maxsize=32)
+def spectrum_table(names, orders):
+    # (espectros × ordens) complexos razão ∠ ângulo
+    import numpy as np
+    table = np.zeros((len(names), len(orders)), dtype=complex)
+    columns = {order: i for i, order in enumerate(orders)}
+    for row, name in enumerate(names):
+        try:
+            spectrum = SPECTRA[name]
+        except KeyError:
+            raise ValueError(f'Espectro harmônico desconhecido: {name!r}.') from None
+        for order, (ratio, angle) in spectrum.items():
+            table[row, columns[order]] = ratio * np.exp(1j * np.radians(angle))
+    return table
+
+@functools.lru_cache(maxsize=32)
+def branch_table(source, orders):
+    # (conexões × ordens × 3): corrente em Ia/Ib/Ic por VA de |S|∠h·arg conj(S)
+    # em cada ordem, com a rotação h · arg V de cada ramo
+    import numpy as np
+    if not isinstance(source, Source):
+        source = Source.balanced(source)
+    phasors = source.phasors()
+    orders = np.asarray(orders, dtype=float)
+    table = np.zeros((len(CONN_PHASES), len(orders), 3), dtype=complex)
+    for conn, branches in enumerate(CONN_BRANCHES):
+        for phasor, start, end, share in branches:
+            voltage = phasors[phasor]
+            # I1 = conj(S) / conj(V): |I1| = |S| / |V|, arg I1 = arg conj(S) + arg V
+            rotation = share / abs(voltage) * np.exp(1j * orders * math.atan2(voltage.imag, voltage.real))
+            table[conn, :, start] += rotation
+            if end >= 0:
+                table[conn, :, end] -= rotation
+    return table
+
+def pack_spectra(loads):
+    # (índice do espectro por carga, nomes dos espectros)
+    import numpy as np
+    if hasattr(loads, 'spectra'):
+        return loads.column('spectrum'), tuple(loads.spectra) # LoadTable
+    names = {}
+    indices = [names.setdefault(load.get('spectrum', LINEAR), len(names)) for load in loads]
+    return np.array(indices, dtype=np.uint8), tuple(names) or (LINEAR,)
+
+class HarmonicResult:
+    def __init__(self, orders, currents):
+        self.orders = orders # (ordens,)
+        self.currents = currents # (ordens, 4) complexos: Ia, Ib, Ic, In
+
+    def order(self, h):
+        # Ia/Ib/Ic/In complexos da ordem h (zeros se não houver)
+        import numpy as np
+        index = np.flatnonzero(self.orders == h)
+        return self.currents[index[0]] if len(index) else np.zeros(4, dtype=complex)
+
+    def rms(self):
+        import numpy as np
+        return np.sqrt((np.abs(self.currents) ** 2).sum(axis=0))
+
+    def thd(self):
+        # Distorção harmônica total (%) em relação à fundamental; inf quando só
+        # há harmônicas (ex.: neutro com cargas equilibradas)
+        import numpy as np
+        magnitudes = np.abs(self.currents)
+        fundamental = magnitudes[self.orders == 1].sum(axis=0)
+        distortion = np.sqrt((magnitudes[self.orders > 1] ** 2).sum(axis=0))
+        # Resíduos de arredondamento das somas contam como zero
+        tolerance = 1e-12 * magnitudes.max(initial=0.0)
+        thd = np.divide(100 * distortion, fundamental, out=np.zeros(4), where=fundamental > tolerance)
+        return np.where((fundamental <= tolerance) & (distortion > tolerance), np.inf, thd)
+
+    def is_linear(self):
+        return bool(len(self.orders) == 1)
+
+def solve_harmonics(loads, line_voltage):
+    # line_voltage: tensão de linha (fonte equilibrada) ou Source
+    import numpy as np
+    power, pf, sign, conn = pack_loads(loads)
+    indices, names = pack_spectra(loads)
+    orders = tuple(sorted({1}.union(*(SPECTRA[name] for name in names if name in SPECTRA))))
+    spectra = spectrum_table(names, orders)
+    if not len(power):
+        return HarmonicResult(np.array(orders), np.zeros((len(orders), 4), dtype=complex))
+
+    _, s, _ = load_powers(power, pf, sign) # conj(S) de cada carga
+
+    # Cargas lineares só têm a ordem 1: somadas por conexão sem passar pela matriz
+    by_conn = np.zeros((len(CONN_PHASES), len(orders)), dtype=complex)
+    nonlinear = np.any(spectra[:, 1:] != 0, axis=1)[indices]
+    linear = ~nonlinear
+    by_conn[:, 0] = (np.bincount(conn[linear], weights=s.real[linear], minlength=len(CONN_PHASES))
+                     + 1j * np.bincount(conn[linear], weights=s.imag[linear], minlength=len(CONN_PHASES)))
+    if nonlinear.any():
+        # Cargas ordenadas por (conexão, espectro) para somar cada grupo de uma vez
+        groups = conn[nonlinear].astype(np.intp) * len(names) + indices[nonlinear]
+        order = np.argsort(groups, kind='stable')
+        groups, s = groups[order], s[nonlinear][order]
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+
+        # |S| ∠ h·arg conj(S) como potências sucessivas do fasor unitário
+        # (produtos em vez de um exp por carga e ordem)
+        magnitude = np.abs(s)
+        unit = np.divide(s, magnitude, out=np.ones_like(s), where=magnitude > 0)
+        rotations = np.cumprod(np.broadcast_to(unit[:, None], (len(s), orders[-1])), axis=1)
+        loads_orders = magnitude[:, None] * rotations[:, np.array(orders) - 1]
+
+        # O espectro é aplicado uma vez por grupo, depois da soma
+        by_group = np.zeros((len(CONN_PHASES) * len(names), len(orders)), dtype=complex)
+        by_group[groups[starts]] = np.add.reduceat(loads_orders, starts, axis=0)
+        by_conn += (by_group.reshape(len(CONN_PHASES), len(names), len(orders)) * spectra).sum(axis=1)
+
+    phases = np.einsum('ch,chk->hk', by_conn, branch_table(line_voltage, orders))
+    currents = np.concatenate([phases, -phases.sum(axis=1, keepdims=True)], axis=1)
+    return HarmonicResult(np.array(orders), currents)
@@ -0,0 +1,75 @@
+"""Histórico de desfazer/refazer.
+
+Cada passo guarda só o que mudou: para cada carga afetada, o id e a carga
+antes e depois (None quando não existia), e opcionalmente a tensão de linha
+antes e depois. Desfazer aplica o passo invertido, então o custo em memória
+e em tempo é proporcional à alteração, não ao tamanho do quadro.
+"""
+from collections import deque
+
+class Change:
+    def __init__(self, label, rows=(), voltage=None):
+        self.label = label
+        self.rows = list(rows) # (id, carga antes ou None, carga depois ou None)
+        self.voltage = voltage # (texto antes, texto depois) ou None
+
+    def inverse(self):
+        rows = [(load_id, after, before) for load_id, before, after in self.rows]
+        voltage = None if self.voltage is None else self.voltage[::-1]
+        return Change(self.label, rows, voltage)
+
+    def split(self):
+        # (removidas, adicionadas, alteradas) como listas de (id, carga)
+        removed, added, modified = [], [], []
+        for load_id, before, after in self.rows:
+            if after is None:
+                removed.append((load_id, before))
+            elif before is None:
+                added.append((load_id, after))
+            else:
+                modified.append((load_id, after))
+        return removed, added, modified
+
+    @classmethod
+    def added(cls, label, items):
+        return cls(label, [(load_id, None, load) for load_id, load in items])
+
+    @classmethod
+    def removed(cls, label, items):
+        return cls(label, [(load_id, load, None) for load_id, load in items])
+
+class History:
+    def __init__(self, limit=200):
+        self.undo_stack = deque(maxlen=limit)
+        self.redo_stack = []
+
+    def record(self, change):
+        self.undo_stack.append(change)
+        self.redo_stack.clear()
+
+    def undo(self):
+        # Passo a aplicar para desfazer (já invertido), ou None
+        if not self.undo_stack:
+            return None
+        change = self.undo_stack.pop()
+        self.redo_stack.append(change)
+        return change.inverse()
+
+    def redo(self):
+        if not self.redo_stack:
+            return None
+        change = self.redo_stack.pop()
+        self.undo_stack.append(change)
+        return change
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    @property
+    def undo_label(self):
+        return self.undo_stack[-1].label if self.undo_stack else None
+
+    @property
+    def redo_label(self):
+        return self.redo_stack[-1].label if self.redo_stack else None
@@ -0,0 +1,189 @@
+"""Importação de quadros de cargas a partir de planilhas CSV ou XLSX.
+
+As linhas são lidas uma a uma (sem carregar o arquivo inteiro) e validadas
+com as mesmas regras da entrada manual. Linhas inválidas não interrompem a
+leitura: o erro é registrado com o número da linha e a importação continua.
+
+Colunas reconhecidas (sem diferenciar maiúsculas; cabeçalhos em português
+também são aceitos):
+
+    name, power, pf, pf_type, phases, spectrum, length
+
+`pf` e `pf_type` são opcionais (padrão 1.0 e Indutivo). `phases` aceita
+formas como "A, N", "A-N", "AB", "A B C" ou "C, Neutro". `spectrum`, também
+opcional, é o nome de um espectro harmônico de phase.harmonics.SPECTRA
+(padrão Linear), e `length` o comprimento do circuito em metros para o
+dimensionamento (padrão: o da instalação).
+"""
+import csv
+import re
+from pathlib import Path
+
+from phase.core import check_load, check_phases
+from phase.harmonics import LINEAR, SPECTRA
+from phase.sizing import check_length
+
+COLUMNS = {
+    'name': 'name', 'nome': 'name', 'carga': 'name',
+    'power': 'power', 'potência': 'power', 'potencia': 'power', 'potência (w)': 'power', 'potencia (w)': 'power',
+    'pf': 'pf', 'fp': 'pf',
+    'pf_type': 'pf_type', 'tipo fp': 'pf_type', 'tipo_fp': 'pf_type',
+    'phases': 'phases', 'fases': 'phases', 'fase(s)': 'phases',
+    'spectrum': 'spectrum', 'espectro': 'spectrum', 'espectro harmônico': 'spectrum', 'espectro harmonico': 'spectrum',
+    'length': 'length', 'comprimento': 'length', 'comprimento (m)': 'length',
+}
+
+PF_TYPES = {
+    'indutivo': 'Indutivo', 'ind': 'Indutivo', 'i': 'Indutivo', 'inductive': 'Indutivo', 'lagging': 'Indutivo',
+    'capacitivo': 'Capacitivo', 'cap': 'Capacitivo', 'c': 'Capacitivo', 'capacitive': 'Capacitivo', 'leading': 'Capacitivo',
+}
+
+class ImportErrors(list):
+    # Lista de (linha, mensagem) com as linhas rejeitadas
+    def summary(self, limit=10):
+        lines = [f'Linha {row}: {message}' for row, message in self[:limit]]
+        if len(self) > limit:
+            lines.append(f'... e mais {len(self) - limit} linha(s) com erro.')
+        return '\n'.join(lines)
+
+def read_loads(path):
+    """Lê todas as cargas válidas de `path`; devolve (cargas, erros)."""
+    loads = []
+    errors = ImportErrors()
+    for row_number, result in iter_loads(path):
+        if isinstance(result, str):
+            errors.append((row_number, result))
+        else:
+            loads.append(result)
+    return loads, errors
+
+def iter_loads(path):
+    """Gera (linha, carga) ou (linha, mensagem de erro) para cada linha."""
+    rows = iter_rows(path)
+    try:
+        row_number, header = next(rows)
+    except StopIteration:
+        return
+    columns = [COLUMNS.get(str(cell or '').strip().lower()) for cell in header]
+    missing = {'name', 'power', 'phases'} - set(columns)
+    if missing:
+        yield row_number, f'Colunas obrigatórias ausentes: {", ".join(sorted(missing))}.'
+        return
+
+    for row_number, cells in rows:
+        fields = {column: cell for column, cell in zip(columns, cells) if column}
+        if all(cell is None or str(cell).strip() == '' for cell in fields.values()):
+            continue # Linha em branco
+        yield row_number, parse_load(fields)
+
+def iter_rows(path):
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in ('.xlsx', '.xlsm'):
+        yield from iter_xlsx_rows(path)
+    elif suffix in ('.csv', '.txt'):
+        yield from iter_csv_rows(path)
+    else:
+        raise ValueError(f'Formato de arquivo não suportado: {path.suffix}')
+
+def iter_csv_rows(path):
+    # utf-8-sig remove o BOM deixado pelo Excel
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=',;\t')
+        except csv.Error:
+            dialect = csv.excel
+        for row_number, row in enumerate(csv.reader(f, dialect), start=1):
+            yield row_number, row
+
+def iter_xlsx_rows(path):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportError('A leitura de arquivos .xlsx requer o pacote openpyxl (pip install openpyxl).') from None
+    # read_only percorre a planilha sem montar todas as células em memória
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        for row_number, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+            yield row_number, row
+    finally:
+        workbook.close()
+
+def parse_number(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().replace(' ', '')
+    if ',' in text and '.' not in text:
+        text = text.replace(',', '.') # Vírgula decimal
+    return float(text)
+
+def parse_phases(value):
+    phases = []
+    for token in re.split(r'[^A-Za-z]+', str(value).upper()):
+        if token in ('NEUTRO', 'NEUTRAL'):
+            token = 'N'
+        if not token:
+            continue
+        if set(token) - set('ABCN'):
+            raise ValueError(token)
+        phases.extend(p for p in token if p not in phases)
+    # Mesma ordem usada na entrada manual: A, B, C, N
+    return [p for p in 'ABCN' if p in phases]
+
+def parse_load(fields):
+    name = str(fields.get('name') or '').strip()
+    if not name:
+        return 'Nome da carga não informado.'
+
+    power = fields.get('power')
+    pf = fields.get('pf')
+    try:
+        power = parse_number(power)
+        pf = 1.0 if pf is None or str(pf).strip() == '' else parse_number(pf)
+    except (TypeError, ValueError):
+        return 'Potência ou Fator de Potência inválido.'
+
+    pf_type_raw = str(fields.get('pf_type') or 'Indutivo').strip().lower()
+    pf_type = PF_TYPES.get(pf_type_raw)
+    if pf_type is None:
+        return f'Tipo de Fator de Potência desconhecido: {pf_type_raw!r}.'
+
+    try:
+        phases = parse_phases(fields.get('phases') or '')
+    except ValueError as e:
+        return f'Fase desconhecida: {e}.'
+
+    error = check_load(power, pf) or check_phases(phases)
+    if error:
+        return error
+
+    load = {
+        "name": name,
+        "power": power,
+        "pf": pf,
+        "pf_type": pf_type,
+        "phases": phases,
+    }
+    spectrum_raw = str(fields.get('spectrum') or '').strip()
+    if spectrum_raw:
+        spectra = {spectrum.lower(): spectrum for spectrum in SPECTRA}
+        spectrum = spectra.get(spectrum_raw.lower())
+        if spectrum is None:
+            return f'Espectro harmônico desconhecido: {spectrum_raw!r}.'
+        if spectrum != LINEAR:
+            load["spectrum"] = spectrum
+    length_raw = fields.get('length')
+    if length_raw is not None and str(length_raw).strip() != '':
+        try:
+            length = parse_number(length_raw)
+        except ValueError:
+            return 'Comprimento inválido.'
+        error = check_length(length)
+        if error:
+            return error
+        if length:
+            load["length"] = length
+    return load
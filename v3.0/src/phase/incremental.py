@@ -0,0 +1,120 @@
+"""Somas acumuladas das correntes, atualizadas carga a carga.
+
+Cada carga contribui para Ia/Ib/Ic com conj(S) vezes um coeficiente que só
+depende da conexão e da fonte (core.source_coeffs). As somas de conj(S) são
+guardadas por tipo de conexão, de modo que adicionar, remover ou modificar
+uma carga custa O(1) e a troca da tensão de linha (ou da fonte) só troca a
+tabela de coeficientes.
+"""
+import math
+
+from phase.core import (CONN_PHASES, Results, Source, build_results, check_source, load_fields, load_power,
+                        load_powers, pack_loads, source_coeffs)
+
+class LoadAccumulator:
+    def __init__(self, line_voltage, resum_interval=4096):
+        self.line_voltage = line_voltage # Tensão de linha ou Source
+        self.resum_interval = resum_interval  # atualizações entre ressomas compensadas
+        self._terms = {}  # key -> (conn, potência aparente com sinal, conj(S), p, q)
+        self._sums = [0j] * len(CONN_PHASES) + [0.0, 0.0] # conj(S) por conexão, P, Q
+        self._updates = 0
+
+    def __len__(self):
+        return len(self._terms)
+
+    def __contains__(self, key):
+        return key in self._terms
+
+    def add(self, key, load):
+        if key in self._terms:
+            raise KeyError(f'Carga {key!r} já existe')
+        power, pf, sign, conn = load_fields(load)
+        apparent, s, q = load_power(power, pf, sign)
+        terms = (conn, apparent, s, power, q)
+        self._terms[key] = terms
+        self._apply(terms, 1)
+        return self.current(key)
+
+    def extend(self, items):
+        # Adiciona vários (key, load) de uma vez pelo caminho vetorizado
+        items = list(items)
+        self.extend_arrays([key for key, _ in items], *pack_loads([load for _, load in items]))
+
+    def extend_arrays(self, keys, power, pf, sign, conn):
+        # Mesmo que extend, a partir das colunas (ex.: LoadTable.arrays())
+        if len(set(keys)) != len(keys) or any(key in self._terms for key in keys):
+            raise KeyError('Cargas repetidas')
+        apparent, s, q = load_powers(power, pf, sign)
+        for key, *terms in zip(keys, conn.tolist(), apparent.tolist(), s.tolist(), power.tolist(), q.tolist()):
+            self._terms[key] = tuple(terms)
+        self.resum()
+
+    def remove(self, key):
+        self._apply(self._terms.pop(key), -1)
+        if not self._terms:
+            self.clear() # Sem cargas, descarta o resíduo de arredondamento (FP total seria arbitrário)
+
+    def replace(self, key, load):
+        self.remove(key)
+        return self.add(key, load)
+
+    def clear(self):
+        self._terms.clear()
+        self._sums = [0j] * len(CONN_PHASES) + [0.0, 0.0]
+        self._updates = 0
+
+    def set_voltage(self, line_voltage):
+        if isinstance(line_voltage, Source):
+            message = check_source(line_voltage)
+            if message:
+                raise ValueError(message)
+        elif line_voltage <= 0:
+            raise ValueError('A tensão de linha deve ser um valor positivo.')
+        self.line_voltage = line_voltage
+
+    def current(self, key):
+        conn, apparent, _, _, _ = self._terms[key]
+        return apparent / source_coeffs(self.line_voltage)[1][conn]
+
+    def currents(self, keys):
+        # Correntes de várias cargas (array na ordem de `keys`)
+        import numpy as np
+        terms = self._terms
+        conn = np.fromiter((terms[key][0] for key in keys), dtype=np.uint8, count=len(keys))
+        apparent = np.fromiter((terms[key][1] for key in keys), dtype=float, count=len(keys))
+        return apparent / np.array(source_coeffs(self.line_voltage)[1])[conn]
+
+    def totals(self):
+        coeffs, _ = source_coeffs(self.line_voltage)
+        *by_conn, total_p, total_q = self._sums
+        sum_ia = sum_ib = sum_ic = 0j
+        for s, (ka, kb, kc) in zip(by_conn, coeffs):
+            if s:
+                sum_ia += s * ka
+                sum_ib += s * kb
+                sum_ic += s * kc
+        return sum_ia, sum_ib, sum_ic, total_p, total_q
+
+    def results(self) -> Results:
+        return build_results(*self.totals())
+
+    def resum(self):
+        # Soma compensada (fsum) de todas as contribuições para descartar o
+        # erro de arredondamento acumulado pelas atualizações incrementais
+        by_conn = [[] for _ in CONN_PHASES]
+        for conn, _, s, _, _ in self._terms.values():
+            by_conn[conn].append(s)
+        self._sums = [complex(math.fsum(s.real for s in group), math.fsum(s.imag for s in group)) for group in by_conn]
+        self._sums.append(math.fsum(terms[3] for terms in self._terms.values()))
+        self._sums.append(math.fsum(terms[4] for terms in self._terms.values()))
+        self._updates = 0
+
+    def _apply(self, terms, direction):
+        conn, _, s, p, q = terms
+        sums = self._sums
+        sums[conn] += direction * s
+        sums[-2] += direction * p
+        sums[-1] += direction * q
+        self._updates += 1
+        if self._updates >= self.resum_interval:
+            self.resum()
@@ -0,0 +1,117 @@
+"""Simulação de Monte Carlo da incerteza das cargas.
+
+A potência de cada carga varia uniformemente em ±power_tol e o FP em
+[pf_low, pf_high]; para cada amostra são calculados |Ia|, |Ib|, |Ic| e |In|
+com o mesmo solver vetorizado da interface (uma matriz amostras × cargas por
+bloco).
+
+As amostras são divididas em shards de tamanho fixo, cada um com sua própria
+semente derivada de `seed` (SeedSequence.spawn). O resultado depende só da
+semente e de `shard_size`, não do número de processos usados.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from phase.core import batch_coeffs, batch_sums, pack_loads
+
+LABELS = ('Ia', 'Ib', 'Ic', 'In')
+SHARD_SIZE = 50_000
+MAX_CELLS = 2_000_000 # amostras × cargas calculadas de uma vez dentro de um shard
+
+class MonteCarloResult:
+    def __init__(self, magnitudes, entropy):
+        self.magnitudes = magnitudes # (amostras, 4): |Ia|, |Ib|, |Ic|, |In|
+        self.entropy = entropy # Semente usada; repete a simulação se passada como `seed`
+
+    def __len__(self):
+        return len(self.magnitudes)
+
+    def column(self, label):
+        return self.magnitudes[:, LABELS.index(label)]
+
+    def percentiles(self, q=(5, 50, 95, 99)):
+        values = np.percentile(self.magnitudes, q, axis=0)
+        return {label: values[:, i] for i, label in enumerate(LABELS)}
+
+    def histogram(self, label='In', bins=50):
+        return np.histogram(self.column(label), bins=bins)
+
+def sample_magnitudes(params, samples, rng):
+    power, pf, sign, conn, line_voltage, power_tol, pf_low, pf_high = params
+    coeffs_re, coeffs_im = batch_coeffs(conn, line_voltage)
+    fixed_pf = np.array_equal(pf_low, pf_high)
+    if fixed_pf:
+        tan_phi = np.divide(np.sqrt(np.clip(1 - pf_low**2, 0.0, None)), pf_low, out=np.zeros(len(pf_low)), where=pf_low > 0)
+        # FP = 0 com potência não nula não gera corrente (mesma regra do solver)
+        coeffs_re[pf_low == 0] = 0
+        coeffs_im[pf_low == 0] = 0
+
+    n = len(power)
+    out = np.empty((samples, 4))
+    step = max(1, MAX_CELLS // max(n, 1))
+    for start in range(0, samples, step):
+        count = min(step, samples - start)
+        p = power * rng.uniform(1 - power_tol, 1 + power_tol, size=(count, n))
+        if fixed_pf:
+            q = np.abs(p) * (sign * tan_phi)
+        else:
+            f = rng.uniform(pf_low, pf_high, size=(count, n))
+            q = np.abs(p) * sign * np.divide(np.sqrt(1 - f*f), f, out=np.zeros_like(f), where=f > 0)
+            p[f == 0] = 0
+        sums = batch_sums(p, q, coeffs_re, coeffs_im)
+        out[start:start + count, :3] = np.abs(sums)
+        out[start:start + count, 3] = np.abs(sums.sum(axis=1))
+    return out
+
+_worker_params = None
+
+def _init_worker(params):
+    global _worker_params
+    _worker_params = params
+
+def _run_shard(samples, seed):
+    return sample_magnitudes(_worker_params, samples, np.random.default_rng(seed))
+
+def prepare(loads, line_voltage, power_tol=0.15, pf_range=None):
+    power, pf, sign, conn = pack_loads(loads)
+    power_tol = np.broadcast_to(np.asarray(power_tol, dtype=float), power.shape)
+    if pf_range is None:
+        pf_low = pf_high = pf
+    else:
+        pf_low, pf_high = (np.clip(np.broadcast_to(np.asarray(x, dtype=float), pf.shape), 0.0, 1.0) for x in pf_range)
+    return power, pf, sign, conn, line_voltage, power_tol, pf_low, pf_high
+
+def iter_simulate(loads, line_voltage, samples, power_tol=0.15, pf_range=None, seed=None, jobs=None, shard_size=SHARD_SIZE):
+    """Gera blocos (amostras do shard, 4) na ordem dos shards.
+
+    Permite mostrar resultados parciais enquanto a simulação roda. A
+    semente efetiva fica em `seed_sequence.entropy` do primeiro item gerado
+    por `simulate`.
+    """
+    params = prepare(loads, line_voltage, power_tol, pf_range)
+    seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    sizes = [shard_size] * (samples // shard_size)
+    if samples % shard_size:
+        sizes.append(samples % shard_size)
+    seeds = seed_sequence.spawn(len(sizes))
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(sizes) <= 1:
+        for size, shard_seed in zip(sizes, seeds):
+            yield sample_magnitudes(params, size, np.random.default_rng(shard_seed))
+        return
+
+    # spawn: seguro mesmo quando chamado de uma thread da interface
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=min(jobs, len(sizes)), mp_context=context,
+                             initializer=_init_worker, initargs=(params,)) as pool:
+        yield from pool.map(_run_shard, sizes, seeds)
+
+def simulate(loads, line_voltage, samples, power_tol=0.15, pf_range=None, seed=None, jobs=None, shard_size=SHARD_SIZE):
+    seed_sequence = np.random.SeedSequence(seed)
+    chunks = list(iter_simulate(loads, line_voltage, samples, power_tol, pf_range, seed_sequence, jobs, shard_size))
+    magnitudes = np.concatenate(chunks) if chunks else np.empty((0, 4))
+    return MonteCarloResult(magnitudes, seed_sequence.entropy)
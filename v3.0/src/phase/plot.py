@@ -0,0 +1,73 @@
+"""Diagrama fasorial das correntes totais com atualização por blitting.
+
+Os eixos, a grade e o título são desenhados uma única vez e guardados como
+fundo; a cada recálculo apenas as setas e rótulos de IA/IB/IC/IN são
+atualizados e copiados sobre esse fundo.
+"""
+from phase.core import complex_to_polar
+
+LABELS = ('IA', 'IB', 'IC', 'IN')
+MIN_MAG = 1e-4 # Fasores menores que isso não são exibidos
+
+class PhasorPlot:
+    def __init__(self, canvas, ax, shrink_ratio=0.5, headroom=1.2):
+        self.canvas = canvas
+        self.ax = ax
+        # Os limites só são refeitos quando o valor necessário sai da faixa
+        # [shrink_ratio * lim, lim]; ao refazer, sobra `headroom` de margem
+        self.shrink_ratio = shrink_ratio
+        self.headroom = headroom
+        self.lim = None
+        self._background = None
+
+        ax.axhline(0, linewidth=0.6)
+        ax.axvline(0, linewidth=0.6)
+        ax.set_aspect('equal')
+        ax.set_title('Diagrama Fasorial das Correntes Totais')
+        ax.grid(True, linestyle='--', linewidth=0.5)
+
+        self.arrows = {}
+        self.texts = {}
+        for label in LABELS:
+            self.arrows[label] = ax.arrow(0, 0, 0, 0, length_includes_head=True, animated=True, visible=False)
+            self.texts[label] = ax.text(0, 0, '', animated=True, visible=False)
+
+        canvas.mpl_connect('draw_event', self.on_draw)
+
+    def update(self, Ia, Ib, Ic, In):
+        phasors = dict(zip(LABELS, (Ia, Ib, Ic, In)))
+        max_mag = max((abs(z) for z in phasors.values() if abs(z) > MIN_MAG), default=1.0)
+        needed = max(2e-3, max_mag*1.4)
+        rescale = self.lim is None or not (self.shrink_ratio * self.lim <= needed <= self.lim)
+        if rescale:
+            self.lim = needed * self.headroom
+            self.ax.set_xlim(-self.lim, self.lim)
+            self.ax.set_ylim(-self.lim, self.lim)
+
+        lim = self.lim
+        for label, z in phasors.items():
+            arrow, text = self.arrows[label], self.texts[label]
+            mag, ang = complex_to_polar(z)
+            visible = mag > MIN_MAG
+            arrow.set_visible(visible)
+            text.set_visible(visible)
+            if visible:
+                arrow.set_data(x=0, y=0, dx=z.real, dy=z.imag, head_width=0.06*lim, head_length=0.08*lim)
+                text.set_position((z.real*1.05, z.imag*1.05))
+                text.set_text(f'{label}\n{mag:.2f}A\n{ang:.0f}°')
+
+        if rescale or self._background is None:
+            self.canvas.draw() # Redesenha o fundo; on_draw completa com os fasores
+        else:
+            self.canvas.restore_region(self._background)
+            self.draw_phasors()
+            self.canvas.blit(self.ax.figure.bbox)
+
+    def on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.ax.figure.bbox)
+        self.draw_phasors()
+
+    def draw_phasors(self):
+        for label in LABELS:
+            self.ax.draw_artist(self.arrows[label])
+            self.ax.draw_artist(self.texts[label])
@@ -0,0 +1,266 @@
+"""Perfis de carga no tempo (horários ou de 15 min) e solução por intervalo.
+
+Um arquivo de perfis tem uma coluna por carga, com o nome da carga no
+cabeçalho e a potência ativa (W) de cada intervalo nas linhas; uma primeira
+coluna de data/hora é opcional. Cargas sem perfil mantêm a potência fixa do
+quadro e o FP/tipo/fases de cada carga não mudam ao longo do tempo.
+
+    hora;Chuveiro;Geladeira
+    2024-01-01 00:00;0;150
+    2024-01-01 01:00;5500;148
+
+Todos os intervalos são resolvidos de uma vez com as mesmas somas matriciais
+da simulação de Monte Carlo, em blocos de no máximo MAX_CELLS intervalos ×
+cargas; a contribuição das cargas sem perfil é calculada uma vez só. O
+solver só pede um bloco de linhas por vez (`LoadProfiles.blocks`): os perfis
+podem ser qualquer array 2D (inclusive np.memmap) e arquivos Parquet são
+decodificados lote a lote, sem carregar o período inteiro na memória.
+"""
+import csv
+import re
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from phase.core import batch_coeffs, batch_sums, pack_loads
+from phase.sequence import sequence_components
+
+LABELS = ('Ia', 'Ib', 'Ic', 'In', 'P', 'Q', 'S', 'I0', 'I1', 'I2', 'I2/I1')
+TIME_COLUMNS = {'time', 'timestamp', 'datetime', 'date', 'data', 'hora', 'horário', 'horario', 'data/hora'}
+MAX_CELLS = 2_000_000 # intervalos × cargas com perfil calculados de uma vez
+
+# Passo (h) deduzido do número de intervalos quando não há coluna de data/hora
+STEPS = {8760: 1.0, 8784: 1.0, 35040: 0.25, 35136: 0.25}
+
+class LoadProfiles:
+    def __init__(self, names, values, step_hours=1.0):
+        self.names = list(names)
+        self.values = values # (intervalos, colunas) em W
+        self.step_hours = step_hours
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.values)
+
+    def column(self, name):
+        return self.values[:, self.index[name]]
+
+    def blocks(self, rows, columns):
+        # Blocos sucessivos de até `rows` intervalos, só com as colunas
+        # (índices) pedidas, em W
+        for start in range(0, len(self), rows):
+            yield np.asarray(self.values[start:start + rows], dtype=float)[:, columns]
+
+class ParquetProfiles(LoadProfiles):
+    # Perfis de um arquivo Parquet lidos sob demanda: cada bloco é um lote
+    # (record batch) só das colunas usadas
+    def __init__(self, path, names, intervals, step_hours=1.0):
+        super().__init__(names, None, step_hours)
+        self.path = path
+        self.intervals = intervals
+
+    def __len__(self):
+        return self.intervals
+
+    def column(self, name):
+        import pyarrow.parquet as pq
+        return pq.read_table(self.path, columns=[name], memory_map=True).column(0).to_numpy()
+
+    def blocks(self, rows, columns):
+        import pyarrow.parquet as pq
+        columns = list(columns)
+        if not columns:
+            # Sem colunas o pyarrow não informa o número de linhas dos lotes
+            for start in range(0, len(self), rows):
+                yield np.empty((min(rows, len(self) - start), 0))
+            return
+        # Cada coluna do arquivo é lida uma vez, mesmo se usada por várias cargas
+        unique = sorted(set(columns))
+        order = [unique.index(column) for column in columns]
+        parquet = pq.ParquetFile(self.path, memory_map=True)
+        for batch in parquet.iter_batches(batch_size=rows, columns=[self.names[i] for i in unique]):
+            block = np.empty((batch.num_rows, len(unique)))
+            for j, column in enumerate(batch.columns):
+                block[:, j] = column.to_numpy(zero_copy_only=False)
+            yield block[:, order]
+
+class ProfileResult:
+    def __init__(self, ia, ib, ic, p, q, step_hours, individual_peak):
+        self.ia, self.ib, self.ic = ia, ib, ic # Complexos por intervalo
+        self.p, self.q = p, q
+        self.step_hours = step_hours
+        self.individual_peak = individual_peak # Soma das potências aparentes máximas de cada carga (VA)
+        self._sequence = None
+
+    def __len__(self):
+        return len(self.p)
+
+    @property
+    def in_(self):
+        return -(self.ia + self.ib + self.ic)
+
+    @property
+    def s(self):
+        return np.hypot(self.p, self.q)
+
+    def sequence(self):
+        # Componentes simétricas de todos os intervalos (uma transformada só)
+        if self._sequence is None:
+            self._sequence = sequence_components(self.ia, self.ib, self.ic)
+        return self._sequence
+
+    def series(self, label):
+        if label in ('I0', 'I1', 'I2', 'I2/I1'):
+            return self.sequence().series(label)
+        if label in ('P', 'Q'):
+            return self.p if label == 'P' else self.q
+        if label == 'S':
+            return self.s
+        return np.abs({'Ia': self.ia, 'Ib': self.ib, 'Ic': self.ic, 'In': self.in_}[label])
+
+    def peak(self, label='S'):
+        # (valor máximo, intervalo) da série
+        values = self.series(label)
+        index = int(np.argmax(values))
+        return float(values[index]), index
+
+    def coincident_peak(self):
+        # Demanda máxima do conjunto (S), as correntes nesse intervalo e o
+        # fator de coincidência (pico do conjunto / soma dos picos individuais)
+        value, index = self.peak('S')
+        currents = {label: float(self.series(label)[index]) for label in ('Ia', 'Ib', 'Ic', 'In')}
+        factor = value / self.individual_peak if self.individual_peak else 0.0
+        return {'S': value, 'interval': index, 'currents': currents, 'coincidence_factor': factor}
+
+    def duration_curve(self, label='S'):
+        # Valores em ordem decrescente; o índice i corresponde a (i + 1) · passo horas
+        return np.sort(self.series(label))[::-1]
+
+    def energy(self):
+        # Energia ativa total no período (Wh)
+        return float(self.p.sum() * self.step_hours)
+
+def load_names(loads):
+    if hasattr(loads, 'column'):
+        return [loads.names[i] for i in loads.column('name').tolist()] # LoadTable
+    return [load['name'] for load in loads]
+
+def solve_profiles(loads, profiles, line_voltage):
+    power, pf, sign, conn = pack_loads(loads)
+    columns = [profiles.index.get(name) for name in load_names(loads)]
+    profiled = np.array([i for i, column in enumerate(columns) if column is not None], dtype=np.intp)
+    sources = np.array([columns[i] for i in profiled], dtype=np.intp)
+    static = np.ones(len(power), dtype=bool)
+    static[profiled] = False
+
+    coeffs_re, coeffs_im = batch_coeffs(conn, line_voltage)
+    nonzero_pf = pf != 0
+    signed_tan = sign * np.divide(np.sqrt(np.clip(1 - pf**2, 0.0, None)), pf, out=np.zeros(len(pf)), where=nonzero_pf)
+    # FP = 0 com potência não nula não gera corrente (mesma regra do solver)
+    coeffs_re[~nonzero_pf] = 0
+    coeffs_im[~nonzero_pf] = 0
+    apparent_ratio = np.sqrt(1 + signed_tan**2) # |S| / |P|
+
+    # Cargas sem perfil: uma única linha somada a todos os intervalos
+    static_p = power * static
+    static_q = np.abs(static_p) * signed_tan
+    base = batch_sums(static_p, static_q, coeffs_re, coeffs_im)
+    base_p, base_q = float(static_p.sum()), float(static_q.sum())
+
+    intervals = len(profiles)
+    sums = np.empty((intervals, 3), dtype=complex)
+    total_p = np.empty(intervals)
+    total_q = np.empty(intervals)
+    peak_p = np.zeros(len(profiled))
+    re, im, tan = coeffs_re[profiled], coeffs_im[profiled], signed_tan[profiled]
+    step = max(1, MAX_CELLS // max(len(profiled), 1))
+    start = 0
+    for p in profiles.blocks(step, sources):
+        # Os lotes do Parquet podem ser menores que `step` (fim de grupo de linhas)
+        stop = start + len(p)
+        q = np.abs(p) * tan
+        sums[start:stop] = batch_sums(p, q, re, im) + base
+        total_p[start:stop] = p.sum(axis=1) + base_p
+        total_q[start:stop] = q.sum(axis=1) + base_q
+        if len(p):
+            np.maximum(peak_p, np.abs(p).max(axis=0), out=peak_p)
+        start = stop
+
+    individual_peak = float((peak_p * apparent_ratio[profiled]).sum() + (np.abs(static_p) * apparent_ratio).sum())
+    return ProfileResult(sums[:, 0], sums[:, 1], sums[:, 2], total_p, total_q, profiles.step_hours, individual_peak)
+
+def read_profiles(path, step_hours=None):
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in ('.csv', '.txt'):
+        names, values, times = read_csv_profiles(path)
+        profiles = LoadProfiles(names, values)
+    elif suffix == '.parquet':
+        profiles, times = read_parquet_profiles(path)
+    else:
+        raise ValueError(f'Formato de arquivo não suportado: {path.suffix}')
+    if not profiles.names:
+        raise ValueError('O arquivo não tem colunas de perfil.')
+    profiles.step_hours = infer_step(times, len(profiles)) if step_hours is None else step_hours
+    return profiles
+
+def infer_step(times, intervals):
+    if times is not None and len(times) >= 2:
+        return (times[1] - times[0]).total_seconds() / 3600
+    return STEPS.get(intervals, 1.0)
+
+def parse_time(value):
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        return None
+
+def read_csv_profiles(path):
+    # O texto é lido uma vez pelo leitor em C do NumPy; a primeira coluna é
+    # data/hora se o cabeçalho ou o primeiro valor indicar
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            delimiter = csv.Sniffer().sniff(sample, delimiters=',;\t').delimiter
+        except csv.Error:
+            delimiter = ','
+        reader = csv.reader(f, delimiter=delimiter)
+        header = [cell.strip() for cell in next(reader, [])]
+        # Linhas em branco são ignoradas (como no np.loadtxt)
+        first_rows = [row for _, row in zip(range(2), (row for row in reader if any(cell.strip() for cell in row)))]
+    if not header:
+        return [], np.empty((0, 0)), None
+
+    has_time = header[0].lower() in TIME_COLUMNS or bool(first_rows and parse_time(first_rows[0][0]))
+    names = header[1:] if has_time else header
+    usecols = range(1 if has_time else 0, len(header))
+    # Vírgula decimal (só possível quando o separador não é vírgula)
+    decimal_comma = delimiter != ',' and re.search(r'\d,\d', sample)
+    converters = (lambda text: float(text.replace(',', '.'))) if decimal_comma else None
+    values = np.loadtxt(path, delimiter=delimiter, skiprows=1, usecols=usecols, converters=converters,
+                        encoding='utf-8-sig', ndmin=2)
+    times = [parse_time(row[0]) for row in first_rows] if has_time else None
+    if times is not None and None in times:
+        times = None
+    return names, values, times
+
+def read_parquet_profiles(path):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError('A leitura de arquivos .parquet requer o pacote pyarrow (pip install pyarrow).') from None
+    # Aqui só o esquema, o número de linhas e as duas primeiras datas são
+    # lidos; os valores são decodificados por solve_profiles, lote a lote
+    parquet = pq.ParquetFile(path, memory_map=True)
+    names, times = [], None
+    for field in parquet.schema_arrow:
+        if field.name.strip().lower() in TIME_COLUMNS or str(field.type).startswith(('timestamp', 'date')):
+            if times is None and parquet.metadata.num_rows:
+                times = parquet.read_row_group(0, columns=[field.name]).column(0).slice(0, 2).to_pylist()
+            continue
+        names.append(field.name)
+    return ParquetProfiles(path, names, parquet.metadata.num_rows), times
@@ -0,0 +1,93 @@
+"""Medição de tempo por etapa do recálculo (solver, tabela, texto, gráfico).
+
+    with profiler.stage('plot'):
+        ...
+
+Desligado (padrão), `stage` devolve sempre o mesmo contexto vazio: o custo
+é uma chamada de método, então a instrumentação pode ficar no código de
+produção. Ligado, cada etapa guarda as últimas `window` durações para os
+percentis e os eventos vão para um buffer limitado, exportável no formato
+Chrome trace (chrome://tracing ou https://ui.perfetto.dev).
+
+A variável de ambiente PHASE_PROFILE=1 liga o profiler global na partida.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+_DISABLED = nullcontext()
+
+class _Stage:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, self.start, time.perf_counter_ns() - self.start)
+        return False
+
+class Profiler:
+    def __init__(self, enabled=False, window=256, max_events=100_000):
+        self.enabled = enabled
+        self.window = window
+        self.samples = {} # etapa -> deque com as últimas durações (ns)
+        self.events = deque(maxlen=max_events) # (etapa, início ns, duração ns, thread)
+        self._origin = time.perf_counter_ns()
+
+    def stage(self, name):
+        if not self.enabled:
+            return _DISABLED
+        return _Stage(self, name)
+
+    def add(self, name, start, duration):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(duration)
+        self.events.append((name, start, duration, threading.get_ident()))
+
+    def percentiles(self, name, q=(50, 95)):
+        # Percentis (ms) das últimas durações da etapa, por posição na amostra ordenada
+        samples = sorted(self.samples.get(name, ()))
+        if not samples:
+            return None
+        return tuple(samples[min(len(samples) - 1, int(p / 100 * len(samples)))] / 1e6 for p in q)
+
+    def last(self, name):
+        samples = self.samples.get(name)
+        return samples[-1] / 1e6 if samples else None
+
+    def summary(self):
+        # {etapa: (n, última, p50, p95, máx)} em ms
+        result = {}
+        for name, samples in self.samples.items():
+            p50, p95 = self.percentiles(name)
+            result[name] = (len(samples), samples[-1] / 1e6, p50, p95, max(samples) / 1e6)
+        return result
+
+    def reset(self):
+        self.samples.clear()
+        self.events.clear()
+
+    def chrome_trace(self):
+        pid = os.getpid()
+        events = [{
+            'name': name, 'cat': 'phase', 'ph': 'X', 'pid': pid, 'tid': tid,
+            'ts': (start - self._origin) / 1000, 'dur': duration / 1000,
+        } for name, start, duration, tid in self.events]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_trace(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+
+profiler = Profiler(enabled=os.environ.get('PHASE_PROFILE', '') not in ('', '0'))
@@ -0,0 +1,294 @@
+"""Projetos: salva e abre o quadro de cargas com a tensão de linha.
+
+Formato binário (.phase), little-endian:
+
+    MAGIC (8 bytes) | versão (uint16) | tamanho do cabeçalho (uint32)
+    cabeçalho JSON (UTF-8)
+    um bloco por coluna da LoadTable, cada um alinhado em ALIGN bytes
+
+O cabeçalho guarda a tensão (e a fonte desequilibrada, se houver), as
+condições de instalação do dimensionamento, os metadados, as cargas
+fixadas, os pools de nomes e de espectros harmônicos (com a definição dos
+que não são nativos) e, para cada coluna, o dtype, o deslocamento (a partir
+do fim do cabeçalho alinhado) e o número de linhas. Os blocos são os
+próprios arrays, então abrir um projeto é ler ou mapear (np.memmap) cada
+coluna e validá-la com operações vetoriais, sem processar carga por carga.
+Como em LoadTable, o NumPy só é importado no primeiro uso.
+
+`export_json` grava o mesmo conteúdo em JSON para troca com outras
+ferramentas; `open_project` aceita os dois formatos.
+"""
+import json
+import math
+import os
+import struct
+from datetime import datetime
+from pathlib import Path
+
+from phase.core import CONN_ABC, CONN_NONE, Source, check_load, check_phases
+from phase.harmonics import BUILTIN_SPECTRA, LINEAR, SPECTRA, register_spectrum
+from phase.importer import PF_TYPES
+from phase.sizing import FEEDER, Installation, check_installation, check_length
+from phase.table import COLUMNS, LoadTable
+
+MAGIC = b'PHASEPRJ'
+VERSION = 1
+ALIGN = 64
+PREAMBLE = struct.Struct('<8sHI')
+JSON_FORMAT = 'phase-project'
+
+class Project:
+    def __init__(self, loads, line_voltage, pinned=(), metadata=None, source=None, installation=None, feeder=None):
+        self.loads = loads # LoadTable
+        self.line_voltage = line_voltage
+        self.source = source # Source, ou None para fonte equilibrada em line_voltage
+        self.installation = installation or Installation() # Dimensionamento dos circuitos
+        self.feeder = feeder or FEEDER # e do alimentador
+        self.pinned = set(pinned) # Ids das cargas fixadas para o balanceamento
+        self.metadata = dict(metadata or {})
+
+def _align(offset):
+    return -(-offset // ALIGN) * ALIGN
+
+def _stamp(metadata):
+    now = datetime.now().isoformat(timespec='seconds')
+    metadata = dict(metadata)
+    metadata.setdefault('created', now)
+    metadata['saved'] = now
+    return metadata
+
+def _write_atomic(path, write):
+    # Grava em um arquivo temporário e substitui: um erro no meio não
+    # corrompe o projeto anterior
+    path = Path(path)
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            write(f)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+def save_project(path, project):
+    import numpy as np
+    table = project.loads
+    size = len(table)
+    blocks, columns, offset = [], [], 0
+    for name, dtype in COLUMNS.items():
+        dtype = np.dtype(dtype).newbyteorder('<')
+        data = np.ascontiguousarray(table.column(name) if size else np.empty(0), dtype=dtype)
+        columns.append({'name': name, 'dtype': dtype.str, 'offset': offset, 'rows': size})
+        blocks.append((offset, data))
+        offset = _align(offset + data.nbytes)
+
+    metadata = project.metadata = _stamp(project.metadata)
+    header = json.dumps({
+        'line_voltage': project.line_voltage,
+        'source': _source_list(project.source),
+        'installation': _installation_dict(project),
+        'metadata': metadata,
+        'pinned': sorted(project.pinned),
+        'next_id': table._next_id,
+        'names': table.names,
+        'spectra': table.spectra,
+        'custom_spectra': _custom_spectra(table.spectra),
+        'columns': columns,
+    }, ensure_ascii=False).encode('utf-8')
+    data_start = _align(PREAMBLE.size + len(header))
+
+    def write(f):
+        f.write(PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        for block_offset, data in blocks:
+            f.seek(data_start + block_offset)
+            f.write(data.tobytes())
+    _write_atomic(path, write)
+
+def open_project(path, mmap=False):
+    """Abre um projeto .phase (ou exportado em JSON).
+
+    Com `mmap=True` as colunas são mapeadas do arquivo em modo cópia na
+    escrita: alterações não tocam o arquivo e as páginas ficam a cargo do
+    sistema. A validação ainda percorre cada coluna uma vez ao abrir.
+    """
+    import numpy as np
+    with open(path, 'rb') as f:
+        preamble = f.read(PREAMBLE.size)
+        if preamble[:1] == b'{':
+            f.seek(0)
+            return _read_json(json.loads(f.read().decode('utf-8')))
+        if len(preamble) < PREAMBLE.size or not preamble.startswith(MAGIC):
+            raise ValueError('O arquivo não é um projeto da Calculadora de Fasores.')
+        _, version, header_size = PREAMBLE.unpack(preamble)
+        if version > VERSION:
+            raise ValueError(f'Projeto salvo por uma versão mais nova do programa (formato {version}).')
+        try:
+            header = json.loads(f.read(header_size).decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise ValueError('Cabeçalho do projeto corrompido.') from None
+        data_start = _align(PREAMBLE.size + header_size)
+
+        columns = {}
+        for column in header['columns']:
+            if column['name'] not in COLUMNS:
+                continue # Colunas de versões futuras
+            dtype, rows = np.dtype(column['dtype']), column['rows']
+            position = data_start + column['offset']
+            if mmap and rows:
+                try:
+                    data = np.memmap(f, dtype=dtype, mode='c', offset=position, shape=(rows,))
+                except ValueError:
+                    raise ValueError('Projeto truncado: faltam dados das cargas.') from None
+            else:
+                f.seek(position)
+                data = np.fromfile(f, dtype=dtype, count=rows)
+            if len(data) != rows:
+                raise ValueError('Projeto truncado: faltam dados das cargas.')
+            columns[column['name']] = data
+
+    spectra = _read_spectra(header)
+    _check_columns(columns, len(header['names']), len(spectra))
+    loads = LoadTable.from_columns(columns, header['names'], header.get('next_id'), spectra)
+    return _read_project(loads, header)
+
+def _read_project(loads, document):
+    # Campos comuns aos dois formatos
+    line_voltage = document.get('line_voltage')
+    if isinstance(line_voltage, bool) or not isinstance(line_voltage, (int, float)) or not 0 < line_voltage < math.inf:
+        raise ValueError('Projeto corrompido: a tensão de linha deve ser um número positivo.')
+    pinned = document.get('pinned', [])
+    if not isinstance(pinned, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in pinned):
+        raise ValueError('Projeto corrompido: cargas fixadas inválidas.')
+    metadata = document.get('metadata')
+    if metadata is not None and not isinstance(metadata, dict):
+        raise ValueError('Projeto corrompido: metadados inválidos.')
+    return Project(loads, line_voltage, pinned, metadata, _read_source(document), *_read_installation(document))
+
+def _source_list(source):
+    return None if source is None else list(source)
+
+def _read_source(document):
+    values = document.get('source')
+    if values is None:
+        return None
+    try:
+        return Source(*map(float, values))
+    except (TypeError, ValueError):
+        raise ValueError('Projeto corrompido: fonte inválida.') from None
+
+def _installation_dict(project):
+    return {'circuits': project.installation._asdict(), 'feeder': project.feeder._asdict()}
+
+def _read_installation(document):
+    # (circuitos, alimentador); projetos anteriores ao dimensionamento usam o padrão
+    values = document.get('installation') or {}
+    try:
+        groups = (Installation(**values.get('circuits', {})), FEEDER._replace(**values.get('feeder', {})))
+    except (AttributeError, TypeError, ValueError):
+        raise ValueError('Projeto corrompido: instalação inválida.') from None
+    for group in groups:
+        message = check_installation(group)
+        if message:
+            raise ValueError(f'Projeto corrompido: {message}')
+    return groups
+
+def _custom_spectra(names):
+    # Definição dos espectros usados que não vêm com o programa
+    return {name: [[order, *value] for order, value in SPECTRA[name].items()]
+            for name in names if name not in BUILTIN_SPECTRA and name in SPECTRA}
+
+def _read_spectra(document):
+    try:
+        for name, orders in document.get('custom_spectra', {}).items():
+            register_spectrum(name, {order: (ratio, angle) for order, ratio, angle in orders})
+    except (TypeError, ValueError):
+        raise ValueError('Projeto corrompido: espectro harmônico inválido.') from None
+    spectra = document.get('spectra') or [LINEAR]
+    unknown = set(spectra) - set(SPECTRA)
+    if unknown:
+        raise ValueError(f'Espectro harmônico desconhecido: {", ".join(sorted(unknown))}.')
+    return spectra
+
+def _check_columns(columns, names, spectra=1):
+    import numpy as np
+    # 'spectrum' e 'length' são opcionais: projetos anteriores aos harmônicos
+    # e ao dimensionamento têm só cargas lineares, com o comprimento da instalação
+    missing = set(COLUMNS) - set(columns) - {'spectrum', 'length'}
+    if missing:
+        raise ValueError(f'Projeto sem as colunas: {", ".join(sorted(missing))}.')
+    ids, conn, name = columns['id'], columns['conn'], columns['name']
+    # Toda carga tem conexão (CONN_NONE só aparece para fases inválidas)
+    if len(ids) and (np.any(np.diff(ids) <= 0) or conn.min() <= CONN_NONE or conn.max() > CONN_ABC
+                     or name.min() < 0 or name.max() >= names):
+        raise ValueError('Projeto corrompido: dados das cargas inválidos.')
+    spectrum = columns.get('spectrum')
+    if spectrum is not None and len(spectrum) and spectrum.max() >= spectra:
+        raise ValueError('Projeto corrompido: dados das cargas inválidos.')
+    length = columns.get('length')
+    if length is not None and len(length) and not np.all(np.isfinite(length) & (length >= 0)):
+        raise ValueError('Projeto corrompido: dados das cargas inválidos.')
+    # Mesmas regras de check_load: potência finita, FP entre 0 e 1 e FP nulo
+    # só com potência nula
+    power, pf = columns['power'], columns['pf']
+    if not (np.all(np.isfinite(power)) and np.all((pf >= 0) & (pf <= 1)) and not np.any((pf == 0) & (power != 0))):
+        raise ValueError('Projeto corrompido: dados das cargas inválidos.')
+
+def export_json(path, project):
+    project.metadata = _stamp(project.metadata)
+    document = {
+        'format': JSON_FORMAT,
+        'version': VERSION,
+        'line_voltage': project.line_voltage,
+        'source': _source_list(project.source),
+        'installation': _installation_dict(project),
+        'metadata': project.metadata,
+        'pinned': sorted(project.pinned),
+        'custom_spectra': _custom_spectra(project.loads.spectra),
+        'loads': list(project.loads),
+    }
+    _write_atomic(path, lambda f: f.write(json.dumps(document, ensure_ascii=False, indent=2).encode('utf-8')))
+
+def _check_load(load):
+    # As mesmas verificações da importação de cargas; sem elas uma fase
+    # desconhecida viraria "sem conexão" e um tipo de FP desconhecido, capacitivo
+    if not isinstance(load, dict):
+        return 'dados da carga inválidos.'
+    power, pf, phases = load.get('power'), load.get('pf'), load.get('phases')
+    if not all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in (power, pf)):
+        return 'Potência ou Fator de Potência inválido.'
+    if load.get('pf_type') not in PF_TYPES.values():
+        return f'Tipo de Fator de Potência desconhecido: {load.get("pf_type")!r}.'
+    if not isinstance(phases, list) or not set(phases) <= {'A', 'B', 'C', 'N'} or len(set(phases)) != len(phases):
+        return f'Fases inválidas: {phases!r}.'
+    length = load.get('length', 0.0)
+    if isinstance(length, bool) or not isinstance(length, (int, float)):
+        return 'Comprimento inválido.'
+    error = check_length(length)
+    if error:
+        return error
+    return check_load(power, pf) or check_phases(phases)
+
+def _read_json(document):
+    import numpy as np
+    if document.get('format') != JSON_FORMAT:
+        raise ValueError('O arquivo JSON não é um projeto da Calculadora de Fasores.')
+    loads = document.get('loads', [])
+    _read_spectra(dict(document, spectra=[load.get('spectrum') for load in loads if 'spectrum' in load]))
+    # Os ids do arquivo são mantidos para que `pinned` continue valendo
+    ids = np.array([load.get('id', i) for i, load in enumerate(loads)], dtype=np.int64)
+    if len(ids) and np.any(np.diff(ids) <= 0):
+        raise ValueError('Projeto corrompido: ids das cargas fora de ordem.')
+    for i, load in enumerate(loads):
+        error = _check_load(load)
+        if error:
+            raise ValueError(f'Projeto JSON inválido: carga {i + 1}: {error}')
+    table = LoadTable()
+    try:
+        table.extend(loads)
+    except (KeyError, TypeError, ValueError):
+        raise ValueError('Projeto JSON inválido: dados das cargas incompletos.') from None
+    if len(ids):
+        table.column('id')[:] = ids
+        table._next_id = int(ids[-1]) + 1
+    return _read_project(table, document)
@@ -0,0 +1,94 @@
+"""Componentes simétricas (Fortescue) das correntes de fase.
+
+As correntes de sequência zero, positiva e negativa de qualquer número de
+resultados (intervalos de um perfil, pontos de uma varredura, amostras)
+saem de um único produto matricial (resultados × 3) @ Fᵀ, sem laço por
+resultado. Como In = -(Ia + Ib + Ic), a sequência zero é -In / 3.
+
+    from phase.sequence import sequence_components
+    seq = sequence_components(result.ia, result.ib, result.ic)
+    seq.negative_unbalance    # |I2| / |I1| (%) por intervalo
+
+O NumPy só é importado no primeiro uso.
+"""
+import functools
+
+from phase.core import polar_to_complex
+
+LABELS = ('I0', 'I1', 'I2')
+UNBALANCE_LIMIT = 2.0 # I2/I1 (%) usado na triagem de aquecimento por sequência negativa
+
+@functools.cache
+def fortescue_matrix():
+    # [I0, I1, I2] = F @ [Ia, Ib, Ic]
+    import numpy as np
+    a = np.exp(2j * np.pi / 3)
+    return np.array([
+        [1, 1, 1],
+        [1, a, a * a],
+        [1, a * a, a],
+    ]) / 3
+
+class SequenceComponents:
+    def __init__(self, values):
+        self.values = values # (..., 3) complexos: I0, I1, I2
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def zero(self):
+        return self.values[..., 0]
+
+    @property
+    def positive(self):
+        return self.values[..., 1]
+
+    @property
+    def negative(self):
+        return self.values[..., 2]
+
+    @property
+    def negative_unbalance(self):
+        # Fator de desequilíbrio |I2| / |I1| (%); sem sequência positiva é 0
+        # (correntes nulas ou só sequência zero) ou inf
+        return self._ratio(self.negative)
+
+    @property
+    def zero_unbalance(self):
+        return self._ratio(self.zero)
+
+    def series(self, label):
+        # Módulos de 'I0', 'I1', 'I2' ou o desequilíbrio 'I2/I1' / 'I0/I1' (%)
+        import numpy as np
+        if label == 'I2/I1':
+            return self.negative_unbalance
+        if label == 'I0/I1':
+            return self.zero_unbalance
+        return np.abs(self.values[..., LABELS.index(label)])
+
+    def hours_above(self, limit, step_hours=1.0):
+        # Tempo (h) com |I2| / |I1| acima de `limit` (%), para séries no tempo
+        import numpy as np
+        return float(np.count_nonzero(self.negative_unbalance > limit) * step_hours)
+
+    def _ratio(self, component):
+        import numpy as np
+        positive, component = np.abs(self.positive), np.abs(component)
+        # Resíduos de arredondamento da transformada contam como zero
+        tolerance = 1e-12 * np.abs(self.values).max(axis=-1, initial=0.0)
+        ratio = np.divide(100 * component, positive, out=np.zeros_like(positive), where=positive > tolerance)
+        return np.where((positive <= tolerance) & (component > tolerance), np.inf, ratio)
+
+def sequence_components(ia, ib, ic):
+    # Ia/Ib/Ic complexos (escalares ou arrays do mesmo formato)
+    import numpy as np
+    phases = np.stack(np.broadcast_arrays(ia, ib, ic), axis=-1).astype(complex)
+    return SequenceComponents(phases @ fortescue_matrix().T)
+
+def results_sequence(results):
+    # A partir de um dict de resultados (phase.solve) ou de uma lista deles
+    if isinstance(results, dict):
+        results = [results]
+    ia, ib, ic = ([polar_to_complex(*res[label]) for res in results] for label in ('Ia', 'Ib', 'Ic'))
+    return sequence_components(ia, ib, ic)
@@ -0,0 +1,252 @@
+"""Dimensionamento de condutores e disjuntores a partir das correntes resolvidas.
+
+Para cada circuito (uma carga do quadro ou o alimentador) com corrente de
+projeto Ib, escolhe o menor disjuntor padronizado com In >= Ib e a menor
+seção de cobre/PVC que atende ao mesmo tempo
+
+    Iz = capacidade (método, condutores carregados) × fator de temperatura
+         × fator de agrupamento >= In
+    ΔV = k · Ib · L · (R cos φ + X sen φ) / V <= queda máxima (%)
+
+com k = 2 para circuitos de dois condutores e √3 para trifásicos. As
+capacidades e os fatores são os da NBR 5410 (tabelas 36, 40 e 42) e ficam
+em arrays indexados por (método, condutores carregados, seção), montados
+uma vez no primeiro uso; todos os circuitos saem de uma matriz circuitos ×
+seções, sem laço por carga.
+
+Cargas não lineares entram com a corrente RMS do espectro. No alimentador,
+com mais de 15 % de harmônicas triplas o neutro conta como condutor
+carregado (fator 0,86) e a corrente de projeto passa a incluir o neutro.
+
+    from phase.sizing import Installation, size_project
+    res = size_project(loads, 380, results, Installation('B1', ambient=35))
+    res.section, res.breaker, res.drop    # um valor por circuito
+
+O NumPy só é importado no primeiro uso.
+"""
+import functools
+import math
+from typing import NamedTuple
+
+from phase.core import CONN_ABC, load_powers, pack_loads, source_arrays
+
+# Seções nominais (mm²) de cobre
+SECTIONS = (1.5, 2.5, 4, 6, 10, 16, 25, 35, 50, 70, 95, 120, 150, 185, 240, 300)
+
+# Capacidade de condução (A), cobre com isolação de PVC a 70 °C, 30 °C no ar
+# ou 20 °C no solo: método -> (2 condutores carregados, 3 condutores carregados)
+AMPACITY = {
+    'B1': (
+        (17.5, 24, 32, 41, 57, 76, 101, 125, 151, 192, 232, 269, 309, 353, 415, 477),
+        (15.5, 21, 28, 36, 50, 68, 89, 110, 134, 171, 207, 239, 275, 314, 370, 426),
+    ),
+    'B2': (
+        (16.5, 23, 30, 38, 52, 69, 90, 111, 133, 168, 201, 232, 258, 294, 344, 394),
+        (15, 20, 27, 34, 46, 62, 80, 99, 118, 149, 179, 206, 225, 255, 297, 339),
+    ),
+    'C': (
+        (19.5, 27, 36, 46, 63, 85, 112, 138, 168, 213, 258, 299, 344, 392, 461, 530),
+        (17.5, 24, 32, 41, 57, 76, 96, 119, 144, 184, 223, 259, 299, 341, 403, 464),
+    ),
+    'D': (
+        (22, 29, 38, 47, 63, 81, 104, 125, 148, 183, 216, 246, 278, 312, 361, 408),
+        (18, 24, 31, 39, 52, 67, 86, 103, 122, 151, 179, 203, 230, 258, 297, 336),
+    ),
+}
+
+METHODS = {
+    'B1': 'B1 – eletroduto embutido ou aparente',
+    'B2': 'B2 – cabo multipolar em eletroduto',
+    'C': 'C – cabo em parede ou bandeja não perfurada',
+    'D': 'D – eletroduto enterrado',
+}
+
+# Fator de temperatura ambiente (°C) para PVC; o método D usa a do solo
+TEMPERATURES = (10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60)
+AIR_FACTORS = (1.22, 1.17, 1.12, 1.06, 1.00, 0.94, 0.87, 0.79, 0.71, 0.61, 0.50)
+SOIL_FACTORS = (1.10, 1.05, 1.00, 0.95, 0.89, 0.84, 0.77, 0.71, 0.63, 0.55, 0.45)
+
+# Fator de agrupamento (circuitos em feixe ou no mesmo eletroduto); acima de
+# 20 circuitos vale o último
+GROUPING = {1: 1.00, 2: 0.80, 3: 0.70, 4: 0.65, 5: 0.60, 6: 0.57, 7: 0.54, 8: 0.52, 9: 0.50, 12: 0.45, 16: 0.41, 20: 0.38}
+
+# Correntes nominais padronizadas de disjuntores (A)
+BREAKERS = (6, 10, 13, 16, 20, 25, 32, 40, 50, 63, 70, 80, 90, 100, 125, 150, 160, 175, 200, 225, 250, 300, 350, 400, 500, 630)
+
+RESISTIVITY = 0.0206 # Ω·mm²/m, cobre a 70 °C
+REACTANCE = 0.08e-3 # Ω/m
+TRIPLEN_LIMIT = 15.0 # % de harmônicas triplas acima do qual o neutro é carregado
+NEUTRAL_FACTOR = 0.86
+
+class Installation(NamedTuple):
+    # Condições de instalação de um grupo de circuitos
+    method: str = 'B1'
+    ambient: float = 30.0 # °C
+    grouping: int = 1 # Circuitos agrupados
+    length: float = 20.0 # m (circuitos sem comprimento próprio)
+    max_drop: float = 4.0 # %
+    min_section: float = 2.5 # mm²
+
+FEEDER = Installation(length=30.0, max_drop=2.0, min_section=6)
+
+def check_length(length):
+    # Comprimento de circuito em m; inf passaria por `>= 0` e só falharia ao reabrir o projeto
+    if not (math.isfinite(length) and length >= 0):
+        return 'O comprimento deve ser um valor finito e não negativo.'
+    return None
+
+def check_installation(installation):
+    if installation.method not in AMPACITY:
+        return f'Método de instalação desconhecido: {installation.method!r}.'
+    if not TEMPERATURES[0] <= installation.ambient <= TEMPERATURES[-1]:
+        return f'A temperatura ambiente deve estar entre {TEMPERATURES[0]} e {TEMPERATURES[-1]} °C.'
+    if installation.grouping < 1 or installation.grouping != int(installation.grouping):
+        return 'O número de circuitos agrupados deve ser um inteiro positivo.'
+    message = check_length(installation.length)
+    if message:
+        return message
+    if not installation.max_drop > 0:
+        return 'A queda de tensão máxima deve ser um valor positivo.'
+    if installation.min_section not in SECTIONS:
+        return f'Seção mínima fora da tabela: {installation.min_section:g} mm².'
+    return None
+
+@functools.cache
+def tables():
+    # (seções, capacidades (métodos × 2/3 condutores × seções), disjuntores,
+    # fatores de agrupamento indexados pelo número de circuitos)
+    import numpy as np
+    ampacity = np.array([AMPACITY[method] for method in AMPACITY], dtype=float)
+    grouping = np.empty(max(GROUPING) + 1)
+    for count in range(1, len(grouping)):
+        grouping[count] = GROUPING[max(n for n in GROUPING if n <= count)]
+    return np.array(SECTIONS, dtype=float), ampacity, np.array(BREAKERS, dtype=float), grouping
+
+def correction_factor(installation):
+    # Temperatura × agrupamento
+    import numpy as np
+    _, _, _, grouping = tables()
+    temperature = SOIL_FACTORS if installation.method == 'D' else AIR_FACTORS
+    ambient = float(np.interp(installation.ambient, TEMPERATURES, temperature))
+    return ambient * float(grouping[min(int(installation.grouping), len(grouping) - 1)])
+
+class SizingResult:
+    def __init__(self, current, breaker, section, ampacity, drop, loaded, neutral_loaded=False):
+        # Um valor por circuito; seção, disjuntor, Iz e ΔV são nan quando
+        # nenhuma combinação das tabelas atende
+        self.current = current # Ib (A)
+        self.breaker = breaker # In (A)
+        self.section = section # mm²
+        self.ampacity = ampacity # Iz corrigida (A)
+        self.drop = drop # ΔV (%)
+        self.loaded = loaded # Condutores carregados
+        self.neutral_loaded = neutral_loaded # Neutro do alimentador carregado (harmônicas triplas)
+
+    def __len__(self):
+        return len(self.current)
+
+    def failed(self):
+        import numpy as np
+        return np.isnan(self.section)
+
+def size_circuits(current, loaded, pf, drop_factor, voltage, length, method, factor, max_drop, min_section):
+    # Dimensiona n circuitos de uma vez (todos os argumentos com n valores;
+    # method é o índice em AMPACITY e loaded 2 ou 3)
+    import numpy as np
+    sections, ampacity, breakers, _ = tables()
+    current = np.asarray(current, dtype=float)
+
+    index = np.searchsorted(breakers, current, side='left')
+    has_breaker = index < len(breakers)
+    breaker = np.where(has_breaker, breakers[np.minimum(index, len(breakers) - 1)], np.nan)
+
+    # Circuitos × seções: capacidade corrigida e queda de tensão de cada seção
+    iz = ampacity[method, np.asarray(loaded) - 2] * np.asarray(factor)[:, None]
+    sin_phi = np.sqrt(np.clip(1 - np.asarray(pf) ** 2, 0.0, None))
+    impedance = RESISTIVITY / sections * np.abs(pf)[:, None] + REACTANCE * sin_phi[:, None]
+    scale = np.divide(100 * drop_factor * current * length, voltage, out=np.zeros_like(current), where=voltage > 0)
+    drops = scale[:, None] * impedance
+    ok = (iz >= breaker[:, None]) & (drops <= np.asarray(max_drop)[:, None]) & (sections >= np.asarray(min_section)[:, None])
+
+    chosen = ok.argmax(axis=1)
+    found = ok[np.arange(len(current)), chosen]
+    rows = np.arange(len(current))
+    return SizingResult(
+        current,
+        np.where(found, breaker, np.nan),
+        np.where(found, sections[chosen], np.nan),
+        np.where(found, iz[rows, chosen], np.nan),
+        np.where(found, drops[rows, chosen], np.nan),
+        np.asarray(loaded),
+    )
+
+def spectrum_rms(loads):
+    # I_RMS / I1 de cada carga pelo seu espectro harmônico
+    import numpy as np
+    from phase.harmonics import SPECTRA, pack_spectra
+    indices, names = pack_spectra(loads)
+    factors = np.array([math.sqrt(sum(ratio ** 2 for ratio, _ in SPECTRA[name].values())) for name in names])
+    return factors[indices]
+
+def size_project(loads, line_voltage, results, installation=Installation(), feeder=FEEDER, lengths=None, harmonics=None):
+    """Dimensiona cada carga de `loads` e o alimentador (último circuito).
+
+    line_voltage: tensão de linha ou Source; results: o dicionário de
+    phase.solve para as mesmas cargas; lengths: comprimento (m) por carga,
+    0 usa o da instalação (LoadTable: coluna 'length'); harmonics: o
+    HarmonicResult das cargas, calculado aqui se faltar e houver cargas não
+    lineares.
+    """
+    import numpy as np
+    for group in (installation, feeder):
+        message = check_installation(group)
+        if message:
+            raise ValueError(message)
+
+    power, pf, sign, conn = pack_loads(loads)
+    coeffs, voltages = source_arrays(line_voltage)
+    _, s, _ = load_powers(power, pf, sign)
+    # Maior corrente de fase de cada carga (fase-neutro: igual à do neutro)
+    rms = spectrum_rms(loads)
+    phase_currents = np.abs(coeffs[conn] * s[:, None]).max(axis=1) * rms
+    if harmonics is None and np.any(rms > 1):
+        from phase.harmonics import solve_harmonics
+        harmonics = solve_harmonics(loads, line_voltage)
+    three_phase = conn == CONN_ABC
+    # Tensão de referência da queda: fase-neutro ou de linha
+    base = np.where(three_phase, voltages[conn] / math.sqrt(3), voltages[conn])
+    if lengths is None:
+        lengths = loads.column('length') if hasattr(loads, 'column') else np.array([load.get('length', 0.0) for load in loads])
+    lengths = np.where(np.asarray(lengths, dtype=float) > 0, lengths, installation.length)
+
+    # Alimentador: correntes totais (RMS com harmônicas)
+    if harmonics is not None:
+        feeder_currents = harmonics.rms()
+        fundamental = np.abs(harmonics.order(1)[:3])
+        triplens = np.sqrt((np.abs(harmonics.currents[harmonics.orders % 3 == 0, :3]) ** 2).sum(axis=0))
+        triplen = 100 * float(np.max(np.divide(triplens, fundamental, out=np.zeros(3), where=fundamental > 0)))
+    else:
+        feeder_currents = np.array([results[k][0] for k in ('Ia', 'Ib', 'Ic', 'In')])
+        triplen = 0.0
+    neutral_loaded = triplen > TRIPLEN_LIMIT
+    feeder_current = feeder_currents.max() if neutral_loaded else feeder_currents[:3].max()
+    feeder_voltage = np.asarray(voltages)[CONN_ABC] / math.sqrt(3)
+
+    circuit_factor = correction_factor(installation)
+    feeder_factor = correction_factor(feeder) * (NEUTRAL_FACTOR if neutral_loaded else 1.0)
+    methods = list(AMPACITY)
+    n = len(power)
+    result = size_circuits(
+        np.r_[phase_currents, feeder_current],
+        np.r_[np.where(three_phase, 3, 2), 3],
+        np.r_[pf, abs(results['PF_total'])],
+        np.r_[np.where(three_phase, math.sqrt(3), 2.0), math.sqrt(3)],
+        np.r_[base, feeder_voltage],
+        np.r_[lengths, feeder.length],
+        np.r_[np.full(n, methods.index(installation.method)), methods.index(feeder.method)],
+        np.r_[np.full(n, circuit_factor), feeder_factor],
+        np.r_[np.full(n, installation.max_drop), feeder.max_drop],
+        np.r_[np.full(n, installation.min_section), feeder.min_section],
+    )
+    result.neutral_loaded = bool(neutral_loaded)
+    return result
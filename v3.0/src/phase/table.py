@@ -0,0 +1,269 @@
+"""Tabela de cargas em colunas (arrays NumPy) em vez de uma lista de dicts.
+
+Cada carga ocupa ~30 bytes: id (int64), potência e FP (float64), tipo de
+conexão (uint8, ver CONN_* em phase.core), flag capacitivo (bool) e os
+índices do nome e do espectro harmônico em pools de strings internadas,
+além do comprimento do circuito (float64, 0 = o da instalação, usado no
+dimensionamento). As propriedades `power`, `pf`, `conn` etc. são views sem
+cópia das linhas ocupadas, prontas para o solver.
+
+Os ids são crescentes e a remoção preserva a ordem das linhas, então a
+linha de um id é encontrada por busca binária.
+"""
+from phase.core import CONN_PHASES, connection_code, pack_loads
+from phase.harmonics import LINEAR
+
+COLUMNS = {
+    'id': 'int64',
+    'power': 'float64',
+    'pf': 'float64',
+    'conn': 'uint8',
+    'capacitive': 'bool',
+    'name': 'int32',
+    'spectrum': 'uint8',
+    'length': 'float64',
+}
+
+class LoadTable:
+    def __init__(self, capacity=1024):
+        self.initial_capacity = capacity
+        self.names = [] # Pool de nomes; a coluna 'name' guarda o índice
+        self._name_index = {}
+        self.spectra = [LINEAR] # Pool de espectros harmônicos (coluna 'spectrum')
+        self._columns = None # Alocadas no primeiro append (NumPy carregado sob demanda)
+        self._size = 0
+        self._next_id = 0
+
+    @classmethod
+    def from_columns(cls, columns, names, next_id=None, spectra=None):
+        # Tabela montada direto dos arrays de cada coluna (ex.: lidos de um
+        # projeto salvo), sem passar carga por carga. Sem a coluna 'spectrum'
+        # todas as cargas são lineares; sem 'length', usam o comprimento da
+        # instalação
+        import numpy as np
+        size = len(columns['id'])
+        table = cls()
+        if size:
+            table._columns = {name: np.asarray(columns[name], dtype=dtype) if name in columns else np.zeros(size, dtype)
+                              for name, dtype in COLUMNS.items()}
+        table.names = list(names)
+        table._name_index = {name: i for i, name in enumerate(table.names)}
+        table.spectra = list(spectra or [LINEAR])
+        table._size = size
+        table._next_id = int(columns['id'][-1]) + 1 if next_id is None and size else (next_id or 0)
+        return table
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        return self.row(index)
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self.row(i)
+
+    def __contains__(self, load_id):
+        return self.find(load_id) is not None
+
+    # Views sem cópia
+
+    def column(self, name):
+        self._reserve(0)
+        return self._columns[name][:self._size]
+
+    @property
+    def ids(self):
+        return self.column('id')
+
+    @property
+    def power(self):
+        return self.column('power')
+
+    @property
+    def pf(self):
+        return self.column('pf')
+
+    @property
+    def conn(self):
+        return self.column('conn')
+
+    @property
+    def capacitive(self):
+        return self.column('capacitive')
+
+    def arrays(self):
+        # (power, pf, sign, conn) no formato de solve_arrays
+        import numpy as np
+        return self.power, self.pf, np.where(self.capacitive, -1.0, 1.0), self.conn
+
+    # Linhas
+
+    def row(self, index):
+        columns = self._columns
+        conn = int(columns['conn'][index])
+        return {
+            "id": int(columns['id'][index]),
+            "name": self.names[columns['name'][index]],
+            "power": float(columns['power'][index]),
+            "pf": float(columns['pf'][index]),
+            "pf_type": 'Capacitivo' if columns['capacitive'][index] else 'Indutivo',
+            "phases": list(CONN_PHASES[conn]),
+            "spectrum": self.spectra[columns['spectrum'][index]],
+            "length": float(columns['length'][index]),
+        }
+
+    def find(self, load_id):
+        # Índice da linha com esse id, ou None
+        import numpy as np
+        ids = self.ids
+        index = int(np.searchsorted(ids, load_id))
+        if index < self._size and ids[index] == load_id:
+            return index
+        return None
+
+    def get(self, load_id):
+        index = self.find(load_id)
+        return None if index is None else self.row(index)
+
+    def append(self, load):
+        self._reserve(1)
+        index = self._size
+        load_id = self._next_id
+        self._write(index, load_id, load)
+        self._size += 1
+        self._next_id += 1
+        return load_id
+
+    def extend(self, loads):
+        loads = list(loads)
+        count = len(loads)
+        self._reserve(count)
+        start, stop = self._size, self._size + count
+        power, pf, sign, conn = pack_loads(loads)
+        columns = self._columns
+        columns['id'][start:stop] = range(self._next_id, self._next_id + count)
+        columns['power'][start:stop] = power
+        columns['pf'][start:stop] = pf
+        columns['conn'][start:stop] = conn
+        columns['capacitive'][start:stop] = sign < 0
+        columns['name'][start:stop] = [self._intern(load['name']) for load in loads]
+        columns['spectrum'][start:stop] = [self._spectrum(load) for load in loads]
+        columns['length'][start:stop] = [load.get('length', 0.0) for load in loads]
+        self._size = stop
+        self._next_id += count
+        return list(range(self._next_id - count, self._next_id))
+
+    def update(self, load_id, load):
+        index = self.find(load_id)
+        if index is None:
+            raise KeyError(load_id)
+        self._write(index, load_id, load)
+
+    def delete(self, load_id):
+        index = self.find(load_id)
+        if index is None:
+            raise KeyError(load_id)
+        for column in self._columns.values():
+            column[index:self._size - 1] = column[index + 1:self._size]
+        self._size -= 1
+
+    def delete_many(self, load_ids):
+        import numpy as np
+        load_ids = np.asarray(list(load_ids), dtype=np.int64)
+        keep = ~np.isin(self.ids, load_ids)
+        size = int(keep.sum())
+        if self._size - size != len(np.unique(load_ids)):
+            raise KeyError('Carga inexistente')
+        for column in self._columns.values():
+            column[:size] = column[:self._size][keep]
+        self._size = size
+
+    def insert(self, load_ids, loads):
+        # Recoloca cargas com ids já atribuídos (ex.: ao desfazer uma remoção)
+        # na posição que a ordem dos ids indica
+        import numpy as np
+        load_ids = np.asarray(list(load_ids), dtype=np.int64)
+        order = np.argsort(load_ids, kind='stable')
+        load_ids = load_ids[order]
+        loads = [loads[i] for i in order.tolist()]
+        if len(np.unique(load_ids)) != len(load_ids) or np.isin(load_ids, self.ids).any():
+            raise KeyError('Carga repetida')
+        count = len(loads)
+        self._reserve(count)
+        positions = np.searchsorted(self.ids, load_ids)
+        power, pf, sign, conn = pack_loads(loads)
+        values = {
+            'id': load_ids,
+            'power': power,
+            'pf': pf,
+            'conn': conn,
+            'capacitive': sign < 0,
+            'name': [self._intern(load['name']) for load in loads],
+            'spectrum': [self._spectrum(load) for load in loads],
+            'length': [load.get('length', 0.0) for load in loads],
+        }
+        for name, column in self._columns.items():
+            column[:self._size + count] = np.insert(column[:self._size], positions, values[name])
+        self._size += count
+        if count:
+            self._next_id = max(self._next_id, int(load_ids[-1]) + 1)
+
+    def copy(self):
+        table = LoadTable(capacity=max(self._size, 1))
+        if self._columns is not None:
+            table._reserve(self._size)
+            for name, column in table._columns.items():
+                column[:self._size] = self._columns[name][:self._size]
+        table.names = list(self.names)
+        table._name_index = dict(self._name_index)
+        table.spectra = list(self.spectra)
+        table._size = self._size
+        table._next_id = self._next_id
+        return table
+
+    def clear(self):
+        self._size = 0
+
+    def _write(self, index, load_id, load):
+        columns = self._columns
+        columns['id'][index] = load_id
+        columns['power'][index] = load['power']
+        columns['pf'][index] = load['pf']
+        columns['conn'][index] = connection_code(load['phases'])
+        columns['capacitive'][index] = load['pf_type'] == 'Capacitivo'
+        columns['name'][index] = self._intern(load['name'])
+        columns['spectrum'][index] = self._spectrum(load)
+        columns['length'][index] = load.get('length', 0.0)
+
+    def _spectrum(self, load):
+        name = load.get('spectrum', LINEAR)
+        if name not in self.spectra:
+            self.spectra.append(name)
+        return self.spectra.index(name)
+
+    def _intern(self, name):
+        index = self._name_index.get(name)
+        if index is None:
+            index = self._name_index[name] = len(self.names)
+            self.names.append(name)
+        return index
+
+    def _reserve(self, extra):
+        import numpy as np
+        needed = self._size + extra
+        capacity = 0 if self._columns is None else len(self._columns['id'])
+        if self._columns is not None and needed <= capacity:
+            return
+        capacity = max(needed, self.initial_capacity, 2 * capacity)
+        columns = {name: np.zeros(capacity, dtype) for name, dtype in COLUMNS.items()}
+        if self._columns is not None:
+            for name, column in columns.items():
+                column[:self._size] = self._columns[name][:self._size]
+        self._columns = columns
@@ -0,0 +1,83 @@
+"""Recálculo fora da thread do Tk.
+
+A interface envia cada recálculo com `submit(job)` e recebe um número de
+geração. Uma única thread executa `solve(job)`; pedidos que chegam enquanto
+um cálculo está em andamento substituem o pendente (não há fila), então
+digitar rápido não acumula trabalho. `poll`, chamado pela thread do Tk
+(root.after), devolve o resultado só se ele for da última geração: os de
+pedidos já substituídos são descartados.
+
+    worker = SolveWorker(solve)
+    worker.submit(job)
+    ...
+    result = worker.poll()    # None enquanto não houver resultado atual
+
+Exceções de `solve` são levantadas por `poll` na thread que consome.
+"""
+import threading
+
+class SolveWorker:
+    def __init__(self, solve, name='phase-solver'):
+        self.solve = solve # Executada na thread do worker: job -> resultado (não None)
+        self.name = name
+        self.generation = 0 # Último pedido enviado
+        self.discarded = 0 # Resultados obsoletos descartados
+        self._pending = None # (geração, job) ainda não iniciado
+        self._running = None # Geração em cálculo
+        self._done = None # (geração, resultado ou exceção) ainda não consumido
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, job):
+        with self._condition:
+            self.generation += 1
+            self._pending = (self.generation, job)
+            self._condition.notify_all()
+            if self._thread is None:
+                # Criada no primeiro pedido; daemon para não segurar o fechamento do programa
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            return self.generation
+
+    def busy(self):
+        # Há pedido pendente, em cálculo ou resultado ainda não consumido
+        with self._condition:
+            return self._pending is not None or self._running is not None or self._done is not None
+
+    def poll(self):
+        with self._condition:
+            done, self._done = self._done, None
+        if done is None:
+            return None
+        generation, result = done
+        if generation != self.generation:
+            self.discarded += 1
+            return None
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def wait(self, timeout=None):
+        # Bloqueia até o resultado da última geração (uso fora da interface, ex.: testes)
+        with self._condition:
+            finished = self._condition.wait_for(
+                lambda: self._done is not None and self._done[0] == self.generation, timeout)
+        return self.poll() if finished else None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None)
+                (generation, job), self._pending = self._pending, None
+                self._running = generation
+            try:
+                result = self.solve(job)
+            except Exception as e:
+                result = e
+            with self._condition:
+                self._running = None
+                if generation == self.generation:
+                    self._done = (generation, result)
+                else:
+                    self.discarded += 1 # Já substituído por um pedido mais novo
+                self._condition.notify_all()
@@ -0,0 +1,29 @@
+import random
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+sys.path.insert(0, str(SRC))
+
+# Conexões válidas de uma carga, como no formulário e na importação
+CONNECTIONS = (['A', 'N'], ['B', 'N'], ['C', 'N'], ['A', 'B'], ['B', 'C'], ['A', 'C'], ['A', 'B', 'C'])
+
+def random_load(rng, i, power=(50.0, 10_000.0), min_pf=0.6, zero=False, spectra=(), length=False):
+    # Carga aleatória válida; `zero` sorteia também potência nula, `spectra`
+    # um espectro harmônico e `length` um comprimento próprio (ou 0)
+    load = {
+        'name': f'Carga {i}',
+        'power': 0.0 if zero and rng.random() < 0.5 else rng.uniform(*power),
+        'pf': rng.choice((1.0, rng.uniform(min_pf, 1.0))),
+        'pf_type': rng.choice(('Indutivo', 'Capacitivo')),
+        'phases': list(rng.choice(CONNECTIONS)),
+    }
+    if spectra:
+        load['spectrum'] = rng.choice(list(spectra))
+    if length:
+        load['length'] = rng.choice((0.0, rng.uniform(1, 120)))
+    return load
+
+def random_loads(n, seed=0, **options):
+    rng = random.Random(seed)
+    return [random_load(rng, i, **options) for i in range(n)]
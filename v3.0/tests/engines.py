@@ -0,0 +1,113 @@
+"""Caminhos de cálculo comparados com o solver de referência.
+
+Cada motor recebe (cargas, tensão de linha) e devolve um dict só com o que
+calcula: 'Ia', 'Ib', 'Ic', 'In' (complexos), 'P', 'Q', 'currents' (corrente
+com sinal por carga) ou '|Ia|' etc. quando só há módulos. Um solver novo
+entra nos testes de equivalência ao ser registrado com @engine.
+"""
+import numpy as np
+
+from phase.cache import SolveCache
+from phase.core import Source, load_fields, load_terms, pack_loads, polar_to_complex, solve_arrays, sweep
+from phase.incremental import LoadAccumulator
+from phase.montecarlo import prepare, sample_magnitudes
+from phase.profiles import LoadProfiles, solve_profiles
+from phase.table import LoadTable
+
+ENGINES = {}
+
+def engine(name):
+    def register(function):
+        ENGINES[name] = function
+        return function
+    return register
+
+def phasors(ia, ib, ic, **extra):
+    return {'Ia': ia, 'Ib': ib, 'Ic': ic, 'In': -(ia + ib + ic), **extra}
+
+@engine('solve_arrays')
+def solve_vectorized(loads, line_voltage):
+    currents, (ia, ib, ic), p, q = solve_arrays(*pack_loads(loads), line_voltage)
+    return phasors(ia, ib, ic, P=p, Q=q, currents=currents.tolist())
+
+@engine('load_terms')
+def solve_scalar(loads, line_voltage):
+    ia = ib = ic = 0j
+    p = q = 0.0
+    currents = []
+    for load in loads:
+        current, (da, db, dc), dp, dq = load_terms(*load_fields(load), line_voltage)
+        ia, ib, ic, p, q = ia + da, ib + db, ic + dc, p + dp, q + dq
+        currents.append(current)
+    return phasors(ia, ib, ic, P=p, Q=q, currents=currents)
+
+@engine('table')
+def solve_table(loads, line_voltage):
+    table = LoadTable()
+    table.extend(loads)
+    return solve_vectorized(table, line_voltage)
+
+@engine('accumulator')
+def solve_accumulator(loads, line_voltage):
+    # Uma carga por vez a 1 V, como na interface, e a tensão aplicada no fim
+    accumulator = LoadAccumulator(1.0)
+    for key, load in enumerate(loads):
+        accumulator.add(key, load)
+    accumulator.set_voltage(line_voltage)
+    ia, ib, ic, p, q = accumulator.totals()
+    return phasors(ia, ib, ic, P=p, Q=q, currents=accumulator.currents(range(len(loads))).tolist())
+
+@engine('accumulator_extend')
+def solve_accumulator_extend(loads, line_voltage):
+    accumulator = LoadAccumulator(line_voltage)
+    accumulator.extend(enumerate(loads))
+    ia, ib, ic, p, q = accumulator.totals()
+    return phasors(ia, ib, ic, P=p, Q=q, currents=accumulator.currents(range(len(loads))).tolist())
+
+@engine('source')
+def solve_balanced_source(loads, line_voltage):
+    # Fonte desequilibrada com as três fases iguais: tabela de rotação própria
+    currents, (ia, ib, ic), p, q = solve_arrays(*pack_loads(loads), Source.balanced(line_voltage))
+    return phasors(ia, ib, ic, P=p, Q=q, currents=currents.tolist())
+
+@engine('sweep')
+def solve_sweep(loads, line_voltage):
+    ia, ib, ic, i_n = sweep(loads, [line_voltage])[0].tolist()
+    return {'Ia': ia, 'Ib': ib, 'Ic': ic, 'In': i_n}
+
+@engine('profiles')
+def solve_single_interval(loads, line_voltage):
+    # Perfil de um intervalo com as próprias potências de cada carga
+    loads = [dict(load, name=f'L{i}') for i, load in enumerate(loads)]
+    profiles = LoadProfiles([load['name'] for load in loads], np.array([[load['power'] for load in loads]]).reshape(1, -1))
+    result = solve_profiles(loads, profiles, line_voltage)
+    return phasors(result.ia[0], result.ib[0], result.ic[0], P=result.p[0], Q=result.q[0])
+
+@engine('montecarlo')
+def solve_montecarlo(loads, line_voltage):
+    # Sem tolerância todas as amostras são a carga nominal
+    magnitudes = sample_magnitudes(prepare(loads, line_voltage, power_tol=0.0), 2, np.random.default_rng(0))
+    return dict(zip(('|Ia|', '|Ib|', '|Ic|', '|In|'), magnitudes[-1].tolist()))
+
+@engine('cache')
+def solve_cached(loads, line_voltage):
+    cache = SolveCache()
+    cache.solve(loads, line_voltage)
+    results, currents = cache.solve(loads, line_voltage) # Segunda chamada vem do cache
+    assert cache.hits == 1
+    ia, ib, ic, i_n = (polar_to_complex(*results[k]) for k in ('Ia', 'Ib', 'Ic', 'In'))
+    return {'Ia': ia, 'Ib': ib, 'Ic': ic, 'In': i_n, 'P': results['P_total'], 'Q': results['Q_total'], 'currents': currents.tolist()}
+
+def assert_matches(result, expected, rtol=1e-9):
+    # `expected` no formato de phasors(); a tolerância é relativa à maior
+    # grandeza do quadro, pois somas que se cancelam perdem dígitos
+    scale_i = max([1.0] + [abs(expected[k]) for k in ('Ia', 'Ib', 'Ic')] + [abs(c) for c in expected['currents']])
+    scale_s = max(1.0, abs(expected['P']), abs(expected['Q']))
+    for key, value in result.items():
+        if key == 'currents':
+            assert np.allclose(value, expected['currents'], rtol=rtol, atol=rtol * scale_i), key
+        elif key.startswith('|'):
+            assert abs(value - abs(expected[key[1:-1]])) <= rtol * 10 * scale_i, key
+        else:
+            scale = scale_s if key in ('P', 'Q') else scale_i
+            assert abs(value - expected[key]) <= rtol * 10 * scale, (key, value, expected[key])
@@ -0,0 +1,128 @@
+"""Solver de referência: o laço original de calculate_and_plot (v2.0).
+
+Transcrição direta, carga por carga, com as convenções da versão 2.0:
+potência negativa soma 180° ao ângulo, indutiva atrasa (-φ) e capacitiva
+adianta (+φ), e FP = 0 não gera corrente. Os solvers otimizados de
+phase.core são comparados com ele em test_equivalence.py.
+
+Executado como script, regrava o gabarito golden/expected.json a partir dos
+quadros em golden/*.csv:
+
+    python tests/reference.py
+"""
+import json
+import math
+import sys
+from pathlib import Path
+
+GOLDEN = Path(__file__).resolve().parent / 'golden'
+GOLDEN_VOLTAGES = (220.0, 380.0)
+
+def polar_to_complex(mag, ang_deg):
+    ang_rad = math.radians(ang_deg)
+    return mag * (math.cos(ang_rad) + 1j * math.sin(ang_rad))
+
+def reference_solve(loads, line_voltage):
+    # Devolve (correntes por carga, (Ia, Ib, Ic), P, Q)
+    voltage_phase = line_voltage / math.sqrt(3)
+
+    total_ia = 0 + 0j
+    total_ib = 0 + 0j
+    total_ic = 0 + 0j
+
+    total_p = 0.0
+    total_q = 0.0
+    currents = []
+
+    for load in loads:
+        power = load['power']
+        pf = load['pf']
+        pf_type = load['pf_type']
+        phases = load['phases']
+
+        if pf == 0:
+            apparent_power = 0.0
+        else:
+            apparent_power = power / pf
+
+        current_mag = 0.0
+        num_phases_selected = len([p for p in phases if p in ["A", "B", "C"]])
+
+        if num_phases_selected == 1:
+            current_mag = abs(apparent_power) / voltage_phase
+        elif num_phases_selected == 2 and "N" not in phases:
+            current_mag = abs(apparent_power) / line_voltage
+        elif num_phases_selected == 3 and "N" not in phases:
+            current_mag = abs(apparent_power) / (math.sqrt(3) * line_voltage)
+
+        currents.append(current_mag if power >= 0 else -current_mag)
+
+        if pf != 1 and pf != 0:
+            q_mag = power * math.tan(math.acos(pf))
+            if power >= 0:
+                q_load = q_mag if pf_type == 'Indutivo' else -q_mag
+            else:
+                q_load = -q_mag if pf_type == 'Indutivo' else q_mag
+        else:
+            q_load = 0.0
+
+        total_p += power
+        total_q += q_load
+
+        angle_shift = math.degrees(math.acos(pf))
+
+        if power >= 0:
+            current_angle = -angle_shift if pf_type == 'Indutivo' else angle_shift
+        else:
+            current_angle = angle_shift if pf_type == 'Indutivo' else -angle_shift
+            current_angle += 180
+
+        if num_phases_selected == 1:
+            # Com ou sem neutro marcado, uma fase é ligada fase-neutro
+            if 'A' in phases:
+                total_ia += polar_to_complex(current_mag, 0 + current_angle)
+            elif 'B' in phases:
+                total_ib += polar_to_complex(current_mag, -120 + current_angle)
+            elif 'C' in phases:
+                total_ic += polar_to_complex(current_mag, 120 + current_angle)
+        elif num_phases_selected == 2 and "N" not in phases:
+            if 'A' in phases and 'B' in phases:
+                total_ia += polar_to_complex(current_mag, 30 + current_angle)
+                total_ib += polar_to_complex(current_mag, 30 + 180 + current_angle)
+            elif 'B' in phases and 'C' in phases:
+                total_ib += polar_to_complex(current_mag, -90 + current_angle)
+                total_ic += polar_to_complex(current_mag, -90 + 180 + current_angle)
+            elif 'C' in phases and 'A' in phases:
+                total_ic += polar_to_complex(current_mag, 150 + current_angle)
+                total_ia += polar_to_complex(current_mag, 150 + 180 + current_angle)
+        elif num_phases_selected == 3 and "N" not in phases:
+            total_ia += polar_to_complex(current_mag, 0 + current_angle)
+            total_ib += polar_to_complex(current_mag, -120 + current_angle)
+            total_ic += polar_to_complex(current_mag, 120 + current_angle)
+
+    return currents, (total_ia, total_ib, total_ic), total_p, total_q
+
+def write_golden():
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+    from phase.importer import read_loads
+
+    expected = {}
+    for path in sorted(GOLDEN.glob('*.csv')):
+        loads, errors = read_loads(path)
+        if errors:
+            raise SystemExit(f'{path.name}: {errors.summary()}')
+        expected[path.name] = {}
+        for line_voltage in GOLDEN_VOLTAGES:
+            currents, (ia, ib, ic), p, q = reference_solve(loads, line_voltage)
+            expected[path.name][f'{line_voltage:g}'] = {
+                'currents': currents,
+                **{k: [z.real, z.imag] for k, z in (('Ia', ia), ('Ib', ib), ('Ic', ic), ('In', -(ia + ib + ic)))},
+                'P': p,
+                'Q': q,
+            }
+    with open(GOLDEN / 'expected.json', 'w', encoding='utf-8') as f:
+        json.dump(expected, f, indent=1)
+        f.write('\n')
+
+if __name__ == '__main__':
+    write_golden()
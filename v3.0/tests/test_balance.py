@@ -0,0 +1,71 @@
+"""Balanceamento de fases (phase.balance)."""
+import itertools
+import time
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from conftest import random_loads
+from phase.balance import OBJECTIVES, OPTIONS, balance
+from phase.core import CONN_PHASES, connection_code, pack_loads, solve_arrays
+
+def reassigned(loads, conn):
+    return [dict(load, phases=list(CONN_PHASES[c])) for load, c in zip(loads, conn)]
+
+def objective(loads, objective, line_voltage=380.0):
+    _, (ia, ib, ic), _, _ = solve_arrays(*pack_loads(loads), line_voltage)
+    return OBJECTIVES[objective](ia, ib, ic)
+
+@pytest.mark.parametrize('objective_name', sorted(OBJECTIVES))
+@pytest.mark.parametrize('n, seed', [(5, 1), (40, 2), (300, 3)])
+def test_never_worse_and_matches_full_solve(n, seed, objective_name):
+    loads = random_loads(n, seed)
+    result = balance(loads, 380.0, objective=objective_name, time_budget=0.5, seed=seed)
+    assert result.after <= result.before + 1e-9
+    assert result.before == pytest.approx(objective(loads, objective_name))
+    assert result.after == pytest.approx(objective(reassigned(loads, result.conn), objective_name), abs=1e-6)
+
+def test_connection_class_is_kept():
+    loads = random_loads(200, 4)
+    result = balance(loads, 380.0, time_budget=0.5, seed=4)
+    for load, new in zip(loads, result.conn):
+        old = connection_code(load['phases'])
+        if old in OPTIONS:
+            assert new in OPTIONS[old]
+        else:
+            assert new == old # Trifásicas não mudam
+
+def test_pinned_loads_stay():
+    loads = random_loads(60, 5)
+    pinned = list(range(0, 60, 3))
+    result = balance(loads, 380.0, pinned=pinned, time_budget=0.5, seed=5)
+    assert result.after <= result.before + 1e-9
+    for i in pinned:
+        assert result.conn[i] == result.original[i]
+    assert not set(result.changed) & set(pinned)
+
+def test_all_pinned_changes_nothing():
+    loads = random_loads(10, 6)
+    result = balance(loads, 380.0, pinned=range(10))
+    assert result.changed == []
+    assert result.after == result.before
+
+def test_small_panel_is_exact_and_fast():
+    loads = random_loads(6, 7)
+    start = time.perf_counter()
+    result = balance(loads, 380.0, time_budget=1.0)
+    assert time.perf_counter() - start < 0.2
+    movable = [i for i, load in enumerate(loads) if connection_code(load['phases']) in OPTIONS]
+    best = min(
+        objective(reassigned(loads, [dict(zip(movable, choice)).get(i, connection_code(load['phases']))
+                                     for i, load in enumerate(loads)]), 'neutral')
+        for choice in itertools.product(*(OPTIONS[connection_code(loads[i]['phases'])] for i in movable)))
+    assert result.after == pytest.approx(best, abs=1e-6)
+
+def test_stops_without_improvement():
+    # Sem melhora por `patience` perturbações, não espera o prazo inteiro
+    loads = random_loads(30, 8)
+    start = time.perf_counter()
+    balance(loads, 380.0, time_budget=10.0, seed=8, patience=20)
+    assert time.perf_counter() - start < 5.0
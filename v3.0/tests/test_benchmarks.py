@@ -0,0 +1,146 @@
+"""Benchmarks do recálculo (pytest-benchmark) de 10 a 100k cargas sintéticas.
+
+Etapas medidas, as mesmas do recálculo da interface (solve_job e show_solution):
+
+- solver: solução vetorizada completa (importação/abertura de projeto), o
+  caminho incremental de uma edição (replace + totais) e o hash do cache;
+- harmônicas: solve_harmonics com metade das cargas não lineares;
+- dimensionamento: size_project de todas as cargas e do alimentador;
+- tabela: update_loads_display (precisa de display; pulado sem Tk);
+- gráfico: plot_phasors com backend Agg (sem janela).
+
+Cada caso tem um orçamento em BUDGETS (ms, média) com folga para máquinas
+mais lentas; passar do orçamento falha o teste. Para comparar com uma
+execução anterior na mesma máquina:
+
+    pytest tests/test_benchmarks.py --benchmark-autosave
+    pytest tests/test_benchmarks.py --benchmark-compare --benchmark-compare-fail=mean:20%
+
+Sem o pacote pytest-benchmark o módulo é pulado.
+"""
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+np = pytest.importorskip('numpy')
+
+from conftest import random_loads
+from phase.cache import SolveCache
+from phase.core import solve, solve_arrays
+from phase.harmonics import SPECTRA, solve_harmonics
+from phase.sizing import size_project
+from phase.incremental import LoadAccumulator
+from phase.table import LoadTable
+
+SIZES = (10, 100, 1_000, 10_000, 100_000)
+LINE_VOLTAGE = 380.0
+
+# Orçamento (ms, média) por etapa para o maior quadro; os menores usam o mesmo
+# valor, então só o crescimento fora do esperado falha
+BUDGETS = {
+    'solve': 100.0,
+    'edit': 5.0,
+    'cache_key': 20.0,
+    'harmonics': 150.0,
+    'sizing': 150.0,
+    'table': 50.0,
+    'plot': 80.0,
+}
+
+@pytest.fixture(scope='module', params=SIZES, ids=lambda n: f'{n}_loads')
+def table(request):
+    table = LoadTable()
+    # Potência positiva e negativa, indutivas e capacitivas, todas as conexões
+    table.extend(random_loads(request.param, power=(-15_000.0, 15_000.0), min_pf=0.5))
+    return table
+
+def check_budget(benchmark, stage):
+    if benchmark.disabled:
+        return
+    assert benchmark.stats.stats.mean * 1000 < BUDGETS[stage]
+
+def test_solve(benchmark, table):
+    benchmark.group = 'solve'
+    benchmark(solve_arrays, *table.arrays(), LINE_VOLTAGE)
+    check_budget(benchmark, 'solve')
+
+def test_incremental_edit(benchmark, table):
+    # Uma edição na interface: troca uma carga no acumulador e lê os totais
+    benchmark.group = 'edit'
+    accumulator = LoadAccumulator(LINE_VOLTAGE)
+    accumulator.extend_arrays(table.ids.tolist(), *table.arrays())
+    load = table[len(table) // 2]
+    edited = dict(load, power=load['power'] * 1.1)
+
+    def edit():
+        accumulator.replace(load['id'], edited)
+        return accumulator.results()
+    benchmark(edit)
+    check_budget(benchmark, 'edit')
+
+def test_cache_key(benchmark, table):
+    benchmark.group = 'cache_key'
+    benchmark(SolveCache.key, table, LINE_VOLTAGE)
+    check_budget(benchmark, 'cache_key')
+
+def test_harmonics(benchmark, table):
+    benchmark.group = 'harmonics'
+    loads = table.copy()
+    spectra = list(SPECTRA)
+    for i, load in enumerate(table):
+        if i % 2:
+            loads.update(load['id'], dict(load, spectrum=spectra[i % len(spectra)]))
+    benchmark(solve_harmonics, loads, LINE_VOLTAGE)
+    check_budget(benchmark, 'harmonics')
+
+def test_sizing(benchmark, table):
+    benchmark.group = 'sizing'
+    benchmark(size_project, table, LINE_VOLTAGE, solve(table, LINE_VOLTAGE))
+    check_budget(benchmark, 'sizing')
+
+def test_update_loads_display(benchmark, table):
+    tk = pytest.importorskip('tkinter')
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip('sem display')
+    try:
+        from phase.app import PhasorCalcApp
+        from phase.project import Project
+
+        app = PhasorCalcApp(root)
+        app.set_project(Project(table.copy(), LINE_VOLTAGE), None)
+        root.update_idletasks()
+        first = app.loads[0]
+        powers = iter(range(1, 1_000_000))
+
+        def edit_first_row():
+            # Cada rodada muda uma linha visível, como após uma edição
+            app.loads.update(first['id'], dict(first, power=float(next(powers))))
+        benchmark.group = 'table'
+        benchmark.pedantic(app.update_loads_display, setup=edit_first_row, rounds=50)
+        check_budget(benchmark, 'table')
+    finally:
+        root.destroy()
+
+def test_plot_phasors(benchmark, table):
+    matplotlib = pytest.importorskip('matplotlib')
+    matplotlib.use('Agg')
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from phase.plot import PhasorPlot
+
+    fig = Figure(figsize=(6, 5))
+    canvas = FigureCanvasAgg(fig)
+    plot = PhasorPlot(canvas, fig.add_subplot(111))
+    canvas.draw()
+    _, (ia, ib, ic), _, _ = solve_arrays(*table.arrays(), LINE_VOLTAGE)
+    # Pequenas variações a cada chamada (blit) e um reescalonamento a cada 20
+    scales = iter(np.tile(np.r_[np.linspace(1.0, 1.05, 19), 3.0], 1_000))
+
+    def update():
+        k = next(scales)
+        plot.update(ia * k, ib * k, ic * k, -(ia + ib + ic) * k)
+    benchmark.group = 'plot'
+    benchmark.pedantic(update, rounds=60)
+    check_budget(benchmark, 'plot')
@@ -0,0 +1,73 @@
+"""Linha de comando em lote (phase.cli)."""
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from phase.cli import RESULT_KEYS, main
+from phase.core import Source, solve
+from phase.importer import read_loads
+
+GOLDEN = Path(__file__).resolve().parent / 'golden'
+FILES = sorted(str(path) for path in GOLDEN.glob('*.csv'))
+
+def expected(path, line_voltage):
+    loads, _ = read_loads(path)
+    return solve(loads, line_voltage)
+
+def test_json_output(capsys):
+    assert main([*FILES, '-V', '380', '-j', '1']) == 0
+    reports = json.loads(capsys.readouterr().out)
+    assert [report['file'] for report in reports] == FILES
+    for report in reports:
+        assert set(report) == {'file', 'loads', 'rejected', 'results'}
+        assert set(report['results']) == set(RESULT_KEYS)
+        assert report['loads'] == len(read_loads(report['file'])[0])
+        for key, value in expected(report['file'], 380.0).items():
+            assert report['results'][key] == pytest.approx(list(value) if isinstance(value, tuple) else value)
+
+def test_csv_output_to_file(tmp_path, capsys):
+    out = tmp_path / 'resultados.csv'
+    assert main([*FILES, '-f', 'csv', '-o', str(out), '-j', '2']) == 0
+    assert capsys.readouterr().out == ''
+    rows = list(csv.DictReader(io.StringIO(out.read_text(encoding='utf-8'))))
+    assert list(rows[0]) == ['file', 'loads', 'rejected', 'Ia_mag', 'Ia_ang', 'Ib_mag', 'Ib_ang', 'Ic_mag', 'Ic_ang',
+                             'In_mag', 'In_ang', 'P_total', 'Q_total', 'S_total', 'PF_total', 'error']
+    assert [row['file'] for row in rows] == FILES
+    for row in rows:
+        results = expected(row['file'], 220.0)
+        assert float(row['In_mag']) == pytest.approx(results['In'][0])
+        assert float(row['P_total']) == pytest.approx(results['P_total'])
+        assert row['error'] == ''
+
+def test_missing_file_fails(tmp_path, capsys):
+    missing = str(tmp_path / 'nao_existe.csv')
+    assert main([FILES[0], missing, '-f', 'csv', '-j', '1']) == 1
+    captured = capsys.readouterr()
+    rows = list(csv.reader(io.StringIO(captured.out)))
+    assert len(rows) == 3 and len(rows[2]) == len(rows[0])
+    assert rows[2][0] == missing and rows[2][-1]
+    assert rows[1][-1] == ''
+    assert missing in captured.err
+
+def test_cache_hits_on_second_run(tmp_path, capsys):
+    cache = str(tmp_path / 'cache')
+    assert main([FILES[0], '--cache', cache, '-j', '1']) == 0
+    first = capsys.readouterr()
+    assert 'cache: 0 acerto(s), 1 falha(s)' in first.err
+    assert main([FILES[0], '--cache', cache, '-j', '1']) == 0
+    second = capsys.readouterr()
+    assert 'cache: 1 acerto(s), 0 falha(s)' in second.err
+    first_report, second_report = json.loads(first.out)[0], json.loads(second.out)[0]
+    assert (first_report['cached'], second_report['cached']) == (False, True)
+    assert second_report['results'] == first_report['results']
+
+def test_unbalanced_source(capsys):
+    assert main([FILES[0], '--phase-voltages', '223', '218', '215', '-j', '1']) == 0
+    report = json.loads(capsys.readouterr().out)[0]
+    results = expected(FILES[0], Source(223.0, 218.0, 215.0, 0.0, -120.0, 120.0))
+    assert report['results']['In'] == pytest.approx(list(results['In']))
@@ -0,0 +1,44 @@
+"""Equivalência (baseada em propriedades) entre a referência e os motores.
+
+Quadros aleatórios com todas as conexões (inclusive combinações que não
+geram corrente), potência positiva, negativa e nula, FP em [1e-3, 1] mais
+o valor 0, indutivas e capacitivas. Requer hypothesis.
+"""
+import pytest
+
+pytest.importorskip('numpy')
+pytest.importorskip('hypothesis')
+
+from hypothesis import given, settings, strategies as st
+
+from engines import ENGINES, assert_matches
+from reference import reference_solve
+
+CONNECTIONS = (
+    ['A', 'N'], ['B', 'N'], ['C', 'N'], ['A'], ['C'],
+    ['A', 'B'], ['B', 'C'], ['A', 'C'], ['A', 'B', 'C'],
+    ['A', 'B', 'N'], ['A', 'B', 'C', 'N'], ['N'],
+)
+
+loads_strategy = st.lists(st.fixed_dictionaries({
+    'name': st.just('Carga'),
+    'power': st.one_of(st.sampled_from([0.0, -0.0]), st.floats(-1e5, 1e5, allow_nan=False)),
+    # Abaixo de 1e-3 (fora de qualquer quadro real) tan(φ) é mal condicionado:
+    # tan(acos(FP)) da referência e sqrt(1 - FP²)/FP dos motores divergem,
+    # até inf para FP subnormal
+    'pf': st.one_of(st.sampled_from([0.0, 1.0]), st.floats(1e-3, 1.0)),
+    'pf_type': st.sampled_from(['Indutivo', 'Capacitivo']),
+    'phases': st.sampled_from(CONNECTIONS),
+}), max_size=40)
+
+voltage_strategy = st.one_of(st.sampled_from([127.0, 220.0, 380.0]), st.floats(1.0, 1000.0))
+
+def reference(loads, line_voltage):
+    currents, (ia, ib, ic), p, q = reference_solve(loads, line_voltage)
+    return {'Ia': ia, 'Ib': ib, 'Ic': ic, 'In': -(ia + ib + ic), 'P': p, 'Q': q, 'currents': currents}
+
+@pytest.mark.parametrize('engine_name', sorted(ENGINES))
+@settings(max_examples=150, deadline=None)
+@given(loads=loads_strategy, line_voltage=voltage_strategy)
+def test_engine_matches_reference(engine_name, loads, line_voltage):
+    assert_matches(ENGINES[engine_name](loads, line_voltage), reference(loads, line_voltage))
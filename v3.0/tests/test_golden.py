@@ -0,0 +1,48 @@
+"""Quadros reais (golden/*.csv) contra o gabarito do solver de referência.
+
+golden/expected.json foi gerado com reference.py (o laço da v2.0); todos os
+motores registrados em engines.py devem reproduzi-lo.
+"""
+import json
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from engines import ENGINES, assert_matches
+from reference import GOLDEN, reference_solve
+
+from phase.importer import read_loads
+
+with open(GOLDEN / 'expected.json', encoding='utf-8') as f:
+    EXPECTED = json.load(f)
+
+CASES = [(name, voltage) for name in sorted(EXPECTED) for voltage in sorted(EXPECTED[name])]
+
+def expected_phasors(name, voltage):
+    entry = EXPECTED[name][voltage]
+    result = {k: complex(*entry[k]) for k in ('Ia', 'Ib', 'Ic', 'In')}
+    result.update(P=entry['P'], Q=entry['Q'], currents=entry['currents'])
+    return result
+
+@pytest.fixture(scope='module')
+def panels():
+    result = {}
+    for name in EXPECTED:
+        loads, errors = read_loads(GOLDEN / name)
+        assert not errors, errors.summary()
+        result[name] = loads
+    return result
+
+@pytest.mark.parametrize('name, voltage', CASES)
+def test_reference_matches_golden(panels, name, voltage):
+    # O gabarito só muda se reference.py mudar
+    currents, (ia, ib, ic), p, q = reference_solve(panels[name], float(voltage))
+    result = {'Ia': ia, 'Ib': ib, 'Ic': ic, 'In': -(ia + ib + ic), 'P': p, 'Q': q, 'currents': currents}
+    assert_matches(result, expected_phasors(name, voltage), rtol=1e-12)
+
+@pytest.mark.parametrize('engine_name', sorted(ENGINES))
+@pytest.mark.parametrize('name, voltage', CASES)
+def test_engine_matches_golden(panels, engine_name, name, voltage):
+    result = ENGINES[engine_name](panels[name], float(voltage))
+    assert_matches(result, expected_phasors(name, voltage))
@@ -0,0 +1,136 @@
+"""Correntes harmônicas (phase.harmonics)."""
+import cmath
+import math
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from conftest import random_loads
+from phase.core import CONN_ABC, Source, connection_code, pack_loads, solve_arrays
+from phase.harmonics import CONN_BRANCHES, LINEAR, SPECTRA, register_spectrum, solve_harmonics
+from phase.importer import parse_load
+from phase.project import Project, open_project, save_project, export_json
+from phase.sequence import sequence_components
+from phase.table import LoadTable
+
+SMPS = 'Fonte chaveada (monofásica)'
+VFD = 'Inversor de frequência (6 pulsos)'
+UNBALANCED = Source(232.0, 212.0, 222.0, 0.0, -123.0, 118.0)
+
+CUSTOM = 'Teste (com ângulos)'
+CUSTOM_SPECTRUM = {3: (0.5, 40.0), 5: (0.3, -75.0), 12: (0.1, 10.0), 50: (0.01, 180.0)}
+
+@pytest.fixture(autouse=True, scope='module')
+def custom_spectrum():
+    # Espectro próprio com ângulos e ordens pares/altas, removido no fim
+    register_spectrum(CUSTOM, CUSTOM_SPECTRUM)
+    yield
+    SPECTRA.pop(CUSTOM, None)
+
+def harmonic_loads(n, seed=0):
+    # Potência positiva, negativa e nula, com todos os espectros (inclusive CUSTOM)
+    return random_loads(n, seed, power=(-5000.0, 10_000.0), min_pf=0.5, zero=True, spectra=SPECTRA)
+
+def reference_harmonics(loads, source, orders):
+    # Carga por carga e ramo por ramo: Ih = razão·|I1|∠(ângulo + h·arg I1)
+    if not isinstance(source, Source):
+        source = Source.balanced(source)
+    phasors = source.phasors()
+    currents = {h: [0j, 0j, 0j] for h in orders}
+    for load in loads:
+        power, pf = load['power'], load['pf']
+        if pf == 0:
+            continue
+        sign = 1.0 if load['pf_type'] == 'Indutivo' else -1.0
+        conj_s = complex(power, -sign * abs(power) * math.tan(math.acos(pf)))
+        for phasor, start, end, share in CONN_BRANCHES[connection_code(load['phases'])]:
+            i1 = share * conj_s / phasors[phasor].conjugate()
+            for h, (ratio, angle) in SPECTRA[load.get('spectrum', LINEAR)].items():
+                ih = ratio * abs(i1) * cmath.exp(1j * (math.radians(angle) + h * cmath.phase(i1)))
+                currents[h][start] += ih
+                if end >= 0:
+                    currents[h][end] -= ih
+    return currents
+
+@pytest.mark.parametrize('source', [220.0, 380.0, UNBALANCED], ids=['220', '380', 'desequilibrada'])
+def test_matches_per_load_reference(source):
+    loads = harmonic_loads(300)
+    result = solve_harmonics(loads, source)
+    expected = reference_harmonics(loads, source, result.orders.tolist())
+    scale = np.abs(result.currents).max()
+    for h, row in zip(result.orders.tolist(), result.currents):
+        assert np.allclose(row[:3], expected[h], rtol=1e-9, atol=1e-9 * scale), h
+    assert np.allclose(result.currents[:, 3], -result.currents[:, :3].sum(axis=1))
+
+@pytest.mark.parametrize('source', [380.0, UNBALANCED], ids=['380', 'desequilibrada'])
+def test_fundamental_matches_solver(source):
+    loads = harmonic_loads(200, seed=1)
+    _, totals, _, _ = solve_arrays(*pack_loads(loads), source)
+    assert np.allclose(solve_harmonics(loads, source).order(1)[:3], totals, rtol=1e-10)
+
+def test_triplens_add_in_neutral():
+    loads = [{'name': phase, 'power': 1000.0, 'pf': 1.0, 'pf_type': 'Indutivo', 'phases': [phase, 'N'], 'spectrum': SMPS}
+             for phase in 'ABC']
+    result = solve_harmonics(loads, 380.0)
+    ia3, ib3, ic3, in3 = result.order(3)
+    assert abs(in3) == pytest.approx(3 * abs(ia3))
+    assert abs(result.order(1)[3]) < 1e-9 # Fundamental equilibrada: nada no neutro
+    assert abs(result.order(5)[3]) < 1e-9
+    # Rotação por ordem: 5ª é sequência negativa, 7ª positiva, 3ª zero
+    for h, sequence in ((3, 0), (5, 2), (7, 1)):
+        values = sequence_components(*result.order(h)[:3]).values
+        assert abs(values[sequence]) == pytest.approx(np.abs(values).sum())
+    rms, thd = result.rms(), result.thd()
+    assert rms[3] == pytest.approx(np.sqrt((np.abs(result.currents[:, 3]) ** 2).sum()))
+    assert rms[3] > rms[0] # O neutro passa a fase
+    assert thd[3] == math.inf
+    ratios = np.array([ratio for h, (ratio, _) in SPECTRA[SMPS].items() if h > 1])
+    assert thd[0] == pytest.approx(100 * np.sqrt((ratios ** 2).sum()))
+
+def test_three_wire_loads_have_no_neutral_current():
+    loads = [dict(load, spectrum=VFD) for load in harmonic_loads(50, seed=2) if 'N' not in load['phases']]
+    assert any(connection_code(load['phases']) == CONN_ABC for load in loads)
+    result = solve_harmonics(loads, UNBALANCED)
+    assert np.abs(result.currents[:, 3]).max() < 1e-9 * np.abs(result.currents).max()
+
+def test_linear_only():
+    loads = [dict(load, spectrum=LINEAR) for load in harmonic_loads(20)]
+    result = solve_harmonics(loads, 220.0)
+    assert result.is_linear()
+    assert np.array_equal(result.thd(), np.zeros(4))
+    assert solve_harmonics([], 220.0).rms().tolist() == [0.0] * 4
+
+def test_spectrum_validation():
+    with pytest.raises(ValueError):
+        register_spectrum('Inválido', {60: (0.1, 0.0)})
+    with pytest.raises(ValueError):
+        register_spectrum('Inválido', {1: (0.9, 0.0)})
+    with pytest.raises(ValueError):
+        solve_harmonics([dict(harmonic_loads(1)[0], spectrum='Não existe')], 220.0)
+
+def test_table_import_and_project(tmp_path):
+    assert parse_load({'name': 'PC', 'power': '300', 'phases': 'A N', 'spectrum': SMPS.upper()})['spectrum'] == SMPS
+    assert 'spectrum' not in parse_load({'name': 'R', 'power': '300', 'phases': 'A N'})
+    assert isinstance(parse_load({'name': 'R', 'power': '300', 'phases': 'A N', 'spectrum': 'xyz'}), str)
+
+    loads = harmonic_loads(100, seed=3)
+    table = LoadTable()
+    table.extend(loads)
+    assert [load['spectrum'] for load in table] == [load['spectrum'] for load in loads]
+    expected = solve_harmonics(loads, 380.0).currents
+    assert np.allclose(solve_harmonics(table, 380.0).currents, expected)
+
+    for path, write in ((tmp_path / 'p.phase', save_project), (tmp_path / 'p.json', export_json)):
+        write(path, Project(table, 380.0))
+        SPECTRA.pop(CUSTOM)
+        opened = open_project(path).loads # O espectro próprio volta com o projeto
+        assert SPECTRA[CUSTOM] == dict(sorted({1: (1.0, 0.0), **CUSTOM_SPECTRUM}.items()))
+        assert [load['spectrum'] for load in opened] == [load['spectrum'] for load in loads]
+        assert np.allclose(solve_harmonics(opened, 380.0).currents, expected)
+
+    # Projeto salvo antes dos harmônicos: sem a coluna, tudo linear
+    columns = {name: table.column(name) for name in ('id', 'power', 'pf', 'conn', 'capacitive', 'name')}
+    old = LoadTable.from_columns(columns, table.names)
+    assert {load['spectrum'] for load in old} == {LINEAR}
+
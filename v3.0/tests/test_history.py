@@ -0,0 +1,168 @@
+"""Desfazer/refazer (phase.history) aplicado à tabela e ao acumulador da interface."""
+import random
+from types import MethodType, SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from conftest import random_load
+from phase.app import PhasorCalcApp
+from phase.core import polar_to_complex, solve
+from phase.history import Change, History
+from phase.incremental import LoadAccumulator
+from phase.table import LoadTable
+
+class FakeEntry:
+    def __init__(self, text):
+        self.text = text
+
+    def get(self):
+        return self.text
+
+def make_app(voltage='220'):
+    # Só o estado que o histórico usa; os métodos são os da interface, sem Tk
+    app = SimpleNamespace(
+        loads=LoadTable(), accumulator=LoadAccumulator(line_voltage=float(voltage)), history=History(),
+        source=None, sizing_window=None, editing_id=None, _busy_after='agendado', _polling=True,
+        _history_voltage=voltage, _plotted_voltage=voltage, line_voltage_entry=FakeEntry(voltage),
+        voltage_debouncer=SimpleNamespace(cancel=lambda: None), root=SimpleNamespace(after=lambda *args: None),
+        submitted=[])
+    app.solver = SimpleNamespace(submit=app.submitted.append)
+    app.update_history_menu = lambda: None
+    app.clear_form = lambda: setattr(app, 'editing_id', None)
+    app.set_voltage_text = lambda text: setattr(app.line_voltage_entry, 'text', text)
+    for name in ('record', 'do', 'undo', 'redo', 'apply_change', 'calculate_and_plot', 'commit_voltage_edit'):
+        setattr(app, name, MethodType(getattr(PhasorCalcApp, name), app))
+    return app
+
+def add(app, loads, label):
+    # Como add_load e import_loads: tabela e acumulador primeiro, depois o passo
+    load_ids = app.loads.extend(loads)
+    app.accumulator.extend(zip(load_ids, loads))
+    app.record(Change.added(label, zip(load_ids, loads)))
+    app.calculate_and_plot()
+
+def type_voltage(app, text):
+    app.line_voltage_entry.text = text
+    app.calculate_and_plot() # O que o debounce executaria
+
+def state(app):
+    return list(app.loads), app.line_voltage_entry.get()
+
+def assert_solution(app):
+    # O acumulador (e o que foi enviado ao worker) deve bater com a solução completa
+    expected = solve(list(app.loads), float(app.line_voltage_entry.get()))
+    for results in (app.accumulator.results(), app.submitted[-1][2]):
+        for key, value in expected.items():
+            # Correntes comparadas em forma retangular: o ângulo de um resíduo nulo é arbitrário
+            if isinstance(value, tuple):
+                assert abs(polar_to_complex(*results[key]) - polar_to_complex(*value)) < 1e-6, key
+            else:
+                assert results[key] == pytest.approx(value, rel=1e-9, abs=1e-6), key
+
+def test_change_inverse_and_split():
+    a, b, c = ({'name': name, 'power': 100.0, 'pf': 1.0, 'pf_type': 'Indutivo', 'phases': ['A', 'N']} for name in 'abc')
+    change = Change('Passo', [(1, None, a), (2, b, None), (3, b, c)], voltage=('220', '380'))
+    assert change.split() == ([(2, b)], [(1, a)], [(3, c)])
+    inverse = change.inverse()
+    assert inverse.split() == ([(1, a)], [(2, b)], [(3, b)])
+    assert inverse.voltage == ('380', '220')
+    assert inverse.inverse().rows == change.rows
+    assert Change.removed('x', [(4, a)]).inverse().rows == Change.added('x', [(4, a)]).rows
+
+def test_history_stacks():
+    history = History(limit=2)
+    first, second, third = Change('1'), Change('2'), Change('3')
+    for change in (first, second, third):
+        history.record(change)
+    assert history.undo_label == '3'
+    assert history.undo().label == '3'
+    assert history.undo().label == '2'
+    assert history.undo() is None # Limite de 2 passos
+    assert history.redo_label == '2'
+    assert history.redo() is second
+    history.record(Change('4'))
+    assert history.redo_label is None
+
+def test_insert_restores_positions():
+    rng = random.Random(1)
+    table = LoadTable()
+    loads = [random_load(rng, i) for i in range(20)]
+    table.extend(loads)
+    original = list(table)
+    removed = [table.get(load_id) for load_id in (0, 5, 6, 19)]
+    table.delete_many(load['id'] for load in removed)
+    assert len(table) == 16
+    table.insert([load['id'] for load in removed[::-1]], removed[::-1])
+    assert list(table.ids) == list(range(20))
+    assert list(table) == original
+    with pytest.raises(KeyError):
+        table.insert([3], [loads[3]])
+    with pytest.raises(KeyError):
+        table.delete_many([3, 99])
+
+def test_undo_redo_against_full_solve():
+    rng = random.Random(2)
+    app = make_app()
+    states = [state(app)]
+    app.calculate_and_plot()
+
+    add(app, [random_load(rng, 0)], 'Adicionar carga')
+    states.append(state(app))
+    add(app, [random_load(rng, i) for i in range(1, 101)], 'Importar planilha') # > 64: accumulator.extend
+    states.append(state(app))
+    load_id = app.loads.ids[10]
+    app.do(Change('Modificar carga', [(int(load_id), app.loads.get(load_id), dict(random_load(rng, 200), name='Modificada'))]))
+    states.append(state(app))
+    app.do(Change.removed('Deletar carga', [(load['id'], load) for load in list(app.loads)[20:30]]))
+    states.append(state(app))
+    type_voltage(app, '380')
+    states.append(state(app))
+    app.do(Change.removed('Deletar carga', [(load['id'], load) for load in list(app.loads)[:5]]))
+    states.append(state(app))
+    assert_solution(app)
+
+    for expected in reversed(states[:-1]):
+        app.undo()
+        assert state(app) == expected
+        assert_solution(app)
+    assert app.history.undo_label is None
+    for expected in states[1:]:
+        app.redo()
+        assert state(app) == expected
+        assert_solution(app)
+    assert app.history.redo_label is None
+
+def test_pending_voltage_edit_keeps_redo():
+    rng = random.Random(3)
+    app = make_app()
+    add(app, [random_load(rng, 0)], 'Adicionar carga')
+    add(app, [random_load(rng, 1)], 'Adicionar carga')
+    loads = list(app.loads)
+
+    # Tensão digitada, ainda no debounce: vira um passo próprio, que é o
+    # desfeito; antes ela era registrada depois do desfazer e apagava o refazer
+    app.line_voltage_entry.text = '380'
+    app.undo()
+    assert state(app) == (loads, '220')
+    assert app.history.redo_label == 'Alterar tensão'
+    app.undo()
+    assert state(app) == (loads[:1], '220')
+    app.redo()
+    app.redo()
+    assert state(app) == (loads, '380')
+    assert app.history.redo_label is None
+    assert_solution(app)
+
+def test_pending_invalid_voltage_is_discarded():
+    rng = random.Random(4)
+    app = make_app()
+    add(app, [random_load(rng, 0)], 'Adicionar carga')
+    app.line_voltage_entry.text = ''
+    app.undo()
+    assert state(app) == ([], '220')
+    assert app.history.redo_label == 'Adicionar carga'
+    app.redo()
+    assert len(app.loads) == 1
+    assert_solution(app)
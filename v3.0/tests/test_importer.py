@@ -0,0 +1,86 @@
+"""Validação das linhas importadas (phase.importer)."""
+import pytest
+
+from phase.importer import parse_load, parse_number, parse_phases, read_loads
+
+def load(**fields):
+    return parse_load({'name': 'a', 'power': '100', 'phases': 'A N', **fields})
+
+def test_defaults():
+    assert load() == {'name': 'a', 'power': 100.0, 'pf': 1.0, 'pf_type': 'Indutivo', 'phases': ['A', 'N']}
+
+@pytest.mark.parametrize('power, pf', [('nan', '1'), ('inf', '1'), ('-inf', '0.9'), ('100', 'nan'), ('100', 'inf'),
+                                       ('1e400', '1'), (float('nan'), 1.0), (100.0, float('inf'))])
+def test_non_finite_values_are_rejected(power, pf):
+    assert isinstance(load(power=power, pf=pf), str)
+
+@pytest.mark.parametrize('power, pf', [('abc', '1'), ('100', 'x'), ('', '1'), ('100', '1.5'), ('100', '-0.2'), ('100', '0')])
+def test_invalid_numbers_are_rejected(power, pf):
+    assert isinstance(load(power=power, pf=pf), str)
+
+@pytest.mark.parametrize('text, value', [('1,5', 1.5), (' 2 500,25 ', 2500.25), ('0,92', 0.92), ('1.5', 1.5), (3, 3.0)])
+def test_decimal_comma(text, value):
+    assert parse_number(text) == value
+
+def test_decimal_comma_in_load():
+    assert load(power='1500,5', pf='0,85', length='12,5') == {
+        'name': 'a', 'power': 1500.5, 'pf': 0.85, 'pf_type': 'Indutivo', 'phases': ['A', 'N'], 'length': 12.5}
+
+@pytest.mark.parametrize('text, phases', [
+    ('A N', ['A', 'N']), ('b-n', ['B', 'N']), ('C/Neutro', ['C', 'N']), ('AB', ['A', 'B']),
+    ('C,A', ['A', 'C']), ('ABC', ['A', 'B', 'C']), ('A B C N', ['A', 'B', 'C', 'N']),
+])
+def test_phases(text, phases):
+    assert parse_phases(text) == phases
+
+@pytest.mark.parametrize('phases', ['Z', 'A X', 'R-N', 'A', 'N', ''])
+def test_unknown_or_incomplete_phases_are_rejected(phases):
+    assert isinstance(load(phases=phases), str)
+
+@pytest.mark.parametrize('pf_type, expected', [('ind', 'Indutivo'), ('Lagging', 'Indutivo'), ('C', 'Capacitivo'),
+                                               ('capacitivo', 'Capacitivo'), ('', 'Indutivo')])
+def test_pf_types(pf_type, expected):
+    assert load(pf='0.9', pf_type=pf_type)['pf_type'] == expected
+
+def test_unknown_pf_type_is_rejected():
+    assert 'whatever' in load(pf_type='whatever')
+
+@pytest.mark.parametrize('length', ['inf', '-inf', 'nan', '-1', 'abc', float('inf')])
+def test_invalid_length_is_rejected(length):
+    assert isinstance(load(length=length), str)
+
+def test_zero_length_uses_installation():
+    assert 'length' not in load(length='0')
+
+def test_bad_row_does_not_stop_import(tmp_path):
+    path = tmp_path / 'quadro.csv'
+    path.write_text('name,power,phases\nBoa,100,A N\nRuim,nan,B N\nOutra,200,A B\n', encoding='utf-8')
+    loads, errors = read_loads(path)
+    assert [load['name'] for load in loads] == ['Boa', 'Outra']
+    assert [row for row, _ in errors] == [3]
+
+def test_semicolon_csv_with_portuguese_header(tmp_path):
+    # Como o Excel grava: BOM, ponto e vírgula e vírgula decimal
+    path = tmp_path / 'quadro.csv'
+    path.write_text('\ufeffNome;Potência (W);FP;Tipo FP;Fases;Comprimento (m)\n'
+                    'Chuveiro;5500;1;Indutivo;A N;\n'
+                    'Motor;3000,5;0,8;ind;A B C;25,5\n'
+                    '\n'
+                    'Fantasma;100;1;Indutivo;Z;\n'
+                    'Longe;100;1;Indutivo;B N;inf\n', encoding='utf-8')
+    loads, errors = read_loads(path)
+    assert [(load['name'], load['power'], load['pf'], load.get('length')) for load in loads] == [
+        ('Chuveiro', 5500.0, 1.0, None), ('Motor', 3000.5, 0.8, 25.5)]
+    assert [row for row, _ in errors] == [5, 6] # A linha em branco é ignorada, mas conta
+    assert 'Linha 5' in errors.summary()
+
+def test_missing_columns(tmp_path):
+    path = tmp_path / 'quadro.csv'
+    path.write_text('name,pf\na,1\n', encoding='utf-8')
+    loads, errors = read_loads(path)
+    assert loads == []
+    assert 'phases' in errors[0][1] and 'power' in errors[0][1]
+
+def test_unsupported_format(tmp_path):
+    with pytest.raises(ValueError):
+        read_loads(tmp_path / 'quadro.ods')
@@ -0,0 +1,39 @@
+"""Simulação de Monte Carlo (phase.montecarlo)."""
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from conftest import random_loads
+from phase.core import solve
+from phase.montecarlo import iter_simulate, simulate
+
+LOADS = random_loads(30, seed=5)
+
+def test_independent_of_jobs():
+    # Mesma semente e shard_size: o mesmo resultado em um ou em vários processos
+    serial = simulate(LOADS, 380.0, 2_500, power_tol=0.2, pf_range=(0.8, 1.0), seed=42, jobs=1, shard_size=1_000)
+    parallel = simulate(LOADS, 380.0, 2_500, power_tol=0.2, pf_range=(0.8, 1.0), seed=42, jobs=2, shard_size=1_000)
+    assert len(serial) == len(parallel) == 2_500
+    np.testing.assert_array_equal(serial.magnitudes, parallel.magnitudes)
+    for label, values in serial.percentiles().items():
+        np.testing.assert_array_equal(values, parallel.percentiles()[label])
+
+def test_same_seed_repeats():
+    first = simulate(LOADS, 220.0, 1_200, seed=7, jobs=1, shard_size=500)
+    np.testing.assert_array_equal(first.magnitudes, simulate(LOADS, 220.0, 1_200, seed=7, jobs=1, shard_size=500).magnitudes)
+    assert not np.array_equal(first.magnitudes, simulate(LOADS, 220.0, 1_200, seed=8, jobs=1, shard_size=500).magnitudes)
+    # Sem semente, a usada fica em `entropy` e repete a simulação
+    unseeded = simulate(LOADS, 220.0, 1_200, jobs=1, shard_size=500)
+    np.testing.assert_array_equal(unseeded.magnitudes,
+                                  simulate(LOADS, 220.0, 1_200, seed=unseeded.entropy, jobs=1, shard_size=500).magnitudes)
+
+def test_chunks_follow_shards():
+    chunks = list(iter_simulate(LOADS, 220.0, 1_200, seed=np.random.SeedSequence(3), jobs=1, shard_size=500))
+    assert [len(chunk) for chunk in chunks] == [500, 500, 200]
+    np.testing.assert_array_equal(np.concatenate(chunks), simulate(LOADS, 220.0, 1_200, seed=3, jobs=1, shard_size=500).magnitudes)
+
+def test_no_tolerance_matches_solve():
+    result = simulate(LOADS, 380.0, 10, power_tol=0.0, seed=1, jobs=1)
+    expected = solve(LOADS, 380.0)
+    for label in ('Ia', 'Ib', 'Ic', 'In'):
+        np.testing.assert_allclose(result.column(label), expected[label][0], rtol=1e-9)
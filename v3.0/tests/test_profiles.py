@@ -0,0 +1,86 @@
+"""Perfis de carga no tempo (phase.profiles)."""
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from phase import profiles as profiles_module
+from phase.core import solve
+from phase.profiles import LoadProfiles, read_profiles, solve_profiles
+
+LOADS = [
+    {'name': 'Chuveiro', 'power': 5500.0, 'pf': 1.0, 'pf_type': 'Indutivo', 'phases': ['A', 'N']},
+    {'name': 'Motor', 'power': 3000.0, 'pf': 0.8, 'pf_type': 'Indutivo', 'phases': ['A', 'B', 'C']},
+    {'name': 'Geladeira', 'power': 150.0, 'pf': 0.9, 'pf_type': 'Capacitivo', 'phases': ['B', 'C']},
+    {'name': 'Forno', 'power': 2000.0, 'pf': 0.95, 'pf_type': 'Indutivo', 'phases': ['C', 'N']},
+]
+
+def profile_values(intervals=96, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0, 6000, size=(intervals, 3))
+
+def check_against_solve(result, values, names):
+    # Cada intervalo deve bater com a solução completa do quadro com aquelas potências
+    for k in (0, len(values) // 2, len(values) - 1):
+        loads = [dict(load, power=values[k, names.index(load['name'])]) if load['name'] in names else load
+                 for load in LOADS]
+        expected = solve(loads, 380.0)
+        assert abs(result.ia[k]) == pytest.approx(expected['Ia'][0], rel=1e-9)
+        assert abs(result.in_[k]) == pytest.approx(expected['In'][0], rel=1e-9, abs=1e-9)
+        assert result.p[k] == pytest.approx(expected['P_total'], rel=1e-9)
+
+def test_chunks_match_single_pass(monkeypatch):
+    names = ['Chuveiro', 'Motor', 'Forno']
+    values = profile_values()
+    whole = solve_profiles(LOADS, LoadProfiles(names, values), 380.0)
+    monkeypatch.setattr(profiles_module, 'MAX_CELLS', 7) # Blocos de 2 intervalos
+    chunked = solve_profiles(LOADS, LoadProfiles(names, values), 380.0)
+    np.testing.assert_allclose(chunked.ia, whole.ia)
+    np.testing.assert_allclose(chunked.p, whole.p)
+    assert chunked.individual_peak == pytest.approx(whole.individual_peak)
+    check_against_solve(whole, values, names)
+
+def test_memmap_profiles(tmp_path):
+    names = ['Chuveiro', 'Motor', 'Forno']
+    values = profile_values()
+    np.save(tmp_path / 'perfis.npy', values)
+    mapped = np.load(tmp_path / 'perfis.npy', mmap_mode='r')
+    result = solve_profiles(LOADS, LoadProfiles(names, mapped), 380.0)
+    np.testing.assert_allclose(result.p, solve_profiles(LOADS, LoadProfiles(names, values), 380.0).p)
+
+def test_csv_profiles(tmp_path):
+    values = profile_values(4)
+    lines = ['hora;Chuveiro;Motor;Forno']
+    lines += [f'2024-01-01 {k:02d}:00;' + ';'.join(f'{v:.6f}'.replace('.', ',') for v in row) for k, row in enumerate(values)]
+    path = tmp_path / 'perfis.csv'
+    path.write_text('\n'.join(lines), encoding='utf-8')
+    profiles = read_profiles(path)
+    assert profiles.names == ['Chuveiro', 'Motor', 'Forno']
+    assert profiles.step_hours == 1.0
+    np.testing.assert_allclose(profiles.values, values, atol=1e-6)
+
+def test_parquet_profiles_read_in_batches(tmp_path, monkeypatch):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    names = ['Chuveiro', 'Motor', 'Forno']
+    values = profile_values(1000)
+    table = pa.table({'hora': pa.array(np.arange(1000) * 900, type=pa.timestamp('s')),
+                      **{name: values[:, j] for j, name in enumerate(names)}})
+    path = tmp_path / 'perfis.parquet'
+    pq.write_table(table, path, row_group_size=300)
+    profiles = read_profiles(path)
+    assert profiles.names == names
+    assert len(profiles) == 1000
+    assert profiles.step_hours == 0.25
+    np.testing.assert_allclose(profiles.column('Motor'), values[:, 1])
+    monkeypatch.setattr(profiles_module, 'MAX_CELLS', 3 * 128)
+    result = solve_profiles(LOADS, profiles, 380.0)
+    np.testing.assert_allclose(result.p, solve_profiles(LOADS, LoadProfiles(names, values), 380.0).p)
+
+@pytest.mark.parametrize('text', ['L1,L2\n\n1,2\n3,4\n', 'hora;L1;L2\n\n2024-01-01 00:00;1;2\n\n2024-01-01 00:15;3;4\n'])
+def test_csv_blank_lines(tmp_path, text):
+    path = tmp_path / 'perfis.csv'
+    path.write_text(text, encoding='utf-8')
+    profiles = read_profiles(path)
+    assert profiles.names == ['L1', 'L2']
+    assert profiles.step_hours == (0.25 if text.startswith('hora') else 1.0)
+    np.testing.assert_allclose(profiles.values, [[1, 2], [3, 4]])
@@ -0,0 +1,100 @@
+"""Leitura e gravação de projetos (phase.project)."""
+import json
+import math
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from phase.project import Project, export_json, open_project, save_project
+from phase.table import LoadTable
+
+LOADS = [
+    {'name': 'Chuveiro', 'power': 5500.0, 'pf': 1.0, 'pf_type': 'Indutivo', 'phases': ['A', 'N']},
+    {'name': 'Motor', 'power': 3000.0, 'pf': 0.8, 'pf_type': 'Indutivo', 'phases': ['A', 'B', 'C']},
+    {'name': 'Reator', 'power': 200.0, 'pf': 0.9, 'pf_type': 'Capacitivo', 'phases': ['B', 'C']},
+]
+
+def project():
+    table = LoadTable()
+    table.extend(LOADS)
+    return Project(table, 380.0)
+
+def write_json(tmp_path, **changes):
+    path = tmp_path / 'p.json'
+    export_json(path, project())
+    document = json.loads(path.read_text(encoding='utf-8'))
+    document['loads'][1].update(changes)
+    path.write_text(json.dumps(document), encoding='utf-8')
+    return path
+
+@pytest.mark.parametrize('path_name, write', [('p.phase', save_project), ('p.json', export_json)])
+def test_round_trip(tmp_path, path_name, write):
+    write(tmp_path / path_name, project())
+    loaded = open_project(tmp_path / path_name)
+    assert [dict(load, id=None) for load in loaded.loads] == [dict(load, id=None) for load in project().loads]
+
+@pytest.mark.parametrize('changes', [
+    {'pf': 5.0},
+    {'pf': -0.1},
+    {'pf': 0.0},
+    {'phases': ['Z']},
+    {'phases': ['A', 'Z', 'N']},
+    {'phases': ['A']},
+    {'phases': 'A,B,C'},
+    {'pf_type': 'whatever'},
+    {'power': float('nan')},
+    {'power': float('inf')},
+    {'power': '3000'},
+    {'length': -1.0},
+])
+def test_json_rejects_invalid_load(tmp_path, changes):
+    path = write_json(tmp_path, **changes)
+    with pytest.raises(ValueError, match='carga 2'):
+        open_project(path)
+
+@pytest.mark.parametrize('column, value', [('power', math.nan), ('power', math.inf), ('pf', 1.5), ('pf', -1.0), ('pf', 0.0),
+                                           ('conn', 0), ('length', math.inf), ('length', -1.0)])
+def test_phase_file_rejects_invalid_columns(tmp_path, column, value):
+    saved = project()
+    saved.loads.column(column)[1] = value
+    save_project(tmp_path / 'p.phase', saved)
+    with pytest.raises(ValueError, match='corrompido'):
+        open_project(tmp_path / 'p.phase')
+
+@pytest.mark.parametrize('changes', [
+    {'line_voltage': 'abc'},
+    {'line_voltage': -5},
+    {'line_voltage': 0},
+    {'line_voltage': float('nan')},
+    {'line_voltage': float('inf')},
+    {'line_voltage': True},
+    {'pinned': 5},
+    {'pinned': ['a']},
+    {'metadata': 'x'},
+])
+def test_json_rejects_invalid_settings(tmp_path, changes):
+    path = tmp_path / 'p.json'
+    export_json(path, project())
+    document = json.loads(path.read_text(encoding='utf-8'))
+    document.update(changes)
+    path.write_text(json.dumps(document), encoding='utf-8')
+    with pytest.raises(ValueError, match='corrompido'):
+        open_project(path)
+
+@pytest.mark.parametrize('line_voltage, pinned', [('abc', ()), (-5.0, ()), (math.inf, ()), (380.0, ('x',))])
+def test_phase_file_rejects_invalid_settings(tmp_path, line_voltage, pinned):
+    saved = project()
+    saved.line_voltage, saved.pinned = line_voltage, set(pinned)
+    save_project(tmp_path / 'p.phase', saved)
+    with pytest.raises(ValueError, match='corrompido'):
+        open_project(tmp_path / 'p.phase')
+
+@pytest.mark.parametrize('mmap', [False, True])
+def test_phase_file_settings_round_trip(tmp_path, mmap):
+    saved = project()
+    saved.line_voltage, saved.pinned = 220.0, {0, 2}
+    save_project(tmp_path / 'p.phase', saved)
+    loaded = open_project(tmp_path / 'p.phase', mmap=mmap)
+    assert (loaded.line_voltage, loaded.pinned) == (220.0, {0, 2})
+    assert list(loaded.loads) == list(saved.loads)
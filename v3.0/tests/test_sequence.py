@@ -0,0 +1,78 @@
+"""Componentes simétricas (phase.sequence)."""
+import math
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from phase import results_sequence, sequence_components, solve, sweep
+from phase.core import polar_to_complex
+from phase.profiles import LoadProfiles, solve_profiles
+
+A = polar_to_complex(1, 120)
+
+LOADS = [
+    {'name': 'Chuveiro', 'power': 5400.0, 'pf': 1.0, 'pf_type': 'Indutivo', 'phases': ['A', 'N']},
+    {'name': 'Geladeira', 'power': 350.0, 'pf': 0.8, 'pf_type': 'Indutivo', 'phases': ['B', 'N']},
+    {'name': 'Forno', 'power': 3000.0, 'pf': 1.0, 'pf_type': 'Indutivo', 'phases': ['B', 'C']},
+    {'name': 'Motor', 'power': 7500.0, 'pf': 0.82, 'pf_type': 'Indutivo', 'phases': ['A', 'B', 'C']},
+]
+
+def test_pure_sequences():
+    positive = sequence_components(10, 10 * A**2, 10 * A)
+    assert np.allclose(positive.values, [0, 10, 0], atol=1e-12)
+    negative = sequence_components(10, 10 * A, 10 * A**2)
+    assert np.allclose(negative.values, [0, 0, 10], atol=1e-12)
+    assert negative.negative_unbalance == math.inf
+    zero = sequence_components(4, 4, 4)
+    assert np.allclose(zero.values, [4, 0, 0], atol=1e-12)
+    assert zero.negative_unbalance == 0.0
+    assert sequence_components(0j, 0j, 0j).negative_unbalance == 0.0
+
+def test_batch_matches_single_results():
+    rng = np.random.default_rng(1)
+    ia, ib, ic = rng.normal(size=(3, 5000)) + 1j * rng.normal(size=(3, 5000))
+    batch = sequence_components(ia, ib, ic)
+    assert batch.values.shape == (5000, 3)
+    for i in (0, 17, 4999):
+        single = sequence_components(ia[i], ib[i], ic[i])
+        assert np.allclose(single.values, batch.values[i], rtol=1e-14)
+    # Transformada inversa: Ia = I0 + I1 + I2, Ib = I0 + a²I1 + aI2
+    i0, i1, i2 = batch.values.T
+    assert np.allclose(i0 + i1 + i2, ia)
+    assert np.allclose(i0 + A**2 * i1 + A * i2, ib)
+    assert np.allclose(i0 + A * i1 + A**2 * i2, ic)
+
+def test_results_and_neutral():
+    res = solve(LOADS, 380.0)
+    sequence = results_sequence(res)
+    assert len(sequence) == 1
+    assert sequence.zero[0] == pytest.approx(-polar_to_complex(*res['In']) / 3)
+    unbalance = abs(sequence.negative[0]) / abs(sequence.positive[0]) * 100
+    assert sequence.negative_unbalance[0] == pytest.approx(unbalance)
+    assert len(results_sequence([res, solve(LOADS, 220.0)])) == 2
+
+def test_sweep_history():
+    # Todas as correntes escalam com 1/V, então o desequilíbrio não muda
+    voltages = np.linspace(200, 240, 41)
+    currents = sweep(LOADS, voltages)
+    sequence = sequence_components(*currents[:, :3].T)
+    assert np.allclose(sequence.negative_unbalance, sequence.negative_unbalance[0])
+    assert np.allclose(np.abs(sequence.positive) * voltages, abs(sequence.positive[0]) * voltages[0])
+
+def test_profile_sequence():
+    step = 0.25
+    hours = np.arange(96) * step
+    shower = np.where((hours >= 6) & (hours < 7), 5400.0, 0.0)
+    profiles = LoadProfiles(['Chuveiro'], shower[:, None], step_hours=step)
+    result = solve_profiles(LOADS, profiles, 380.0)
+    sequence = result.sequence()
+    assert sequence.values.shape == (96, 3)
+    i = int(np.argmax(shower))
+    expected = sequence_components(result.ia[i], result.ib[i], result.ic[i])
+    assert np.allclose(sequence.values[i], expected.values)
+    assert np.array_equal(result.series('I2/I1'), sequence.negative_unbalance)
+    # Dois patamares (chuveiro ligado 1 h, desligado 23 h)
+    on, off = sequence.negative_unbalance[i], sequence.negative_unbalance[0]
+    assert np.allclose(sequence.negative_unbalance, np.where(shower > 0, on, off))
+    assert sequence.hours_above(min(on, off) + 1e-6, step) == pytest.approx(1.0 if on > off else 23.0)
@@ -0,0 +1,140 @@
+"""Dimensionamento de condutores e disjuntores (phase.sizing)."""
+import math
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from conftest import random_loads
+from phase.core import CONN_ABC, Source, connection_code, load_terms, solve
+from phase.harmonics import SPECTRA, solve_harmonics
+from phase.importer import parse_load
+from phase.project import Project, export_json, open_project, save_project
+from phase.sizing import (AMPACITY, BREAKERS, FEEDER, REACTANCE, RESISTIVITY, SECTIONS, Installation,
+                          check_installation, correction_factor, size_project)
+from phase.table import LoadTable
+
+SHOWER = {'name': 'Chuveiro', 'power': 5500.0, 'pf': 1.0, 'pf_type': 'Indutivo', 'phases': ['A', 'N']}
+
+def random_table(n, seed=0):
+    table = LoadTable()
+    table.extend(random_loads(n, seed, power=(50.0, 30_000.0), length=True))
+    return table
+
+def reference_sizing(load, line_voltage, installation):
+    # Um circuito por vez: menor disjuntor >= Ib e menor seção que atende Iz e ΔV
+    conn = connection_code(load['phases'])
+    current = load_terms(load['power'], load['pf'], 1.0, conn, line_voltage)[0]
+    three_phase = conn == CONN_ABC
+    voltage = line_voltage if len(load['phases']) != 2 or 'N' not in load['phases'] else line_voltage / math.sqrt(3)
+    breaker = next(b for b in BREAKERS if b >= current)
+    k = math.sqrt(3) if three_phase else 2.0
+    length = load['length'] or installation.length
+    pf = load['pf']
+    for column, section in enumerate(SECTIONS):
+        iz = AMPACITY[installation.method][1 if three_phase else 0][column] * correction_factor(installation)
+        drop = 100 * k * current * length * (RESISTIVITY / section * pf + REACTANCE * math.sqrt(1 - pf**2)) / voltage
+        if section >= installation.min_section and iz >= breaker and drop <= installation.max_drop:
+            return current, breaker, section, drop
+    return current, breaker, math.nan, math.nan
+
+def test_shower_by_hand():
+    result = size_project([SHOWER], 220.0, solve([SHOWER], 220.0))
+    # 5500 W / 127 V = 43,3 A -> disjuntor 50 A -> 10 mm² (B1, 2 condutores: 57 A)
+    assert result.current[0] == pytest.approx(5500 / (220 / math.sqrt(3)))
+    assert (result.breaker[0], result.section[0], result.ampacity[0]) == (50, 10, 57)
+    assert result.drop[0] == pytest.approx(100 * 2 * result.current[0] * 20 * RESISTIVITY / 10 / (220 / math.sqrt(3)))
+    # A 40 °C (fator 0,87) 10 mm² já não atende os 50 A
+    hot = size_project([SHOWER], 220.0, solve([SHOWER], 220.0), Installation(ambient=40))
+    assert hot.section[0] == 16
+
+@pytest.mark.parametrize('installation', [Installation(), Installation('C', 40, 4, 50, 3, 4), Installation('D', 25, 2, 10, 5, 1.5)],
+                         ids=['padrão', 'C', 'D'])
+def test_matches_per_circuit_reference(installation):
+    table = random_table(300)
+    result = size_project(table, 380.0, solve(table, 380.0), installation)
+    assert len(result) == len(table) + 1
+    for i, load in enumerate(table):
+        current, breaker, section, drop = reference_sizing(load, 380.0, installation)
+        assert result.current[i] == pytest.approx(current)
+        assert result.breaker[i] == breaker
+        if math.isnan(section):
+            assert result.failed()[i]
+        else:
+            assert result.section[i] == section
+            assert result.drop[i] == pytest.approx(drop)
+            assert result.ampacity[i] >= result.breaker[i] >= result.current[i]
+
+def test_correction_factors():
+    assert correction_factor(Installation(ambient=40)) == pytest.approx(0.87)
+    assert correction_factor(Installation(ambient=32.5)) == pytest.approx(0.97) # Interpolado
+    assert correction_factor(Installation(grouping=10)) == pytest.approx(0.50)
+    assert correction_factor(Installation(grouping=50)) == pytest.approx(0.38)
+    assert correction_factor(Installation('D', ambient=20)) == pytest.approx(1.0) # Solo a 20 °C
+
+def test_feeder_and_harmonics():
+    linear_loads = [dict(SHOWER, name=f'PC {phase}', power=3000.0, phases=[phase, 'N']) for phase in 'ABC']
+    results = solve(linear_loads, 380.0)
+    linear = size_project(linear_loads, 380.0, results)
+    assert not linear.neutral_loaded
+    assert linear.current[-1] == pytest.approx(results['Ia'][0])
+
+    loads = [dict(load, spectrum='Fonte chaveada (monofásica)') for load in linear_loads]
+    harmonics = solve_harmonics(loads, 380.0)
+    result = size_project(loads, 380.0, results, harmonics=harmonics)
+    computed = size_project(loads, 380.0, results) # Harmônicas calculadas no próprio dimensionamento
+    assert np.array_equal(computed.section, result.section) and computed.neutral_loaded
+    rms = math.sqrt(sum(ratio ** 2 for ratio, _ in SPECTRA['Fonte chaveada (monofásica)'].values()))
+    assert result.current[0] == pytest.approx(linear.current[0] * rms)
+    # Triplas acima de 15 %: o neutro (maior que as fases) define o alimentador, com fator 0,86
+    assert result.neutral_loaded
+    assert result.current[-1] == pytest.approx(harmonics.rms()[3])
+    column = SECTIONS.index(result.section[-1])
+    assert result.ampacity[-1] == pytest.approx(AMPACITY[FEEDER.method][1][column] * 0.86)
+
+def test_beyond_tables():
+    load = dict(SHOWER, power=500_000.0, phases=['A', 'B', 'C'])
+    result = size_project([load], 380.0, solve([load], 380.0))
+    assert result.failed().tolist() == [True, True]
+    assert np.isnan(result.breaker).all()
+
+def test_lengths_and_source():
+    table = random_table(50, seed=1)
+    source = Source(232.0, 212.0, 222.0, 0.0, -123.0, 118.0)
+    results = solve(table, source)
+    result = size_project(table, source, results)
+    long = size_project(table, source, results, lengths=np.full(len(table), 200.0))
+    assert np.all(np.nan_to_num(long.section[:-1], nan=1e9) >= np.nan_to_num(result.section[:-1], nan=1e9))
+    assert long.drop[:-1][~long.failed()[:-1]].max() <= Installation().max_drop
+    # Mesmos circuitos como lista de dicts
+    dicts = size_project(list(table), source, results)
+    assert np.array_equal(dicts.section, result.section, equal_nan=True)
+
+def test_installation_validation():
+    assert check_installation(Installation()) is None
+    assert check_installation(FEEDER) is None
+    for bad in (Installation(method='X'), Installation(ambient=70), Installation(grouping=0),
+                Installation(length=-1), Installation(length=math.inf), Installation(max_drop=0), Installation(min_section=3)):
+        assert isinstance(check_installation(bad), str)
+        with pytest.raises(ValueError):
+            size_project([SHOWER], 220.0, solve([SHOWER], 220.0), bad)
+
+def test_length_column_import_and_project(tmp_path):
+    assert parse_load({'name': 'R', 'power': '300', 'phases': 'A N', 'length': '12,5'})['length'] == 12.5
+    assert 'length' not in parse_load({'name': 'R', 'power': '300', 'phases': 'A N', 'length': ''})
+    for bad in ('-3', 'inf', 'nan'):
+        assert isinstance(parse_load({'name': 'R', 'power': '300', 'phases': 'A N', 'length': bad}), str)
+
+    table = random_table(40, seed=2)
+    installation, feeder = Installation('C', 35, 3, 15, 3, 4), FEEDER._replace(length=80.0)
+    for path, write in ((tmp_path / 'p.phase', save_project), (tmp_path / 'p.json', export_json)):
+        write(path, Project(table, 380.0, installation=installation, feeder=feeder))
+        opened = open_project(path)
+        assert (opened.installation, opened.feeder) == (installation, feeder)
+        assert opened.loads.column('length').tolist() == table.column('length').tolist()
+
+    # Projeto anterior ao dimensionamento: instalação padrão e sem comprimentos próprios
+    columns = {name: table.column(name) for name in ('id', 'power', 'pf', 'conn', 'capacitive', 'name')}
+    old = LoadTable.from_columns(columns, table.names)
+    assert {load['length'] for load in old} == {0.0}
+    assert Project(old, 380.0).installation == Installation()
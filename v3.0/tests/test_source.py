@@ -0,0 +1,97 @@
+"""Fonte desequilibrada (core.Source).
+
+Com as três fases iguais os motores já são comparados com a referência em
+test_golden/test_equivalence (motor 'source'); aqui ficam as propriedades
+que só valem com desequilíbrio.
+"""
+import math
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from phase.cache import SolveCache
+from phase.core import Source, check_source, pack_loads, solve, solve_arrays
+from phase.incremental import LoadAccumulator
+from phase.profiles import LoadProfiles, solve_profiles
+
+# 2-4% de desequilíbrio, como medido em campo
+SOURCE = Source(232.0, 212.0, 222.0, 0.0, -123.0, 118.0)
+
+LOADS = [
+    {'name': 'Chuveiro', 'power': 5400.0, 'pf': 1.0, 'pf_type': 'Indutivo', 'phases': ['A', 'N']},
+    {'name': 'Geladeira', 'power': 350.0, 'pf': 0.8, 'pf_type': 'Indutivo', 'phases': ['B', 'N']},
+    {'name': 'Iluminação', 'power': 900.0, 'pf': 0.92, 'pf_type': 'Capacitivo', 'phases': ['C', 'N']},
+    {'name': 'Ar-condicionado', 'power': 2500.0, 'pf': 0.85, 'pf_type': 'Indutivo', 'phases': ['A', 'B']},
+    {'name': 'Forno', 'power': 3000.0, 'pf': 1.0, 'pf_type': 'Indutivo', 'phases': ['B', 'C']},
+    {'name': 'Inversor FV', 'power': -4000.0, 'pf': 0.98, 'pf_type': 'Capacitivo', 'phases': ['A', 'C']},
+    {'name': 'Motor', 'power': 7500.0, 'pf': 0.82, 'pf_type': 'Indutivo', 'phases': ['A', 'B', 'C']},
+]
+
+def source_power(source, ia, ib, ic):
+    # Potência entregue pela fonte: soma de V·conj(I) com o neutro como referência
+    van, vbn, vcn = source.phasors()[:3]
+    return van * ia.conjugate() + vbn * ib.conjugate() + vcn * ic.conjugate()
+
+def test_balanced_source_matches_line_voltage():
+    for line_voltage in (220.0, 380.0):
+        balanced = solve(LOADS, line_voltage)
+        unbalanced = solve(LOADS, Source.balanced(line_voltage))
+        for key in ('Ia', 'Ib', 'Ic', 'In'):
+            assert unbalanced[key][0] == pytest.approx(balanced[key][0], rel=1e-12)
+            assert unbalanced[key][1] == pytest.approx(balanced[key][1], abs=1e-9)
+
+def test_power_balance():
+    # A fonte entrega exatamente P + jQ das cargas, qualquer que seja a conexão
+    _, (ia, ib, ic), p, q = solve_arrays(*pack_loads(LOADS), SOURCE)
+    assert source_power(SOURCE, ia, ib, ic) == pytest.approx(complex(p, q), rel=1e-12)
+
+def test_three_phase_load_has_no_neutral_current():
+    loads = [load for load in LOADS if len(load['phases']) == 3 or 'N' not in load['phases']]
+    _, (ia, ib, ic), _, _ = solve_arrays(*pack_loads(loads), SOURCE)
+    assert abs(ia + ib + ic) < 1e-12 * max(abs(ia), abs(ib), abs(ic))
+
+def test_unbalance_shows_up_in_neutral():
+    # Três cargas resistivas iguais fase-neutro: In = 0 só com fonte equilibrada
+    loads = [dict(LOADS[0], phases=[phase, 'N']) for phase in 'ABC']
+    assert solve(loads, 380.0)['In'][0] < 1e-9
+    _, (ia, ib, ic), _, _ = solve_arrays(*pack_loads(loads), SOURCE)
+    van, vbn, vcn = SOURCE.phasors()[:3]
+    expected = -5400 * (1 / vbn.conjugate() + 1 / van.conjugate() + 1 / vcn.conjugate())
+    assert -(ia + ib + ic) == pytest.approx(expected, rel=1e-12)
+    assert abs(expected) > 0.5
+
+def test_rotation_follows_source():
+    # Girar todas as tensões gira todas as correntes pelo mesmo ângulo
+    rotated = SOURCE._replace(angle_a=SOURCE.angle_a + 40, angle_b=SOURCE.angle_b + 40, angle_c=SOURCE.angle_c + 40)
+    _, before, _, _ = solve_arrays(*pack_loads(LOADS), SOURCE)
+    _, after, _, _ = solve_arrays(*pack_loads(LOADS), rotated)
+    turn = complex(math.cos(math.radians(40)), math.sin(math.radians(40)))
+    assert np.allclose(np.array(after), np.array(before) * turn, rtol=1e-12, atol=1e-12)
+
+def test_paths_agree():
+    currents, (ia, ib, ic), p, q = solve_arrays(*pack_loads(LOADS), SOURCE)
+
+    accumulator = LoadAccumulator(380.0)
+    for key, load in enumerate(LOADS):
+        accumulator.add(key, load)
+    accumulator.set_voltage(SOURCE)
+    assert np.allclose(accumulator.totals()[:3], (ia, ib, ic), rtol=1e-12)
+    assert np.allclose(accumulator.currents(range(len(LOADS))), currents, rtol=1e-12)
+
+    cached, _ = SolveCache().solve(LOADS, SOURCE)
+    assert SolveCache.key(LOADS, SOURCE) != SolveCache.key(LOADS, SOURCE.line_voltage)
+    assert cached['Ia'][0] == pytest.approx(abs(ia), rel=1e-12)
+
+    loads = [dict(load, name=f'L{i}') for i, load in enumerate(LOADS)]
+    profiles = LoadProfiles([load['name'] for load in loads], np.array([[load['power'] for load in loads]]))
+    result = solve_profiles(loads, profiles, SOURCE)
+    assert result.ia[0] == pytest.approx(ia, rel=1e-12)
+    assert result.p[0] == pytest.approx(p)
+
+def test_unbalance_and_validation():
+    assert Source.balanced(380.0).unbalance() == pytest.approx(0.0, abs=1e-12)
+    assert 2.0 < SOURCE.unbalance() < 4.0
+    assert check_source(SOURCE) is None
+    assert check_source(Source(220.0, 0.0, 220.0)) is not None
+    assert check_source(Source(220.0, 220.0, 220.0, 0.0, 0.0, 120.0)) is not None
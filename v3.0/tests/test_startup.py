@@ -0,0 +1,55 @@
+"""Regressão do tempo de abertura da interface.
+
+Meta: importar phase.app em menos de STARTUP_BUDGET segundos, sem carregar
+Matplotlib nem NumPy (eles são importados em segundo plano depois que a janela
+aparece). Antes do carregamento tardio a importação levava ~0.9 s.
+"""
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+
+from conftest import SRC
+
+STARTUP_BUDGET = 0.25 # s
+WINDOW_BUDGET = 0.5 # s, até a janela com os formulários estar pronta
+
+def run_python(code):
+    out = subprocess.run([sys.executable, '-c', code], cwd=SRC, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+def test_app_import_skips_plotting_stack():
+    loaded = run_python(
+        'import json, sys\n'
+        'import phase.app\n'
+        'print(json.dumps(sorted(m for m in ("numpy", "matplotlib") if m in sys.modules)))'
+    )
+    assert loaded == []
+
+def test_app_import_time():
+    # Melhor de três, para não depender de cache frio do disco
+    times = [run_python(
+        'import json, time\n'
+        't = time.perf_counter()\n'
+        'import phase.app\n'
+        'print(json.dumps(time.perf_counter() - t))'
+    ) for _ in range(3)]
+    assert min(times) < STARTUP_BUDGET
+
+def test_window_time():
+    tk = pytest.importorskip('tkinter')
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip('sem display')
+    try:
+        from phase.app import PhasorCalcApp
+
+        t = time.perf_counter()
+        PhasorCalcApp(root)
+        root.update_idletasks()
+        assert time.perf_counter() - t < WINDOW_BUDGET
+    finally:
+        root.destroy()
@@ -0,0 +1,111 @@
+"""Worker do recálculo (phase.worker): gerações, descarte e coalescência."""
+import threading
+
+import pytest
+
+from phase.worker import SolveWorker
+
+def test_stale_results_are_discarded_and_pending_coalesced():
+    release = threading.Event()
+    started = threading.Event()
+    ran = []
+
+    def solve(job):
+        ran.append(job)
+        if job == 'primeiro':
+            started.set()
+            release.wait(5)
+        return job.upper()
+
+    worker = SolveWorker(solve)
+    worker.submit('primeiro')
+    assert started.wait(5)
+    # Enquanto o primeiro calcula, os pedidos seguintes substituem o pendente
+    for job in ('segundo', 'terceiro', 'quarto'):
+        generation = worker.submit(job)
+    assert generation == 4 and worker.busy()
+    assert worker.poll() is None
+    release.set()
+    assert worker.wait(5) == 'QUARTO'
+    assert ran == ['primeiro', 'quarto']
+    assert worker.discarded == 1 # O resultado do primeiro chegou já obsoleto
+    assert not worker.busy()
+
+def test_unconsumed_result_of_older_generation_is_dropped():
+    worker = SolveWorker(lambda job: job)
+    worker.submit(1)
+    with worker._condition:
+        worker._condition.wait_for(lambda: worker._done is not None, 5)
+    worker.generation += 1 # Pedido novo antes do consumo (como um submit em seguida)
+    assert worker.poll() is None
+    assert worker.discarded == 1
+
+def test_errors_are_raised_by_poll():
+    def solve(job):
+        if job < 0:
+            raise ValueError('Espectro harmônico desconhecido.')
+        return job
+
+    worker = SolveWorker(solve)
+    worker.submit(-1)
+    with pytest.raises(ValueError, match='Espectro'):
+        worker.wait(5)
+    worker.submit(2) # A thread continua atendendo depois de um erro
+    assert worker.wait(5) == 2
+
+def test_app_solve_job_runs_without_tk():
+    np = pytest.importorskip('numpy')
+    from types import SimpleNamespace
+
+    from phase.app import PhasorCalcApp
+    from phase.core import solve
+    from phase.sizing import FEEDER, Installation
+    from phase.table import LoadTable
+
+    table = LoadTable()
+    table.extend([
+        {'name': 'Chuveiro', 'power': 5500.0, 'pf': 1.0, 'pf_type': 'Indutivo', 'phases': ['A', 'N']},
+        {'name': 'LED', 'power': 900.0, 'pf': 0.95, 'pf_type': 'Indutivo', 'phases': ['B', 'N'], 'spectrum': 'Iluminação LED'},
+    ])
+    app = SimpleNamespace()
+    worker = SolveWorker(lambda job: PhasorCalcApp.solve_job(app, job))
+    worker.submit((table.copy(), 220.0, solve(table, 220.0), (Installation(), FEEDER), 0))
+    results, harmonics, sized, loads, _ = worker.wait(5)
+    assert results == solve(table, 220.0)
+    assert harmonics.rms()[3] > 0
+    assert len(sized) == len(loads) + 1 and not np.isnan(sized.section).any()
+
+def test_app_solve_job_without_table():
+    # Quadro linear e sem dimensionamento: a interface não copia a tabela
+    from types import SimpleNamespace
+
+    from phase.app import PhasorCalcApp
+
+    results = {'P_total': 1.0}
+    assert PhasorCalcApp.solve_job(SimpleNamespace(), (None, 220.0, results, None, 0)) == (results, None, None, None, 0)
+
+@pytest.mark.parametrize('failure', ['worker', 'show'])
+def test_app_poll_recovers_from_errors(monkeypatch, failure):
+    from types import SimpleNamespace
+
+    from phase import app as app_module
+    from phase.app import PhasorCalcApp
+
+    def solve(job):
+        if failure == 'worker':
+            raise RuntimeError('falha no worker')
+        return job
+
+    def show_solution(solution):
+        raise KeyError('falha ao exibir')
+
+    errors, hidden = [], []
+    monkeypatch.setattr(app_module.messagebox, 'showerror', lambda title, message: errors.append(message))
+    worker = SolveWorker(solve)
+    app = SimpleNamespace(solver=worker, _polling=True, show_solution=show_solution,
+                          hide_busy=lambda: hidden.append(True), root=SimpleNamespace(after=lambda *args: None))
+    worker.submit('job')
+    with worker._condition:
+        assert worker._condition.wait_for(lambda: worker._done is not None, 5) # Resultado pronto, ainda não consumido
+    PhasorCalcApp.poll_solution(app)
+    assert len(errors) == 1 and app._polling is False and hidden == [True]